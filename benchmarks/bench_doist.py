@@ -0,0 +1,58 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark Doist deed scheduling with deque deeds versus heaped deeds
+
+Mix of doers where most are sleepy (long tock) and a few are busy (tock 0.0)
+so that on most ticks only a small fraction of deeds is due.
+
+Usage:
+    python benchmarks/bench_doist.py
+"""
+import time
+
+from hio.base import doing
+
+
+def makeDoers(count, tock, busy=0.01, sleep=64):
+    """
+    Returns list of count doers. Fraction busy run every tick, the rest run
+    every sleep ticks.
+    """
+    doers = []
+    nbusy = max(1, int(count * busy))
+
+    for i in range(count):
+        @doing.doize(tock=0.0 if i < nbusy else tock * sleep)
+        def benchDo(tymth=None, tock=0.0, **opts):
+            yield
+            while True:
+                yield tock
+        doers.append(benchDo)
+    return doers
+
+
+def bench(count, ticks=200, heaped=False, tock=0.03125):
+    """
+    Returns seconds to run ticks iterations of Doist over count doers
+    """
+    doist = doing.Doist(tock=tock, heaped=heaped)
+    doist.doers = makeDoers(count, tock=tock)
+    doist.enter()
+    start = time.perf_counter()
+    for i in range(ticks):
+        doist.recur()
+    elapsed = time.perf_counter() - start
+    doist.exit()
+    return elapsed
+
+
+def main():
+    print("{:>8} {:>12} {:>12} {:>8}".format("deeds", "deque (s)", "heaped (s)", "ratio"))
+    for count, ticks in ((10, 10000), (1000, 1000), (100000, 100)):
+        dq = bench(count, ticks=ticks, heaped=False)
+        hp = bench(count, ticks=ticks, heaped=True)
+        print("{:>8} {:>12.4f} {:>12.4f} {:>8.2f}".format(count, dq, hp, dq / hp))
+
+
+if __name__ == "__main__":
+    main()
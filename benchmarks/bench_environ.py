@@ -0,0 +1,89 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark wsgi environs built per second by http.Server.buildEnviron from a
+per server template with cached HTTP_ keys and shared empty wsgi.input
+versus building the whole environ per request like buildEnviron did before.
+
+Usage:
+    python benchmarks/bench_environ.py
+"""
+import io
+import sys
+import time
+from urllib.parse import quote
+
+from hio.base import tyming
+from hio.core import http
+from hio.core.http import serving
+
+MSG = (b"GET /echo?name=fame HTTP/1.1\r\n" +
+       b"Host: localhost:8080\r\n" +
+       b"Accept: application/json\r\n" +
+       b"Accept-Encoding: gzip, deflate\r\n" +
+       b"User-Agent: bench/1.0\r\n" +
+       b"X-Request-Id: 1234\r\n" +
+       b"Content-Length: 0\r\n\r\n")
+
+
+class Remoter():
+    """
+    Stand in for tcp.Remoter of requestant with only .ca
+    """
+    ca = ("127.0.0.1", 50000)
+
+
+def legacy(server, requestant):
+    """
+    Returns environ built per request like buildEnviron before
+    """
+    environ = dict()
+    environ['wsgi.version'] = (1, 0)
+    environ['wsgi.url_scheme'] = server.scheme
+    environ['wsgi.input'] = io.BytesIO(requestant.body)
+    environ['wsgi.errors'] = sys.stderr
+    environ['wsgi.multithread'] = False
+    environ['wsgi.multiprocess'] = False
+    environ['wsgi.run_once'] = False
+    environ["wsgi.server_name"] = server.name
+    environ["wsgi.server_version"] = (1, 0)
+    environ['REQUEST_METHOD'] = requestant.method
+    environ['SERVER_NAME'] = server.servant.eha[0]
+    environ['SERVER_PORT'] = str(server.servant.eha[1])
+    environ['SERVER_PROTOCOL'] = "HTTP/{0}.{1}".format(*requestant.version)
+    environ['SCRIPT_NAME'] = u''
+    environ['PATH_INFO'] = quote(requestant.path)
+    environ['QUERY_STRING'] = requestant.query
+    environ['REMOTE_ADDR'] = requestant.remoter.ca
+    environ['CONTENT_TYPE'] = requestant.headers.get('content-type', '')
+    if requestant.length is not None:
+        environ['CONTENT_LENGTH'] = str(requestant.length)
+    for key, value in requestant.headers.items():
+        key = "HTTP_" + key.replace("-", "_").upper()
+        environ[key] = value
+    return environ
+
+
+def bench(build, server, requestant, count):
+    """
+    Returns environs per second built by build
+    """
+    start = time.perf_counter()
+    for i in range(count):
+        build(server, requestant)
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main(count=100000):
+    server = http.Server(port=6123, app=None, tymth=tyming.Tymist().tymen())
+    requestant = serving.Requestant(msg=bytearray(MSG), remoter=Remoter())
+    requestant.parse()
+    assert requestant.ended
+    old = bench(legacy, server, requestant, count)
+    new = bench(serving.Server.buildEnviron, server, requestant, count)
+    print("{:>12} {:>12} {:>8}".format("legacy/s", "template/s", "ratio"))
+    print("{:>12.1f} {:>12.1f} {:>8.2f}".format(old, new, new / old))
+
+
+if __name__ == "__main__":
+    main()
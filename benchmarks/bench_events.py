@@ -0,0 +1,92 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark server sent events parsed per second by httping.EventSource which
+resumes scanning at its offset, splits whole event blocks at once, and
+decodes once per event versus parsing per line with httping.parseLine and
+decoding per field like EventSource.parseEvents did before. Events arrive
+in network sized reads.
+
+Usage:
+    python benchmarks/bench_events.py
+"""
+import time
+from collections import deque
+
+from hio.core.http import httping
+
+CRLF = b"\r\n"
+LF = b"\n"
+CR = b"\r"
+
+
+def legacy(raw, events):
+    """
+    Generator of events parsed per line like EventSource.parseEvents before
+    """
+    parts = []
+    ename = u''
+    eid = None
+    lineParser = httping.parseLine(raw=raw, eols=(CRLF, LF, CR), kind="event line")
+    while True:
+        line = next(lineParser)
+        if line is None:
+            (yield None)
+            continue
+        if not line:
+            if parts:
+                events.append(dict([('id', eid), ('name', ename),
+                                    ('data', u'\n'.join(parts))]))
+            ename = u''
+            parts = []
+            continue
+        field, sep, value = line.partition(b':')
+        if sep and not field:
+            continue
+        field = field.decode('UTF-8')
+        if value and value[0:1] == b' ':
+            del value[0]
+        value = value.decode('UTF-8')
+        if field == u'event':
+            ename = value
+        elif field == u'data':
+            parts.append(value)
+        elif field == u'id':
+            eid = value
+
+
+def stream(count):
+    """
+    Returns bytes of count market data style events
+    """
+    return b"".join(b'id: %d\nevent: quote\ndata: {"symbol":"HIO","price":%d.25,'
+                    b'"size":100}\n\n' % (i, i % 1000) for i in range(count))
+
+
+def bench(make, data, read=4096):
+    """
+    Returns events per second parsed by parser from make(raw, events) as data
+    arrives in reads of read bytes
+    """
+    raw = bytearray()
+    events = deque()
+    parser = make(raw, events)
+    start = time.perf_counter()
+    for i in range(0, len(data), read):
+        raw.extend(data[i:i + read])
+        next(parser)
+    elapsed = time.perf_counter() - start
+    return len(events) / elapsed
+
+
+def main(count=100000):
+    data = stream(count)
+    old = bench(legacy, data)
+    new = bench(lambda raw, events: httping.EventSource(raw=raw,
+                                                        events=events).parseEvents(),
+                data)
+    print("{:>12} {:>12} {:>8}".format("by line/s", "by block/s", "ratio"))
+    print("{:>12.1f} {:>12.1f} {:>8.2f}".format(old, new, new / old))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark request headings parsed per second by the single pass
+httping.parseHeading versus per line parsing with httping.parseLine and
+httping.parseLeader, both for a request that arrives whole and one that
+arrives in fragments. Also reports full requests parsed per second by
+serving.Requestant which uses parseHeading.
+
+Usage:
+    python benchmarks/bench_heading.py
+"""
+import time
+
+from hio.core.http import httping, serving
+
+CRLF = b"\r\n"
+
+MSG = (b"GET /echo?name=fame HTTP/1.1\r\n" +
+       b"Host: localhost:8080\r\n" +
+       b"".join(b"X-Header-%02d: value of some header number %02d\r\n" % (i, i)
+                for i in range(40)) +
+       b"\r\n")
+
+
+def byLine(raw):
+    """
+    Generator of heading parsed per line like Requestant.parseHead before
+    """
+    lineParser = httping.parseLine(raw=raw, eols=(CRLF, b"\n"), kind="status line")
+    while (line := next(lineParser)) is None:
+        (yield None)
+    leaderParser = httping.parseLeader(raw=raw, eols=(CRLF, b"\n"))
+    while (headers := next(leaderParser)) is None:
+        (yield None)
+    (yield (line, headers))
+
+
+def byHeading(raw):
+    """
+    Generator of heading parsed by parseHeading
+    """
+    return httping.parseHeading(raw=raw)
+
+
+def bench(maker, count, size=None):
+    """
+    Returns headings per second parsed by generators from maker with .MSG
+    arriving in fragments of size bytes or whole when size is None
+    """
+    size = size or len(MSG)
+    frags = [MSG[i:i + size] for i in range(0, len(MSG), size)]
+    start = time.perf_counter()
+    for i in range(count):
+        raw = bytearray()
+        parser = maker(raw)
+        for frag in frags:
+            raw.extend(frag)
+            if next(parser) is not None:
+                break
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def benchRequestant(count):
+    """
+    Returns full requests per second parsed by Requestant
+    """
+    start = time.perf_counter()
+    for i in range(count):
+        requestant = serving.Requestant(msg=bytearray(MSG))
+        requestant.parse()
+        assert requestant.ended
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main(count=20000):
+    print("{:>10} {:>12} {:>12} {:>8}".format("arrival", "by line/s",
+                                              "heading/s", "ratio"))
+    for size in (None, 256, 64):
+        line = bench(byLine, count, size)
+        heading = bench(byHeading, count, size)
+        print("{:>10} {:>12.1f} {:>12.1f} {:>8.2f}".format(size or "whole",
+                                                     line, heading, heading / line))
+    print("Requestant requests/s: {:.1f}".format(benchRequestant(count)))
+
+
+if __name__ == "__main__":
+    main()
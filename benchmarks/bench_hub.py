@@ -0,0 +1,90 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark events fanned out per second to subscribers by eventing.EventHub
+which encodes each event and its chunk framing once and queues the same
+bytes on every subscriber's Reel versus formatting and chunk encoding the
+event per subscriber like each subscriber's generator did before.
+
+Usage:
+    python benchmarks/bench_hub.py
+"""
+import time
+
+from hio import help
+from hio.core.http import httping, eventing
+
+DATA = {"kind": "quote", "symbol": "HIO", "price": 42.5, "size": 100}
+
+
+class Incomer():
+    """
+    Stand in for tcp.Remoter with Reel transmit queue
+    """
+    ca = ("127.0.0.1", 50000)
+
+    def __init__(self):
+        self.txbs = help.Reel()
+
+    def tx(self, data):
+        self.txbs.extend(data)
+
+
+class Responder():
+    """
+    Stand in for headed chunked serving.Responder
+    """
+    headed = True
+    chunked = True
+    ended = False
+    closed = False
+    persisted = True
+
+    def __init__(self):
+        self.incomer = Incomer()
+
+
+def legacy(responders, eid):
+    """
+    Format and chunk encode event per subscriber like generators before
+    """
+    for responder in responders:
+        payload = httping.packEvent(DATA, eid=eid)
+        for part in httping.packChunkParts(payload):
+            responder.incomer.tx(part)
+
+
+def bench(subscribers, count):
+    """
+    Returns (legacy, hub) events per second fanned out to subscribers
+    """
+    responders = [Responder() for i in range(subscribers)]
+    start = time.perf_counter()
+    for i in range(count):
+        legacy(responders, i)
+        for responder in responders:
+            responder.incomer.txbs.clear()
+    old = count / (time.perf_counter() - start)
+
+    hub = eventing.EventHub(highwater=1 << 30)
+    for responder in responders:
+        hub.subscribe({'hio.responder': responder}, lambda s, h: None)
+    start = time.perf_counter()
+    for i in range(count):
+        hub.publish(DATA)
+        for responder in responders:
+            responder.incomer.txbs.clear()
+    new = count / (time.perf_counter() - start)
+    return (old, new)
+
+
+def main(count=200):
+    print("{:>12} {:>12} {:>12} {:>8}".format("subscribers", "legacy/s",
+                                              "hub/s", "ratio"))
+    for subscribers in (100, 1000, 5000):
+        old, new = bench(subscribers, count)
+        print("{:>12} {:>12.1f} {:>12.1f} {:>8.2f}".format(subscribers, old,
+                                                          new, new / old))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark full messages parsed per second by serving.Requestant and
+clienting.Respondent with the pure python parser backend versus the native
+httptools (llhttp) parser backend for headings with few and many headers.
+The native backend requires httptools, pip install hio[native].
+
+Usage:
+    python benchmarks/bench_parser.py
+"""
+import time
+
+from hio.core.http import httping, serving, clienting
+
+
+def request(count):
+    """
+    Returns request with count extra header lines and small body
+    """
+    return (b"POST /echo/path?name=fame&size=%d HTTP/1.1\r\n" % count +
+            b"Host: localhost:8080\r\n" +
+            b"Content-Type: application/json\r\n" +
+            b"".join(b"X-Header-%02d: value of some header number %02d\r\n" % (i, i)
+                     for i in range(count)) +
+            b"Content-Length: 13\r\n\r\n" +
+            b'{"name": "a"}')
+
+
+def response(count):
+    """
+    Returns response with count extra header lines and small body
+    """
+    return (b"HTTP/1.1 200 OK\r\n" +
+            b"Content-Type: application/json\r\n" +
+            b"".join(b"X-Header-%02d: value of some header number %02d\r\n" % (i, i)
+                     for i in range(count)) +
+            b"Content-Length: 13\r\n\r\n" +
+            b'{"name": "a"}')
+
+
+def bench(cls, msg, backend, count):
+    """
+    Returns messages per second parsed by cls instances with backend
+    """
+    backend = httping.selectBackend(backend)
+    start = time.perf_counter()
+    for i in range(count):
+        parsent = cls(msg=bytearray(msg), backend=backend)
+        parsent.parse()
+        assert parsent.ended and not parsent.errored
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main(count=20000):
+    if httping.httptools is None:
+        print("httptools not installed, native backend not available")
+        return
+    print("{:>12} {:>8} {:>12} {:>12} {:>8}".format("message", "headers",
+                                                   "python/s", "native/s", "ratio"))
+    for name, cls, maker in (("request", serving.Requestant, request),
+                             ("response", clienting.Respondent, response)):
+        for headers in (0, 10, 40):
+            msg = maker(headers)
+            python = bench(cls, msg, "python", count)
+            native = bench(cls, msg, "httptools", count)
+            print("{:>12} {:>8} {:>12.1f} {:>12.1f} {:>8.2f}".format(
+                name, headers, python, native, native / python))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark small request throughput on one persistent connection to WSGI
+http.Server when the client pipelines batches of requests and the server
+parses them ahead (pipelines > 0) versus parsing the next request only once
+the current response ended (pipelines=0).
+
+Usage:
+    python benchmarks/bench_pipeline.py
+"""
+import time
+
+from hio.base import tyming
+from hio.core import http, tcp
+
+
+def app(environ, start_response):
+    start_response('200 OK', [('Content-type', 'text/plain'),
+                              ('Content-length', '2')])
+    return [b"OK"]
+
+
+def bench(count, batch=16, pipelines=8, port=6122):
+    """
+    Returns requests per second of count requests sent in pipelined batches
+    """
+    tymist = tyming.Tymist()
+    request = (b"GET /ok HTTP/1.1\r\nHost: localhost\r\n"
+               b"Content-Length: 0\r\n\r\n")
+    with http.openServer(port=port, app=app, tymth=tymist.tymen(),
+                         pipelines=pipelines) as server, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", port)) as client:
+        while not (client.connected and client.ca in server.servant.ixes):
+            client.serviceConnect()
+            server.serviceConnects()
+
+        start = time.perf_counter()
+        done = 0
+        while done < count:
+            client.tx(request * batch)
+            responses = 0
+            while responses < batch:
+                client.serviceSends()
+                server.service()
+                client.serviceReceives()
+                responses += client.rxbs.count(b"\r\n\r\nOK")
+                del client.rxbs[:client.rxbs.rfind(b"\r\n\r\nOK") + 6 if responses else 0]
+            done += batch
+        elapsed = time.perf_counter() - start
+
+    return done / elapsed
+
+
+def main(count=8000):
+    serial = bench(count, pipelines=0)
+    piped = bench(count, pipelines=16)
+    print("{:>12} {:>12} {:>8}".format("serial/s", "pipelined/s", "ratio"))
+    print("{:>12.1f} {:>12.1f} {:>8.2f}".format(serial, piped, piped / serial))
+
+
+if __name__ == "__main__":
+    main()
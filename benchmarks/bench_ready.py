@@ -0,0 +1,85 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark per pass service time of http.Server with many idle keep-alive
+connections plus a small active set. A polled and wheeled server only
+services connections that received or have pending work so its per pass
+cost stays flat as idle connections grow while a plain server visits
+every connection on every pass.
+
+50k idle connections need a file descriptor limit above 100k since both
+ends are in this process. Counts above the limit are skipped.
+
+Usage:
+    python benchmarks/bench_ready.py
+"""
+import resource
+import socket
+import time
+
+from hio.base import tyming
+from hio.core import http
+
+REQUEST = b"GET /ok HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+
+def app(environ, start_response):
+    start_response('200 OK', [('Content-type', 'text/plain'),
+                              ('Content-length', '2')])
+    return [b"OK"]
+
+
+def bench(idles, actives=4, passes=200, port=6124, **opts):
+    """
+    Returns mean seconds per server pass with idles idle connections while
+    actives connections each send one request per pass
+    """
+    tymist = tyming.Tymist()
+    with http.openServer(port=port, app=app, tymth=tymist.tymen(),
+                         tymeout=0.0, keeptymeout=0.0, headtymeout=0.0,
+                         **opts) as server:
+        socks = []
+        for i in range(idles + actives):
+            sock = socket.create_connection(("127.0.0.1", port))
+            sock.setblocking(False)
+            socks.append(sock)
+            if i % 64 == 0:
+                server.service()
+        while len(server.servant.ixes) < len(socks):
+            server.service()
+        server.service()  # make requestants of new connections
+
+        active = socks[:actives]
+        elapsed = 0.0
+        for i in range(passes):
+            for sock in active:
+                sock.send(REQUEST)
+            start = time.perf_counter()
+            server.service()
+            elapsed += time.perf_counter() - start
+            for sock in active:
+                try:
+                    sock.recv(65536)
+                except BlockingIOError:
+                    pass
+
+        for sock in socks:
+            sock.close()
+    return elapsed / passes
+
+
+def main(counts=(0, 1000, 5000, 50000)):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    print("{:>8} {:>14} {:>14}".format("idle", "plain us/pass", "ready us/pass"))
+    for count in counts:
+        if 2 * count + 64 > hard:
+            print("{:>8} skipped, needs file descriptor limit of {}".format(
+                                                        count, 2 * count + 64))
+            continue
+        plain = bench(count)
+        ready = bench(count, polled=True, wheeled=True)
+        print("{:>8} {:>14.1f} {:>14.1f}".format(count, plain * 1e6, ready * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark response heads built per second by serving.Responder.build with
+the cached Date header and pre-encoded Server header versus building them
+per response like Responder.build did before. Also reports heads built when
+the app provides pre-encoded header bytes and by CustomResponder.build.
+
+Usage:
+    python benchmarks/bench_responder.py
+"""
+import datetime
+import time
+
+from hio import help
+from hio.core.http import httping, serving
+
+CRLF = b"\r\n"
+
+HEADERS = [('Content-Type', 'text/plain'),
+           ('Content-Length', '2'),
+           ('Cache-Control', 'no-cache')]
+
+RAWS = [(b'Content-Type', b'text/plain'),
+        (b'Content-Length', b'2'),
+        (b'Cache-Control', b'no-cache')]
+
+
+def legacy(responder):
+    """
+    Returns head built per response like Responder.build before
+    """
+    lines = []
+    startLine = "{0} {1}".format(responder.HttpVersionString, responder.status)
+    lines.append(startLine.encode('ascii'))
+    responder.headers.update(getattr(responder.iterator, '_headers', help.Hict()))
+    if u'server' not in responder.headers:
+        responder.headers[u'server'] = "Ioflo WSGI Server"
+    if u'date' not in responder.headers:
+        responder.headers[u'date'] = httping.httpDate1123(
+            datetime.datetime.now(datetime.timezone.utc))
+    for name, value in responder.headers.items():
+        name = name.encode('ascii').title()
+        lines.append(name + b': ' + value.encode('iso-8859-1'))
+    lines.extend((b"", b""))
+    return CRLF.join(lines)
+
+
+def bench(build, count, headers=HEADERS):
+    """
+    Returns heads per second built by build of responder started with headers
+    """
+    responder = serving.Responder(incomer=None, app=None, environ=dict())
+    start = time.perf_counter()
+    for i in range(count):
+        responder.reset(environ=dict())
+        responder.start('200 OK', headers)
+        build(responder)
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def benchCustom(count):
+    """
+    Returns responses per second built by CustomResponder.build
+    """
+    responder = serving.CustomResponder()
+    start = time.perf_counter()
+    for i in range(count):
+        responder.build(status=200, headers=dict(HEADERS[2:]), body=b"OK")
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main(count=50000):
+    old = bench(legacy, count)
+    new = bench(serving.Responder.build, count)
+    raw = bench(serving.Responder.build, count, headers=RAWS)
+    print("{:>12} {:>12} {:>12} {:>8}".format("legacy/s", "build/s",
+                                              "raw build/s", "ratio"))
+    print("{:>12.1f} {:>12.1f} {:>12.1f} {:>8.2f}".format(old, new, raw, new / old))
+    print("CustomResponder builds/s: {:.1f}".format(benchCustom(count)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark routes resolved per second by http.Router with its static path
+dict and segment trie versus a linear scan of compiled path regexes like
+Steward subclasses dispatch by hand. Also reports full BareServer style
+dispatch of parsed requests through Steward.dispatch.
+
+Usage:
+    python benchmarks/bench_router.py
+"""
+import re
+import time
+
+from hio.core import http
+from hio.core.http import serving
+
+PATHS = (["/api/v1/resource{0}".format(i) for i in range(50)] +
+         ["/api/v1/resource{0}/{{rid}}".format(i) for i in range(50)] +
+         ["/api/v1/resource{0}/{{rid}}/items/{{iid}}".format(i) for i in range(50)])
+
+LOOKUPS = ["/api/v1/resource7", "/api/v1/resource42",
+           "/api/v1/resource21/abc", "/api/v1/resource49/xyz",
+           "/api/v1/resource3/abc/items/9", "/api/v1/resource48/abc/items/9"]
+
+
+def handler(requestant, params):
+    return b"OK"
+
+
+class Remoter():
+    """
+    Stand in for tcp.Remoter of steward that drops sent bytes
+    """
+    ca = ("127.0.0.1", 50000)
+    rxbs = bytearray()
+
+    def tx(self, msg):
+        pass
+
+    def refresh(self):
+        pass
+
+
+def legacy(routes):
+    """
+    Returns resolve function that scans regexes compiled from routes in order
+    """
+    table = []
+    for path in routes:
+        pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path)
+        table.append((re.compile("^" + pattern + "$"), {"GET": handler}))
+
+    def resolve(method, path):
+        for regex, handlers in table:
+            match = regex.match(path)
+            if match:
+                return (handlers[method], match.groupdict())
+        raise http.HTTPError(404)
+    return resolve
+
+
+def bench(resolve, count):
+    """
+    Returns routes per second resolved by resolve
+    """
+    start = time.perf_counter()
+    for i in range(count):
+        for path in LOOKUPS:
+            resolve("GET", path)
+    elapsed = time.perf_counter() - start
+    return count * len(LOOKUPS) / elapsed
+
+
+def benchSteward(router, count):
+    """
+    Returns requests per second dispatched by Steward with router
+    """
+    msg = b"GET /api/v1/resource21/abc HTTP/1.1\r\nHost: localhost\r\n\r\n"
+    steward = serving.Steward(remoter=Remoter(), router=router)
+    steward.requestant = serving.Requestant(msg=bytearray(msg))
+    steward.requestant.parse()
+    start = time.perf_counter()
+    for i in range(count):
+        steward.dispatch()
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main(count=20000):
+    router = http.Router(routes=[(path, handler, ("GET", )) for path in PATHS])
+    old = bench(legacy(PATHS), count)
+    new = bench(router.resolve, count)
+    print("{:>12} {:>12} {:>8}".format("regex/s", "router/s", "ratio"))
+    print("{:>12.1f} {:>12.1f} {:>8.2f}".format(old, new, new / old))
+    print("Steward dispatches/s: {:.1f}".format(benchSteward(router, count)))
+
+
+if __name__ == "__main__":
+    main()
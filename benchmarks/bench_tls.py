@@ -0,0 +1,90 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark accepted TLS handshakes per second of ServerTls when every
+RemoterTls shares the server's SSLContext versus rebuilding a context with
+certs and key loaded from disk per accepted connection.
+
+Uses the test certs in tests/core/tcp/certs.
+
+Usage:
+    python benchmarks/bench_tls.py
+"""
+import os
+import ssl
+import time
+
+from hio.base import tyming
+from hio.core.tcp import serving
+from hio.core import tcp
+
+certDirPath = os.path.join(os.path.dirname(os.path.dirname(
+                os.path.abspath(__file__))), 'tests', 'core', 'tcp', 'certs')
+
+serverKeyPath = os.path.join(certDirPath, 'server_key.pem')
+serverCertPath = os.path.join(certDirPath, 'server_cert.pem')
+clientCaPath = os.path.join(certDirPath, 'client.pem')
+clientKeyPath = os.path.join(certDirPath, 'client_key.pem')
+clientCertPath = os.path.join(certDirPath, 'client_cert.pem')
+serverCaPath = os.path.join(certDirPath, 'server.pem')
+
+
+class RebuildServerTls(tcp.ServerTls):
+    """
+    ServerTls whose remoters each rebuild a context with certs and key loaded
+    from disk per accepted connection like before the context was shared
+    """
+    def serviceAxes(self):
+        self.serviceAccepts()
+        while self.axes:
+            cs, ca = self.axes.popleft()
+            self.cxes[ca] = serving.RemoterTls(tymth=self.tymth,
+                                               ha=cs.getsockname(),
+                                               ca=ca,
+                                               bs=self.bs,
+                                               cs=cs,
+                                               timeout=self.tymeout,
+                                               version=self.version,
+                                               certify=self.certify,
+                                               keypath=self.keypath,
+                                               certpath=self.certpath,
+                                               cafilepath=self.cafilepath)
+
+
+def bench(count, shared=True, port=6121):
+    """
+    Returns handshakes per second of count sequential client connections
+    """
+    tymist = tyming.Tymist()
+    cls = tcp.ServerTls if shared else RebuildServerTls
+    with tcp.openServer(cls=cls, tymth=tymist.tymen(), ha=("", port),
+                        keypath=serverKeyPath, certpath=serverCertPath,
+                        cafilepath=clientCaPath, certify=ssl.CERT_REQUIRED) as server:
+        with tcp.openClient(cls=tcp.ClientTls, tymth=tymist.tymen(),
+                            ha=("127.0.0.1", port), keypath=clientKeyPath,
+                            certpath=clientCertPath, cafilepath=serverCaPath,
+                            certedhost="localhost", certify=ssl.CERT_REQUIRED,
+                            hostify=True) as client:
+            context = client.context  # client context shared across reconnects
+        start = time.perf_counter()
+        for i in range(count):
+            with tcp.openClient(cls=tcp.ClientTls, tymth=tymist.tymen(),
+                                ha=("127.0.0.1", port), context=context,
+                                certedhost="localhost") as client:
+                while not (client.connected and client.ca in server.ixes):
+                    client.serviceConnect()
+                    server.serviceConnects()
+                server.removeIx(client.ca)
+        elapsed = time.perf_counter() - start
+
+    return count / elapsed
+
+
+def main(count=200):
+    rebuilt = bench(count, shared=False)
+    shared = bench(count, shared=True)
+    print("{:>12} {:>12} {:>8}".format("rebuilt/s", "shared/s", "ratio"))
+    print("{:>12.1f} {:>12.1f} {:>8.2f}".format(rebuilt, shared, shared / rebuilt))
+
+
+if __name__ == "__main__":
+    main()
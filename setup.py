@@ -100,6 +100,7 @@ setup(
         # eg:
         #   'rst': ['docutils>=0.11'],
         #   ':python_version=="2.6"': ['argparse'],
+        'native': ['httptools>=0.6.0'],  # native http parser backend
     },
     tests_require=[
                     'coverage>=7.4.4',
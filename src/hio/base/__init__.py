@@ -3,6 +3,7 @@
 hio.base Package
 """
 
-from .tyming import Tymist, Tymee, Tymer
+from .tyming import Tymist, Tymee, Tymer, Wheel
 from .doing import Doist, doize, doify, Doer, DoDoer
 from .filing import openFiler, Filer, FilerDoer
+from .supervising import Supervisor
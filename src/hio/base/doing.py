@@ -3,8 +3,12 @@
 hio.core.doing Module
 """
 import time
+import selectors
 import types
 import inspect
+import math
+import heapq
+import itertools
 from inspect import isgeneratorfunction
 from collections import deque, namedtuple
 
@@ -16,6 +20,89 @@ from ..help import timing, helping
 
 Deed = namedtuple("Deed", "dog retyme doer")
 
+
+class Selector(selectors.DefaultSelector):
+    """
+    Selector is selectors.DefaultSelector (epoll on linux) that reopens in
+    place once closed so IO instances given it keep a valid reference.
+    Doist closes its .selector when .do is done to release the fd.
+
+    Properties:
+        closed (bool): True when closed and not yet reopened
+
+    Methods:
+        reopen() reopens when closed
+    """
+
+    @property
+    def closed(self):
+        """
+        Returns True when closed
+        """
+        return self.get_map() is None
+
+
+    def reopen(self):
+        """
+        Reopen when closed. Prior registrations were dropped by close.
+        """
+        if self.closed:
+            super(Selector, self).__init__()
+
+
+    def register(self, fileobj, events, data=None):
+        """
+        Register fileobj reopening first when closed. See BaseSelector.register
+        """
+        self.reopen()
+        return super(Selector, self).register(fileobj, events, data)
+
+
+def dueRetyme(retyme, doer):
+    """
+    Returns retyme of deed of doer with retyme adjusted when doer is DoDoer to
+    its first run at or after the earliest pending retyme of its own nested
+    deeds. Returns None for always DoDoer without deeds since it idles until
+    extended by some other dog.
+    """
+    if isinstance(doer, DoDoer):
+        nested = doer.earliest()
+        if nested is None:
+            if doer.always:  # idles until extended so never due itself
+                return None
+        elif nested > retyme:  # runs of doer before nested are idle
+            if doer.tock > 0.0:  # first cumulative retyme at or after nested
+                retyme += math.ceil((nested - retyme) / doer.tock - 1e-9) * doer.tock
+            else:
+                retyme = nested
+    return retyme
+
+
+def earliestHeap(deeds):
+    """
+    Returns earliest pending retyme of min-heap deeds of quadruples
+    (retyme, order, dog, doer) or None when no deeds.
+    Searches the heap best first from its head and only visits deeds whose
+    raw retyme is before the earliest due retyme found so far since the raw
+    retyme of a deed bounds the raw and due retymes of all deeds below it.
+    When the head is not an idle DoDoer this is O(1). A DoDoer reports its own
+    heap head the same way when heaped so nested deeds are not walked.
+    """
+    earliest = None
+    frontier = [(deeds[0][0], 0)] if deeds else []  # (raw retyme, heap index)
+    while frontier:
+        retyme, index = heapq.heappop(frontier)
+        if earliest is not None and retyme >= earliest:
+            break  # no deed below is earlier
+        due = dueRetyme(retyme, deeds[index][3])
+        if due is not None and (earliest is None or due < earliest):
+            earliest = due
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < len(deeds):
+                heapq.heappush(frontier, (deeds[child][0], child))
+    return earliest
+
+
 class Doist(tyming.Tymist):
     """
     Doist is the root coroutine scheduler
@@ -35,11 +122,42 @@ class Doist(tyming.Tymist):
     .do method repeatedly runs .recur until generators are complete
        it may either repeat as fast as possbile or repeat at real time increments.
 
+    When .heaped the deeds are kept in a min-heap (list) of quadruples
+        (retyme, order, dog, doer) keyed on retyme instead of a deque of triples.
+        Each .recur then only touches the deeds that are due instead of every
+        deed. order is the monotonically increasing enter order of the deed which
+        breaks retyme ties so that deeds due at the same tyme run in the same
+        round robin order as the deque. Use when there are many doers with
+        slow tocks.
+
+    When .warp and not .real then .do fast forwards .tyme in whole .tock
+        increments to the first tick at or after the earliest pending retyme of
+        its deeds including the deeds of nested DoDoers. This skips ticks when
+        no deed is due without changing the tyme any doer sees when it runs.
+        Use for discrete event simulation of long running scenarios.
+
+    When .selecting then .selector is a selectors.DefaultSelector (epoll on
+        linux) that IO instances such as tcp.Server, tcp.Client, udp.Peer and
+        serial.Driver register the read readiness of their sockets or fds with
+        by passing selector=doist.selector. When .real and some fd is registered
+        .do blocks until the first tick at or after the earliest pending retyme
+        or until some fd is ready instead of sleeping out each .tock.
+        When woken by readiness the next .recur runs immediately. This may be up
+        to one .tock ahead of real time but never more.
+        .do closes .selector when done to release its fd and reopens the same
+        .selector in place when run again so IO instances keep their reference.
+
     Inherited Class Attributes:
         .Tock is default .tock
 
     Attributes:
         real (boolean): True means run in real time, Otherwise as fast as possible.
+        heaped (boolean): True means schedule deeds with min-heap keyed on retyme
+                          False means schedule deeds with round robin deque
+        warp (boolean): True means when not real fast forward .tyme to earliest
+                        pending retyme. False means advance one .tock per .recur
+        selector (Selector | None): for IO read readiness when .real.
+                        None means not selecting
         limit (float):  maximum run tyme limit then closes all doers
         done (boolean): True means completed due to limit or all deeds completed
                 False is forced complete due to error
@@ -54,6 +172,8 @@ class Doist(tyming.Tymist):
             Used throughout the execution lifecycle. The normal
             case is use the default empty initialization performed here and
             update in .enter().
+            When .heaped deeds is list min-heap of quadruples of form
+            (retyme, order, dog, doer) instead.
         timer (MonoTimer): for real time intervals
 
     Inherited Properties:
@@ -70,9 +190,17 @@ class Doist(tyming.Tymist):
         .recur  run through all deeds once
         .do repeadedly call .recur until all dogs in deeds are complete or
             times out do to reaching time limit
+        .earliest returns earliest pending retyme of deeds including nested deeds
+        .leap fast forward .tyme to earliest pending retyme
+        .wait block in real time until next due tick or read readiness
+
+    Hidden:
+        ._orders is itertools.count iterator of enter orders for heaped deeds
+        ._dues is list of due heaped deeds popped but not yet run by .recur
 
     """
-    def __init__(self, real=False, limit=None, doers=None, **kwa):
+    def __init__(self, real=False, limit=None, doers=None, heaped=False,
+                 warp=False, selecting=False, **kwa):
         """
         Returns:
             instance
@@ -89,15 +217,28 @@ class Doist(tyming.Tymist):
                 The .doers attribute is used throughout the execution lifecycle.
                 Parameterization elsewhere of doers enables some special cases.
                 The normal case is to initialize here or in .do().
+            heaped (boolean): True means schedule deeds with min-heap keyed on
+                retyme so each .recur only touches due deeds.
+                False means schedule deeds with round robin deque
+            warp (boolean): True means when not real fast forward .tyme to the
+                earliest pending retyme instead of one .tock per .recur.
+            selecting (boolean): True means create .selector for IO instances
+                to register read readiness with so real time .do may block
+                until readiness. False means .selector is None
         """
         super(Doist, self).__init__(**kwa)
 
         self.real = True if real else False
+        self.heaped = True if heaped else False
+        self.warp = True if warp else False
+        self.selector = Selector() if selecting else None
         self.limit = abs(float(limit)) if limit is not None else None
         self.done = None
         self.doers = list(doers) if doers is not None else []  # list of Doers
-        self.deeds = deque()  # deque of deeds
+        self.deeds = [] if self.heaped else deque()  # heap or deque of deeds
         self.timer = timing.MonoTimer(duration = self.tock)
+        self._orders = itertools.count()  # enter order of heaped deeds
+        self._dues = []  # due heaped deeds popped but not yet run
 
 
     def do(self, doers=None, limit=None, tyme=None):
@@ -137,7 +278,7 @@ class Doist(tyming.Tymist):
         self.done = False
         if doers is not None:
             self.doers = list(doers)
-            self.deeds = deque()
+            self.deeds = [] if self.heaped else deque()
 
         if limit is not None:  # time limt for running if any. useful in test
             self.limit = abs(float(limit))
@@ -145,6 +286,9 @@ class Doist(tyming.Tymist):
         if tyme is not None:  # re-initialize starting tyme
             self.tyme = tyme
 
+        if self.selector is not None:  # closed by prior .do if any
+            self.selector.reopen()
+
         try:  # always clean up resources upon exception
             self.enter()  # runs enter context on each doer
 
@@ -156,9 +300,12 @@ class Doist(tyming.Tymist):
                     self.recur()  # increments .tyme runs recur context
 
                     if self.real:  # wait for real time to expire
-                        while not self.timer.expired:
-                            time.sleep(max(0.0, self.timer.remaining))
-                        self.timer.restart()  #  no time lost
+                        if self.selector and self.selector.get_map():
+                            self.wait()  # or until some fd is ready
+                        else:
+                            while not self.timer.expired:
+                                time.sleep(max(0.0, self.timer.remaining))
+                            self.timer.restart()  #  no time lost
 
                     if not self.deeds:  # no deeds
                         self.done = True
@@ -167,6 +314,9 @@ class Doist(tyming.Tymist):
                     if self.limit and tymer.expired:  # reached time limit
                         break  # break out of forever loop
 
+                    if self.warp and not self.real:  # skip ticks when none due
+                        self.leap(limit=tymer.remaining if self.limit else None)
+
                 except KeyboardInterrupt:  # use CNTL-C to shutdown from shell
                     break
 
@@ -178,6 +328,8 @@ class Doist(tyming.Tymist):
 
         finally: # finally clause always runs regardless of exception or not.
             self.exit()  # force close remaining deeds throws GeneratorExit
+            if self.selector is not None:  # release its fd such as epoll
+                self.selector.close()
 
 
     def enter(self, doers=None):
@@ -215,8 +367,8 @@ class Doist(tyming.Tymist):
         if doers is None:
             doers = self.doers
             deeds = self.deeds
-        else:
-            deeds = deque()  # when doers is provided then don't use .deeds
+        else:  # when doers is provided then don't use .deeds
+            deeds = [] if self.heaped else deque()
 
         for doer in doers:
             try:
@@ -234,7 +386,10 @@ class Doist(tyming.Tymist):
                 except AttributeError:
                     doer.__func__.done = ex.value if ex.value else False  # assign done state
                 continue  # don't append
-            deeds.append((dog, self.tyme, doer))
+            if self.heaped:  # order breaks retyme ties in enter order
+                heapq.heappush(deeds, (self.tyme, next(self._orders), dog, doer))
+            else:
+                deeds.append((dog, self.tyme, doer))
         return deeds
 
 
@@ -264,6 +419,11 @@ class Doist(tyming.Tymist):
         if deeds is None:
             deeds = self.deeds
 
+        if self.heaped:
+            self.recurHeap(deeds=deeds)
+            self.tick()  # advance .tyme by one doist .tock
+            return
+
         deeds.append((None, None, None))  # append run through once marker
         while deeds: # do while uses explicit break to exit while
             dog, retyme, doer = deeds.popleft()  # pop it off
@@ -290,6 +450,147 @@ class Doist(tyming.Tymist):
         self.tick()  # advance .tyme by one doist .tock
 
 
+    def recurHeap(self, deeds=None):
+        """
+        Recur once through the due deeds of heaped deeds, a min-heap list of
+        quadruples of form (retyme, order, dog, doer), and update in place.
+        Does not advance .tyme. See .recur.
+
+        Pops only the deeds whose retyme is due then runs them in enter order
+        (order) so deeds due at the same tyme run in the same round robin order
+        as with a deque. Pushes each still running deed back with its new retyme.
+        The due deeds are popped before any are run so each runs at most once
+        per invocation even when its new retyme is still due.
+
+        Parameters:
+            deeds (list):  min-heap of quadruples (retyme, order, dog, doer).
+                If not provided uses .deeds.
+        """
+        if deeds is None:
+            deeds = self.deeds
+
+        dues = []
+        while deeds and deeds[0][0] <= self.tyme:  # pop all due deeds
+            dues.append(heapq.heappop(deeds))
+        dues.sort(key=lambda deed: deed[1])  # run in enter order
+        self._dues = dues  # so .remove may drop due deeds not yet run
+
+        for i in range(len(dues)):
+            deed = dues[i]
+            if deed is None:  # removed by .remove while running other dogs
+                continue
+            dues[i] = None  # running so no longer pending
+            retyme, order, dog, doer = deed
+            try:  # send tyme. yield tock, tock may change during sended run
+                tock = dog.send(self.tyme)  # yielded tock == 0.0 means re-run asap
+            except StopIteration as ex:  # returned instead of yielded
+                try:
+                    doer.done = ex.value if ex.value else False  # assign done state
+                except AttributeError:   # when using bound method for generator function
+                    doer.__func__.done = ex.value if ex.value else False  # assign done state
+            else:  # repush for next pass
+                if not tock:  # tock is None or tock == 0.0 with empty yield tock == None
+                    retyme = self.tyme + self.tock  # rerun at next recur
+                else:
+                    retyme += tock  # cumulative retyme of doer tock
+                heapq.heappush(deeds, (retyme, order, dog, doer))
+
+        self._dues = []
+
+
+    def earliest(self, deeds=None):
+        """
+        Returns earliest pending retyme of deeds or None when no deeds.
+        The retyme of a DoDoer deed is its first run at or after the earliest
+        pending retyme of its own nested deeds so that skipping to it does not
+        skip any nested dog. An always DoDoer without deeds is skipped since it
+        idles until extended by some other dog.
+        When .heaped searches from heap head without walking every deed.
+        See earliestHeap.
+
+        Parameters:
+            deeds (deque): tuples of form (dog, retyme, doer) or when .heaped
+                list of quadruples (retyme, order, dog, doer).
+                If not provided uses .deeds.
+        """
+        if deeds is None:
+            deeds = self.deeds
+
+        if self.heaped:
+            return earliestHeap(deeds)
+
+        earliest = None
+        for dog, retyme, doer in deeds:
+            if not dog:  # marker deed
+                continue
+            retyme = dueRetyme(retyme, doer)
+            if retyme is not None and (earliest is None or retyme < earliest):
+                earliest = retyme
+
+        return earliest
+
+
+    def leap(self, limit=None):
+        """
+        Fast forward .tyme in whole .tock increments to the first tick at or
+        after the earliest pending retyme of .deeds.
+        Returns number of ticks skipped.
+
+        Parameters:
+            limit (float): remaining tyme in seconds until run tyme limit.
+                None means no limit. Skips at most to the last tick before
+                limit so no dog runs at a tyme it would not have otherwise.
+        """
+        earliest = self.earliest()
+        if earliest is None or earliest <= self.tyme or self.tock <= 0.0:
+            return 0
+
+        ticks = math.ceil((earliest - self.tyme) / self.tock - 1e-9)
+        if limit is not None:
+            ticks = min(ticks, math.ceil(limit / self.tock - 1e-9) - 1)
+        if ticks > 0:
+            self.tick(tock=ticks * self.tock)
+        return ticks
+
+
+    def wait(self):
+        """
+        Block in real time on .selector until the first tick at or after the
+        earliest pending retyme of .deeds or until some registered fd is ready
+        to read whichever comes first. Advances .tyme over the skipped ticks
+        when none are due so .tyme keeps pace with real time. Restarts .timer
+        for the next .recur.
+
+        Returns list of (key, events) of ready fds from .selector.select
+        where key.data is the registered IO instance.
+
+        When woken by readiness before the .timer expires then the next .recur
+        runs at most one .tock ahead of real time. If already ahead from
+        earlier readiness then first sleeps until back within one .tock.
+        """
+        skip = 0  # whole ticks after next tick until earliest pending retyme
+        earliest = self.earliest()
+        if earliest is not None and earliest > self.tyme and self.tock > 0.0:
+            skip = math.ceil((earliest - self.tyme) / self.tock - 1e-9)
+
+        ahead = self.timer.remaining - self.tock
+        if ahead > 0.0:  # already ran ahead due to readiness so catch up
+            time.sleep(ahead)
+
+        readies = []
+        timeout = self.timer.remaining + skip * self.tock
+        if timeout > 0.0:
+            readies = self.selector.select(timeout=timeout)
+
+        while skip > 0 and self.timer.remaining <= -self.tock:  # skipped tick
+            self.tick()
+            self.timer.restart()
+            skip -= 1
+
+        self.timer.restart()  # no time lost
+        return readies
+
+
     def exit(self, deeds=None):
         """
         Force exit each still opened deed calling .close on the dog generator
@@ -317,6 +618,10 @@ class Doist(tyming.Tymist):
         if deeds is None:
             deeds = self.deeds
 
+        if self.heaped:  # reverse enter order is reverse order of deque
+            deeds.sort(key=lambda deed: deed[1])
+            deeds[:] = [(dog, retyme, doer) for retyme, order, dog, doer in deeds]
+
         while(deeds):  # .close each remaining dog in deeds in reverse order
             dog, retime, doer = deeds.pop()  # pop it off in reverse (right side)
             if not dog:  # marker deed
@@ -344,7 +649,11 @@ class Doist(tyming.Tymist):
         doers = [doer for doer in doers if doer not in self.doers] # ensure unique
         deeds = self.enter(doers=doers)  # provide fresh deeds for new doers
         self.doers.extend(doers)
-        self.deeds.extend(deeds)
+        if self.heaped:
+            for deed in deeds:
+                heapq.heappush(self.deeds, deed)
+        else:
+            self.deeds.extend(deeds)
 
 
     def remove(self, doers):
@@ -357,6 +666,21 @@ class Doist(tyming.Tymist):
 
         """
         rdoers = [doer for doer in doers if doer in self.doers] # ensure in .doers
+        if self.heaped:  # drop from heap and from pending due deeds in .recurHeap
+            rdeeds = [deed for deed in self.deeds if deed[3] in rdoers]
+            self.deeds[:] = [deed for deed in self.deeds if deed[3] not in rdoers]
+            heapq.heapify(self.deeds)
+            for i, deed in enumerate(self._dues):
+                if deed is not None and deed[3] in rdoers:
+                    rdeeds.append(deed)
+                    self._dues[i] = None
+
+            for doer in rdoers:  # update .doers to remove rdoers
+                self.doers.remove(doer)
+
+            self.exit(deeds=rdeeds)
+            return
+
         rdeeds = deque()  # fresh deque for deeds to remove
         deeds = self.deeds  # edit update self.deeds in place
         for i in range(len(deeds)):  # iterate once over each deed
@@ -763,9 +1087,16 @@ class DoDoer(Doer):
             Used throughout the execution lifecycle. The normal
             case is use the default empty initialization performed here and
             update in .enter().
+            When .heaped deeds is list min-heap of quadruples of form
+            (retyme, order, dog, doer) instead. See Doist.
         always (bool): True means keep running even when all dogs in deeds
             are complete. Enables dynamically managing extending or removing
             doers and associated deeds while running.
+        heaped (bool): True means schedule deeds with min-heap keyed on retyme
+            False means schedule deeds with round robin deque
+
+    Methods:
+        .earliest returns earliest pending retyme of deeds including nested deeds
 
     Inherited Methods:
         .wind  injects ._tymth dependency from associated Tymist to get its .tyme
@@ -792,10 +1123,12 @@ class DoDoer(Doer):
        ._always is hidden attribute for .always property
        ._doers is hidden attribute for .doers property
        ._deeds is hidden attribute for .deeds property
+       ._orders is itertools.count iterator of enter orders for heaped deeds
+       ._dues is list of due heaped deeds popped but not yet run by .recur
 
     """
 
-    def __init__(self, doers=None, always=False, **kwa):
+    def __init__(self, doers=None, always=False, heaped=False, **kwa):
         """
         Initialize instance.
 
@@ -815,12 +1148,18 @@ class DoDoer(Doer):
             always is Boolean, True means keep running even when all dogs in deeds
                 are complete. Enables dynamically managing extending or removing
                 doers and associated deeds while running.
+            heaped is Boolean, True means schedule deeds with min-heap keyed on
+                retyme so each .recur only touches due deeds.
+                False means schedule deeds with round robin deque
 
         """
         super(DoDoer, self).__init__(**kwa)
+        self.heaped = True if heaped else False
         self.doers = list(doers) if doers is not None else []
-        self.deeds = deque()
+        self.deeds = [] if self.heaped else deque()
         self.always = always
+        self._orders = itertools.count()  # enter order of heaped deeds
+        self._dues = []  # due heaped deeds popped but not yet run
 
 
     @property
@@ -848,6 +1187,7 @@ class DoDoer(Doer):
         """
         deeds property getter, get ._deeds
         .deeds is deque of triples, each of form (dog, retyme, doer)
+            or when .heaped list min-heap of quadruples (retyme, order, dog, doer)
         """
         return self._deeds
 
@@ -855,9 +1195,12 @@ class DoDoer(Doer):
     @deeds.setter
     def deeds(self, deeds):
         """
-        set ._deeds to deeds deque
+        set ._deeds to deeds deque or list when .heaped
         """
-        if not isinstance(deeds, deque):
+        if self.heaped:
+            if not isinstance(deeds, list):
+                raise TypeError("Expected list, got {}.".format(type(deeds)))
+        elif not isinstance(deeds, deque):
             raise TypeError("Expected deque, got {}.".format(type(deeds)))
         self._deeds = deeds
 
@@ -906,7 +1249,7 @@ class DoDoer(Doer):
         always = always if always is not None else self.always
         if doers is not None:
             self.doers = list(doers)
-            self.deeds = deque()
+            self.deeds = [] if self.heaped else deque()
 
         try:
             # enter context
@@ -971,7 +1314,7 @@ class DoDoer(Doer):
             doers = self.doers
             deeds = self.deeds
         else:
-            deeds = deque()
+            deeds = [] if self.heaped else deque()
 
         for doer in doers:
             try:
@@ -988,7 +1331,10 @@ class DoDoer(Doer):
                 except AttributeError:
                     doer.__func__.done = ex.value if ex.value else False  # assign done state
                 continue  # don't append already complete
-            deeds.append((dog, self.tyme, doer))
+            if self.heaped:  # order breaks retyme ties in enter order
+                heapq.heappush(deeds, (self.tyme, next(self._orders), dog, doer))
+            else:
+                deeds.append((dog, self.tyme, doer))
         return deeds
 
 
@@ -1015,6 +1361,10 @@ class DoDoer(Doer):
         if deeds is None:
             deeds = self.deeds
 
+        if self.heaped:
+            self.recurHeap(tyme=tyme, deeds=deeds)
+            return (not deeds)  # True if deeds heap is empty
+
         deeds.append((None, None, None))  # append run through once marker
         while deeds:  # do while uses explicit break to exit while
             dog, retyme, doer = deeds.popleft()  # pop it off
@@ -1041,6 +1391,76 @@ class DoDoer(Doer):
         return (not deeds)  # True if deeds deque is empty
 
 
+    def recurHeap(self, tyme, deeds=None):
+        """
+        Recur once through the due deeds of heaped deeds, a min-heap list of
+        quadruples of form (retyme, order, dog, doer), and update in place.
+        Equivalent of Doist.recurHeap
+
+        Parameters:
+            tyme (float): is output of send fed to do yield. See .recur
+            deeds (list):  min-heap of quadruples (retyme, order, dog, doer).
+                If not provided uses .deeds.
+        """
+        if deeds is None:
+            deeds = self.deeds
+
+        dues = []
+        while deeds and deeds[0][0] <= tyme:  # pop all due deeds
+            dues.append(heapq.heappop(deeds))
+        dues.sort(key=lambda deed: deed[1])  # run in enter order
+        self._dues = dues  # so .remove may drop due deeds not yet run
+
+        for i in range(len(dues)):
+            deed = dues[i]
+            if deed is None:  # removed by .remove while running other dogs
+                continue
+            dues[i] = None  # running so no longer pending
+            retyme, order, dog, doer = deed
+            try:  # send tyme. yield tock, tock may change during sended run
+                tock = dog.send(tyme)  # yielded tock == 0.0 means re-run asap
+            except StopIteration as ex:  # returned instead of yielded
+                try:
+                    doer.done = ex.value if ex.value else False  # assign done state
+                except AttributeError:
+                    doer.__func__.done = ex.value if ex.value else False  # assign done state
+            else:  # repush for next pass
+                if not tock:  # tock is None or tock == 0.0 with empty yield tock == None
+                    retyme = tyme + self.tock  # rerun at next recur
+                else:
+                    retyme += tock  # cumulative retyme of doer tock
+                heapq.heappush(deeds, (retyme, order, dog, doer))
+
+        self._dues = []
+
+
+    def earliest(self, deeds=None):
+        """
+        Returns earliest pending retyme of deeds or None when no deeds.
+        Equivalent of Doist.earliest
+
+        Parameters:
+            deeds (deque): tuples of form (dog, retyme, doer) or when .heaped
+                list of quadruples (retyme, order, dog, doer).
+                If not provided uses .deeds.
+        """
+        if deeds is None:
+            deeds = self.deeds
+
+        if self.heaped:
+            return earliestHeap(deeds)
+
+        earliest = None
+        for dog, retyme, doer in deeds:
+            if not dog:  # marker deed
+                continue
+            retyme = dueRetyme(retyme, doer)
+            if retyme is not None and (earliest is None or retyme < earliest):
+                earliest = retyme
+
+        return earliest
+
+
     def exit(self, deeds = None):
         """
         Do 'exit' context actions.
@@ -1056,6 +1476,10 @@ class DoDoer(Doer):
         if deeds is None:
             deeds = self.deeds
 
+        if self.heaped:  # reverse enter order is reverse order of deque
+            deeds.sort(key=lambda deed: deed[1])
+            deeds[:] = [(dog, retyme, doer) for retyme, order, dog, doer in deeds]
+
         while(deeds):  # .close each remaining dog in deeds in reverse order
             dog, retime, doer = deeds.pop()  # pop it off in reverse (right side)
             if not dog:  # marker deed
@@ -1083,7 +1507,11 @@ class DoDoer(Doer):
         doers = [doer for doer in doers if doer not in self.doers] # ensure unique
         deeds = self.enter(doers=doers)  # provide fresh deeds for new doers
         self.doers.extend(doers)
-        self.deeds.extend(deeds)
+        if self.heaped:
+            for deed in deeds:
+                heapq.heappush(self.deeds, deed)
+        else:
+            self.deeds.extend(deeds)
 
 
     def remove(self, doers):
@@ -1096,6 +1524,21 @@ class DoDoer(Doer):
 
         """
         rdoers = [doer for doer in doers if doer in self.doers] # ensure in .doers
+        if self.heaped:  # drop from heap and from pending due deeds in .recurHeap
+            rdeeds = [deed for deed in self.deeds if deed[3] in rdoers]
+            self.deeds[:] = [deed for deed in self.deeds if deed[3] not in rdoers]
+            heapq.heapify(self.deeds)
+            for i, deed in enumerate(self._dues):
+                if deed is not None and deed[3] in rdoers:
+                    rdeeds.append(deed)
+                    self._dues[i] = None
+
+            for doer in rdoers:  # update .doers to remove rdoers
+                self.doers.remove(doer)
+
+            self.exit(deeds=rdeeds)
+            return
+
         rdeeds = deque()  # fresh deque for deeds to remove
         deeds = self.deeds  # edit update self.deeds in place
         for i in range(len(deeds)):  # iterate once over each deed
@@ -0,0 +1,215 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.base.supervising module
+
+Support for running a Doist per worker process in N forked worker processes
+
+"""
+import os
+import signal
+import threading
+import time
+
+from . import doing
+from .. import help
+
+logger = help.ogler.getLogger()
+
+
+class Supervisor():
+    """
+    Supervisor forks .count worker processes that each build their own doers
+    with .builder and run them in their own Doist. Use with servers opened
+    with reusable=True so that each worker opens its own listen socket on the
+    same ha with SO_REUSEPORT and the kernel load balances new connections
+    across the workers. Builder must create the servers so each worker has
+    its own listen socket. Unix only since it uses os.fork.
+
+    The supervisor restarts workers that exit unsuccessfully, that is, with
+    a nonzero exit code or by signal when .restartable. Workers that exit
+    successfully such as when their Doist limit is reached are not restarted.
+    .run returns once all workers have exited.
+
+    Graceful shutdown: .stop or SIGTERM or SIGINT to the supervisor sends
+    SIGTERM to every worker. SIGTERM raises SystemExit in a worker so its
+    Doist exits and closes its doers such as ServerDoer closing its server.
+    Workers still alive after .grace seconds are killed with SIGKILL.
+
+    Usage:
+        def builder():
+            server = http.Server(port=8080, app=app, tymth=None, reusable=True)
+            return [http.ServerDoer(server=server)]
+
+        supervisor = Supervisor(builder=builder, count=4)
+        supervisor.run()
+
+    Attributes:
+        builder (Callable): called in each worker to return list of doers
+        count (int): number of worker processes
+        tock (float): tock of each worker Doist. Idle workers sleep between
+            tocks when real so 0.0 spins at full CPU
+        real (bool): real of each worker Doist
+        limit (float | None): limit of each worker Doist
+        opts (dict): other keyword arguments for each worker Doist such as
+            selecting=True
+        restartable (bool): True means restart workers that exit unsuccessfully
+        grace (float): seconds to wait after SIGTERM before SIGKILL
+        interval (float): seconds between polls for exited workers
+        workers (dict): index of live workers keyed by pid
+        restarts (int): count of restarted workers
+        stopping (bool): True once shutdown started
+
+    """
+    Count = 2  # default number of workers
+    Grace = 5.0  # default seconds from SIGTERM to SIGKILL
+    Interval = 0.05  # default seconds between polls for exited workers
+
+    def __init__(self, builder, count=None, tock=None, real=True, limit=None,
+                 restartable=True, grace=None, interval=None, **opts):
+        """
+        Initialize instance
+
+        Parameters:
+            builder (Callable): returns list of doers for a worker
+            count (int): number of worker processes. None means .Count
+            tock (float): tock of worker Doist. None means Doist.Tock
+            real (bool): True means worker Doist runs in real time
+            limit (float | None): worker Doist limit. None means no limit
+            restartable (bool): True means restart unsuccessful workers
+            grace (float): seconds from SIGTERM to SIGKILL. None means .Grace
+            interval (float): seconds between polls. None means .Interval
+            opts (dict): other Doist keyword arguments
+        """
+        self.builder = builder
+        self.count = count if count is not None else self.Count
+        self.tock = tock if tock is not None else doing.Doist.Tock
+        self.real = True if real else False
+        self.limit = limit
+        self.opts = opts
+        self.restartable = True if restartable else False
+        self.grace = grace if grace is not None else self.Grace
+        self.interval = interval if interval is not None else self.Interval
+        self.workers = dict()
+        self.restarts = 0
+        self.stopping = False
+
+
+    def spawn(self, index):
+        """
+        Fork worker process of index. In the worker run .work and never return
+
+        Returns:
+            pid (int): process id of worker
+        """
+        pid = os.fork()
+        if pid == 0:  # worker
+            code = 1
+            try:
+                code = self.work(index)
+            except SystemExit as ex:  # None is success, message is failure
+                if isinstance(ex.code, int):
+                    code = ex.code
+                elif ex.code is None:
+                    code = 0
+                else:
+                    logger.error("Worker %s of %s exited.\n%s\n", index,
+                                 os.getpid(), ex.code)
+            except BaseException as ex:
+                logger.error("Worker %s of %s failed.\n%s\n", index, os.getpid(), ex)
+            finally:
+                os._exit(code)
+        self.workers[pid] = index
+        return pid
+
+
+    def work(self, index):
+        """
+        Worker process body. Builds doers and runs them in new Doist
+
+        Returns:
+            code (int): worker exit code
+        """
+        signal.signal(signal.SIGTERM, self._terminate)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        doist = doing.Doist(tock=self.tock, real=self.real, limit=self.limit,
+                            **self.opts)
+        doist.do(doers=self.builder())
+        return 0
+
+
+    @staticmethod
+    def _terminate(signum, frame):
+        """
+        Worker SIGTERM handler. Raises SystemExit so Doist exits its doers
+        """
+        raise SystemExit(0)
+
+
+    def stop(self):
+        """
+        Start graceful shutdown of workers
+        """
+        self.stopping = True
+
+
+    def run(self):
+        """
+        Spawn .count workers then supervise until all have exited.
+        When run from main thread SIGTERM and SIGINT start graceful shutdown.
+        """
+        handlers = dict()
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                handlers[signum] = signal.signal(signum,
+                                                 lambda signum, frame: self.stop())
+        try:
+            for index in range(self.count):
+                self.spawn(index)
+            self.supervise()
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+
+    def supervise(self):
+        """
+        Reap exited workers restarting unsuccessful ones until all have exited.
+        Once .stopping terminate workers and kill them after .grace
+        """
+        deadline = None
+        while self.workers:
+            if self.stopping and deadline is None:  # start graceful shutdown
+                deadline = time.monotonic() + self.grace
+                self.signal(signal.SIGTERM)
+
+            reaped = False
+            for pid in list(self.workers):  # only reap own workers
+                pid, status = os.waitpid(pid, os.WNOHANG)
+                if pid == 0:  # still alive
+                    continue
+                reaped = True
+                index = self.workers.pop(pid)
+                code = os.waitstatus_to_exitcode(status)
+                if code != 0:
+                    logger.error("Worker %s of %s exited with %s.\n", index, pid, code)
+                    if self.restartable and not self.stopping:
+                        time.sleep(self.interval)  # throttle crash loops
+                        self.restarts += 1
+                        self.spawn(index)
+
+            if not reaped:
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.signal(signal.SIGKILL)
+                    deadline = float("inf")  # kill once
+                time.sleep(self.interval)
+
+
+    def signal(self, signum):
+        """
+        Send signal signum to all live workers
+        """
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
@@ -2,6 +2,7 @@
 """
 hio.core.tyming Module
 """
+import math
 import time
 from collections import deque
 
@@ -293,3 +294,254 @@ class Tymer(Tymee):
 
 
 
+class Wheel(Tymee):
+    """
+    Wheel is a hierarchical timing wheel of many keyed tymeouts on the tyme
+    base of a Tymist. Starting, restarting, and removing the tymeout of a key
+    is O(1) and .expire returns only the keys whose tymeouts have expired
+    instead of checking a Tymer per key. Useful for connection idle tymeouts
+    of servers with many connections or any doer with many timers.
+
+    Tyme is divided into ticks of .tock seconds. Level 0 has one slot per tick
+    for the next .sizes[0] ticks. Each higher level has slots that each span
+    all the slots of the level below. A tymeout is placed in the lowest level
+    slot that holds its expiration tick. As tyme advances the slots of higher
+    levels cascade their keys down into lower levels until they expire from
+    level 0. Tymeouts expire on the first tick at or after their deadline so
+    they are never early and at most one .tock late.
+
+    Usage:
+        wheel = Wheel(tymth=tymist.tymen(), tock=0.125)
+        wheel.start(ca, 5.0)  # expire ca 5 seconds from now
+        wheel.restart(ca)  # on activity restart with same duration
+        for ca in wheel.expire():  # each pass
+            close(ca)
+
+    Inherited Properties:
+        .tyme is float relative cycle time of associated Tymist .tyme
+        .tymth is function wrapper closure returned by Tymist .tymeth() method.
+
+    Attributes:
+        .tock is float tyme in seconds of one tick of level 0
+        .sizes is tuple of int number of slots per level from level 0 up
+
+    Methods:
+        .start(key, duration) = start or restart tymeout of key
+        .restart(key, duration=None) = restart tymeout of key from now
+        .remove(key) = remove tymeout of key if any
+        .expire() = return list of expired keys
+
+    Hidden:
+        ._levels is list of levels each a list of slots each a dict of keys
+        ._places is dict of (level, index) of slot of each key or None if due
+        ._deadlines is dict of expiration tick of each key
+        ._durations is dict of duration of each key
+        ._due is dict of keys due to expire at next .expire
+        ._over is dict of keys beyond range of top level
+        ._tick is int current tick
+    """
+    Tock = 0.125  # default tick tyme in seconds
+    Sizes = (256, 64, 64, 64)  # default slots per level
+
+    def __init__(self, tock=None, sizes=None, **kwa):
+        """
+        Initialization method for instance.
+        Parameters:
+            tock is float tick tyme in seconds. None means .Tock
+            sizes is iterable of int slots per level. None means .Sizes
+        """
+        super(Wheel, self).__init__(**kwa)
+        self.tock = float(tock) if tock is not None else self.Tock
+        self.sizes = tuple(sizes) if sizes is not None else self.Sizes
+        self._levels = [[dict() for i in range(size)] for size in self.sizes]
+        self._units = [1]  # ticks spanned by one slot of each level
+        for size in self.sizes[:-1]:
+            self._units.append(self._units[-1] * size)
+        self._places = dict()
+        self._deadlines = dict()
+        self._durations = dict()
+        self._due = dict()
+        self._over = dict()
+        self._tick = self._tickOf(self.tyme) if self.tymth else 0
+
+
+    def __len__(self):
+        return len(self._deadlines)
+
+
+    def __contains__(self, key):
+        return key in self._deadlines
+
+
+    def wind(self, tymth):
+        """
+        Inject new tymist.tymth as new ._tymth. Changes tymist.tyme base.
+        Restarts all tymeouts at new tyme base
+        """
+        super(Wheel, self).wind(tymth)
+        durations = dict(self._durations)
+        self.clear()
+        self._tick = self._tickOf(self.tyme)
+        for key, duration in durations.items():
+            self.start(key, duration)
+
+
+    def clear(self):
+        """
+        Remove all tymeouts
+        """
+        for level in self._levels:
+            for slot in level:
+                slot.clear()
+        self._places.clear()
+        self._deadlines.clear()
+        self._durations.clear()
+        self._due.clear()
+        self._over.clear()
+
+
+    def start(self, key, duration):
+        """
+        Start tymeout of key to expire duration seconds from now.
+        Replaces any current tymeout of key.
+
+        Parameters:
+            key (Hashable): key of tymeout such as connection address ca
+            duration (float): seconds from now until expiration
+        """
+        self.remove(key)
+        self._advance()
+        tyme = self.tyme if self.tymth else 0.0  # not yet wound
+        # ceil so never expires before its deadline
+        deadline = math.ceil((tyme + duration) / self.tock - 1e-9)
+        self._deadlines[key] = deadline
+        self._durations[key] = duration
+        self._place(key, deadline)
+
+
+    def restart(self, key, duration=None):
+        """
+        Restart tymeout of key from now for duration if provided otherwise its
+        current duration. Starts key if not present and duration provided.
+        """
+        duration = duration if duration is not None else self._durations[key]
+        self.start(key, duration)
+
+
+    def remove(self, key):
+        """
+        Remove tymeout of key if any
+        """
+        if key not in self._deadlines:
+            return
+        place = self._places.pop(key)
+        if place is None:
+            self._due.pop(key, None)
+            self._over.pop(key, None)
+        else:
+            level, index = place
+            del self._levels[level][index][key]
+        del self._deadlines[key]
+        del self._durations[key]
+
+
+    def remaining(self, key):
+        """
+        Returns tyme in seconds until tymeout of key expires on tick boundary
+        """
+        return self._deadlines[key] * self.tock - self.tyme
+
+
+    def expire(self):
+        """
+        Returns list of keys whose tymeouts have expired and removes them.
+        Advances wheel to current tyme cascading higher level slots.
+        """
+        self._advance()
+        expireds = list(self._due)
+        for key in expireds:
+            del self._places[key]
+            del self._deadlines[key]
+            del self._durations[key]
+        self._due.clear()
+        return expireds
+
+
+    def _tickOf(self, tyme):
+        """
+        Returns int tick of tyme
+        """
+        return math.floor(tyme / self.tock + 1e-9)
+
+
+    def _place(self, key, deadline):
+        """
+        Place key with deadline tick in due, lowest level slot, or over
+        """
+        if deadline <= self._tick:
+            self._due[key] = None
+            self._places[key] = None
+            return
+        for level, size in enumerate(self.sizes):
+            unit = self._units[level]
+            bucket = deadline // unit
+            if bucket - self._tick // unit < size:
+                index = bucket % size
+                self._levels[level][index][key] = None
+                self._places[key] = (level, index)
+                return
+        self._over[key] = None  # beyond top level. replaced on top cascade
+        self._places[key] = None
+
+
+    def _advance(self):
+        """
+        Advance current tick to tick of current tyme one tick at a time
+        cascading each higher level slot when its span starts.
+        When more ticks elapsed than keys, replace all keys instead.
+        """
+        if not self.tymth:
+            return
+        target = self._tickOf(self.tyme)
+        if target <= self._tick:
+            return
+        if not self._deadlines or target - self._tick > len(self._deadlines):
+            self._tick = target
+            keys = [key for key in self._deadlines if key not in self._due]
+            for key in keys:
+                place = self._places[key]
+                if place is None:
+                    del self._over[key]
+                else:
+                    level, index = place
+                    del self._levels[level][index][key]
+            self._replace(keys)
+            return
+
+        while self._tick < target:
+            self._tick += 1
+            tick = self._tick
+            for level in range(len(self.sizes) - 1, 0, -1):  # top down
+                unit = self._units[level]
+                if tick % unit == 0:  # slot span starts so cascade it down
+                    if level == len(self.sizes) - 1 and self._over:
+                        keys = list(self._over)
+                        self._over.clear()
+                        self._replace(keys)
+                    slot = self._levels[level][(tick // unit) % self.sizes[level]]
+                    keys = list(slot)
+                    slot.clear()
+                    self._replace(keys)
+            slot = self._levels[0][tick % self.sizes[0]]
+            for key in slot:
+                self._due[key] = None
+                self._places[key] = None
+            slot.clear()
+
+
+    def _replace(self, keys):
+        """
+        Place again each of keys already removed from its slot
+        """
+        for key in keys:
+            self._place(key, self._deadlines[key])
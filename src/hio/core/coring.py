@@ -5,6 +5,7 @@ hio.core.coring Module
 
 import subprocess
 import socket
+import selectors
 
 #import netifaces  # netifaces2
 
@@ -42,6 +43,45 @@ def normalizeHost(host):
     host = info[0][4][0]
     return host
 
+
+def selectorRegister(selector, fileobj, data=None):
+    """
+    Register fileobj for read readiness with selector when selector provided.
+    Idempotent. Reregisters with data when fileobj already registered.
+    Returns True if registered False otherwise.
+
+    Parameters:
+        selector (selectors.BaseSelector): such as owned by Doist or None
+        fileobj (socket.socket | int): file like object with .fileno() or fd
+        data (object): attached to selector key such as owning IO instance
+    """
+    if selector is None or fileobj is None:
+        return False
+    try:
+        selector.register(fileobj, selectors.EVENT_READ, data)
+    except KeyError:  # already registered so update
+        selector.modify(fileobj, selectors.EVENT_READ, data)
+    return True
+
+
+def selectorUnregister(selector, fileobj):
+    """
+    Unregister fileobj from selector when selector provided. Call before
+    closing fileobj. Idempotent.
+    Returns True if unregistered False otherwise.
+
+    Parameters:
+        selector (selectors.BaseSelector): such as owned by Doist or None
+        fileobj (socket.socket | int): file like object with .fileno() or fd
+    """
+    if selector is None or fileobj is None:
+        return False
+    try:
+        selector.unregister(fileobj)
+    except (KeyError, ValueError):  # not registered or already closed
+        return False
+    return True
+
 # netifaces not fully supported on macos anymore only linux
 #def getDefaultHost():
     #"""
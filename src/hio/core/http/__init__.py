@@ -4,4 +4,5 @@ hio.core.http Package
 """
 from .httping import HTTPError
 from .clienting import Client, openClient, ClientDoer
-from .serving import BareServer, Server, WsgiServer, openServer, ServerDoer
+from .serving import BareServer, Router, Server, WsgiServer, openServer, ServerDoer
+from .eventing import EventHub, EventHubDoer
@@ -297,6 +297,8 @@ class Respondent(httping.Parsent):
                  events=None,
                  retry=None,
                  leid=None,
+                 eventback=None,
+                 maxevents=None,
                  **kwa):
         """
         Initialize Instance:
@@ -306,6 +308,9 @@ class Respondent(httping.Parsent):
         events = deque of events if any
         retry = sse retry timeout in seconds if any if evented
         leid = last event id if any if evented
+        eventback = callable given each event instead of appending to events
+        maxevents = max events in events before oldest dropped. None means
+                    unbounded
         """
         super(Respondent, self).__init__(**kwa)
 
@@ -323,6 +328,8 @@ class Respondent(httping.Parsent):
         self.retry = retry if retry is not None else self.Retry  # retry timeout in milliseconds if evented
         self.leid = None  # non None if evented with event ids sent
         self.eventSource = None  # httping.EventSource instance when .evented
+        self.eventback = eventback
+        self.maxevents = maxevents
 
 
     def reinit(self,
@@ -406,36 +413,23 @@ class Respondent(httping.Parsent):
 
         self.headers = help.Hict()
 
-        # create generator
-        lineParser = httping.parseLine(raw=self.msg, eols=(CRLF, LF), kind="status line")
         while True:  # parse until we get a non-100 status
-            if self.closed and not self.msg:  # connection closed prematurely
-                raise httping.PrematureClosure("Connection closed unexpectedly"
-                                               " while parsing response start line")
-
-            line = next(lineParser)
-            if line is None:
-                (yield None)
-                continue
-            lineParser.close()  # close generator
-
-            version, status, reason = httping.parseStatusLine(line)
-            if status != httping.CONTINUE:  # 100 continue (with request or ignore)
-                break
-
-            leaderParser = httping.parseLeader(raw=self.msg,
-                                            eols=(CRLF, LF),
-                                            kind="continue header line")
+            headingParser = self.backend.statusHeading(raw=self.msg,
+                                                       kind="response heading")
             while True:
                 if self.closed and not self.msg:  # connection closed prematurely
                     raise httping.PrematureClosure("Connection closed unexpectedly"
-                            " while parsing response header")
-                headers = next(leaderParser)
-                if headers is not None:
-                    leaderParser.close()
+                                                   " while parsing response heading")
+                heading = next(headingParser)
+                if heading is not None:
+                    headingParser.close()  # close generator
                     break
                 (yield None)
 
+            version, status, reason, headers = heading
+            if status != httping.CONTINUE:  # 100 continue (with request or ignore)
+                break
+
         self.code = self.status = status
         self.reason = reason.strip()
         if version in ("HTTP/1.0", "HTTP/0.9"):
@@ -446,18 +440,6 @@ class Respondent(httping.Parsent):
         else:
             raise httping.UnknownProtocol(version)
 
-        leaderParser = httping.parseLeader(raw=self.msg,
-                                   eols=(CRLF, LF),
-                                   kind="leader header line")
-        while True:
-            if self.closed and not self.msg:  # connection closed prematurely
-                raise httping.PrematureClosure("Connection closed unexpectedly"
-                                               " while parsing response header")
-            headers = next(leaderParser)
-            if headers is not None:
-                leaderParser.close()
-                break
-            (yield None)
         self.headers.update(headers)
 
         # are we using the chunked-style of transfer encoding?
@@ -497,7 +479,9 @@ class Respondent(httping.Parsent):
                 self.evented = True
                 self.eventSource = httping.EventSource(raw=self.body,
                                            events=self.events,
-                                           dictable=self.dictable)
+                                           dictable=self.dictable,
+                                           callback=self.eventback,
+                                           maxevents=self.maxevents)
             else:
                 self.evented = False
 
@@ -524,6 +508,9 @@ class Respondent(httping.Parsent):
     def parseBody(self):
         """
         Parse body
+        When body may be larger than .spoolsize and not evented feed body
+        bytes to .spool as they arrive which spills them to a temporary file.
+        Raise BodyTooLarge when body larger than .maxbody
         """
         if self.bodied:
             return  # already parsed the body
@@ -531,7 +518,12 @@ class Respondent(httping.Parsent):
         if self.length and self.length < 0:
             raise ValueError("Invalid content length of {0}".format(self.length))
 
+        if self.length:
+            self.checkBody(self.length, kind="response body")
+
         del self.body[:]  # self.body.clear() clear body python2 bytearrays don't clear
+        self.spool = self.makeSpool() if not self.evented else None
+        body = self.spool if self.spool is not None else self.body
 
         if self.chunked:  # content-length is ignored if chunked
             self.parms = dict()
@@ -553,7 +545,8 @@ class Respondent(httping.Parsent):
                     self.parms.update(parms)
 
                 if size:  # size non zero so append chunk but keep iterating
-                    self.body.extend(chunk)
+                    self.checkBody(len(body) + size, kind="response body")
+                    body.extend(chunk)
                     if self.evented:
                         self.eventSource.parse()  # parse events here
                         if (self.eventSource.retry is not None and
@@ -573,6 +566,18 @@ class Respondent(httping.Parsent):
                     chunkParser.close()
                     break
 
+        elif self.spool is not None and self.length is not None:  # spool as arrives
+            while self.spool.size < self.length:
+                if self.msg:
+                    size = min(self.length - self.spool.size, len(self.msg))
+                    self.spool.extend(self.msg[:size])
+                    del self.msg[:size]
+                    continue
+                if self.closed:  # connection closed prematurely
+                    raise httping.PrematureClosure("Connection closed unexpectedly"
+                                                   " while parsing response body")
+                (yield None)
+
         elif self.length != None:  # known content length
             while len(self.msg) < self.length:
                 if self.closed and not self.msg:  # connection closed prematurely
@@ -586,7 +591,8 @@ class Respondent(httping.Parsent):
         else:  # unknown content length so parse forever until closed
             while True:
                 if self.msg:
-                    self.body.extend(self.msg[:])
+                    self.checkBody(len(body) + len(self.msg), kind="response body")
+                    body.extend(self.msg[:])
                     del self.msg[:]  # python2 bytearrays dont have clear self.msg.clear()
 
                 if self.evented:
@@ -605,7 +611,7 @@ class Respondent(httping.Parsent):
 
         # only gets to here once content length has become finite
         # closed, not chunked/streamed, or chunking/streaming has ended
-        self.length = len(self.body)
+        self.length = self.endSpool() if self.spool is not None else len(self.body)
         self.bodied = True
         (yield True)
         return
@@ -675,6 +681,11 @@ class Client():
                  redirects=None,
                  responses=None,
                  portOptional=False,
+                 backend=None,
+                 spoolsize=0,
+                 maxbody=0,
+                 eventback=None,
+                 maxevents=None,
                  **kwa):
         """
         Initialization method for instance.
@@ -717,6 +728,18 @@ class Client():
                  each response is dict
             portOptional = True indicates to leave off port 80 for http or
                  443 for https in Host header to support non-compliant server implementations.
+            backend is parser backend for respondent, Backend instance or name
+                 such as "httptools". None means pure python default
+            spoolsize is max response body bytes kept in memory by respondent.
+                 Larger bodies are in response 'spool' as seekable
+                 httping.Spool of temporary file that caller closes.
+                 0 means never spool
+            maxbody is max response body bytes. Larger errors response.
+                 0 means no limit
+            eventback is callable given each server sent event by respondent
+                 instead of appending to .events
+            maxevents is max events in .events before respondent drops
+                 oldest. None means unbounded
 
             **kwa are passed through to init .connector tcp.Client or tcp.ClientTLS
         """
@@ -837,7 +860,12 @@ class Client():
                                     dictable=dictable,
                                     events=self.events,
                                     redirectable=redirectable,
-                                    redirects=self.redirects)
+                                    redirects=self.redirects,
+                                    backend=backend,
+                                    spoolsize=spoolsize,
+                                    maxbody=maxbody,
+                                    eventback=eventback,
+                                    maxevents=maxevents)
         else:
             # do we need to assign the events, redirects also?
             respondent.reinit(msg=self.connector.rxbs,
@@ -1032,7 +1060,9 @@ class Client():
                                            ha=(hostname, port),
                                            bufsize=self.connector.bs,
                                            wl=self.connector.wl,
-                                           context=context)
+                                           context=context,
+                                           resumable=getattr(self.connector, 'resumable', False),
+                                           sessions=getattr(self.connector, 'sessions', None))
                 else:
                     connector = tcp.Client(tymth=self.connector.tymth,
                                         ha=(hostname, port),
@@ -1126,6 +1156,8 @@ class Client():
                                       ('errored', self.respondent.errored),
                                       ('error', self.respondent.error),
                                      ])
+                    if self.respondent.spool is not None:  # body spilled to file
+                        response['spool'] = self.respondent.spool
                     if self.respondent.redirectable and self.respondent.redirectant:
                         self.redirects.append(copy.copy(response))
                         self.redirect()
@@ -1208,11 +1240,18 @@ def backendRequest(tymth, *,
                    data=None,
                    buffered=False,
                    tymeout=2.0,
+                   context=None,
+                   sessions=None,
                    ):
     """
     Perform Async ReST request to Backend Server
 
     Parameters:
+        context (ssl.SSLContext): shared client context for https. None means
+            new context per request
+        sessions (dict): shared ssl.SSLSession cache keyed by (hostname, port)
+            for https so repeated requests resume TLS sessions instead of
+            full handshakes. Requires shared context. None means no resumption
 
     Usage: (Inside a generator function)
 
@@ -1226,6 +1265,14 @@ def backendRequest(tymth, *,
 
 
     """
+    kwa = dict()
+    if sessions is not None:
+        if context is None:
+            raise ValueError("TLS session resumption requires shared context.")
+        kwa.update(resumable=True, sessions=sessions)
+    if context is not None:
+        kwa.update(context=context)
+
     try:
 
         if buffered:
@@ -1250,6 +1297,7 @@ def backendRequest(tymth, *,
                              tymeout=tymeout,
                              reconnectable=False,
                              tymth=tymth,
+                             **kwa
                         )
 
         client.transmit()
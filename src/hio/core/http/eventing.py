@@ -0,0 +1,357 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.core.http.eventing module
+
+Server sent events broadcast hub for http.Server
+"""
+from collections import deque
+
+from ... import help
+from ...base import doing, tyming
+from . import httping
+
+logger = help.ogler.getLogger()
+
+
+class Subscriber():
+    """
+    Subscriber of EventHub channel and wsgi body iterable of its event-stream
+    response. Events published once headed are queued by the hub directly on
+    the transmit queue of the Responder's incomer. Until headed events are
+    kept in .backlog and returned as body so the Responder sends them after
+    its head.
+
+    Attributes:
+        hub (EventHub): hub of subscription
+        responder (Responder): responder of event-stream response
+        channel (str): subscribed channel
+        backlog (deque): event bytes not yet returned as body
+        size (int): number of bytes in .backlog
+        ended (bool): True once stream ends because unsubscribed or dropped
+
+    Methods:
+        push(payload, frame) queues event for transmit
+        end() ends stream
+        drop() ends stream and closes connection after response
+        close() unsubscribes. Called by wsgi server when done with iterable
+    """
+
+    def __init__(self, hub, responder, channel='', backlog=None):
+        """
+        Initialize instance
+
+        Parameters:
+            hub (EventHub): hub of subscription
+            responder (Responder): responder of event-stream response
+            channel (str): subscribed channel
+            backlog (Iterable | None): of event bytes to send first
+        """
+        self.hub = hub
+        self.responder = responder
+        self.channel = channel
+        self.backlog = deque(backlog if backlog is not None else ())
+        self.size = sum(len(payload) for payload in self.backlog)
+        self.ended = False
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        """
+        Returns backlog bytes if any otherwise empty bytes so Responder
+        waits. Raises StopIteration once .ended
+        Swaps .backlog for empty deque so push from another thread while
+        joining lands on the new deque and is not lost.
+        """
+        if self.ended:
+            raise StopIteration
+        if not self.backlog:
+            return b''
+        backlog, self.backlog = self.backlog, deque()
+        msg = b''.join(backlog)
+        self.size -= len(msg)
+        return msg
+
+
+    def push(self, payload, frame):
+        """
+        Queue event on transmit queue of .responder's incomer as frame when
+        chunked else as payload. Queues payload on .backlog when not yet
+        headed. Drops subscriber whose unsent bytes exceed hub high water.
+        Unsubscribes once response ended by server.
+
+        Parameters:
+            payload (bytes): encoded event
+            frame (bytes): payload chunk framed
+        """
+        responder = self.responder
+        if responder.ended or responder.closed:  # connection gone
+            self.end()
+            return
+
+        if not responder.headed:
+            self.backlog.append(payload)
+            self.size += len(payload)
+            if self.size > self.hub.highwater:
+                self.drop()
+            return
+
+        incomer = responder.incomer
+        if len(incomer.txbs) > self.hub.highwater:  # too slow
+            self.drop()
+            return
+        incomer.tx(frame if responder.chunked else payload)
+
+
+    def end(self):
+        """
+        End stream and unsubscribe
+        """
+        self.ended = True
+        self.hub.unsubscribe(self)
+
+
+    def drop(self):
+        """
+        End stream and close connection after response
+        """
+        logger.info("Dropped slow event subscriber %s on channel '%s'.\n",
+                    getattr(self.responder.incomer, "ca", None), self.channel)
+        self.responder.persisted = False
+        self.end()
+
+
+    def close(self):
+        """
+        Unsubscribe. wsgi close of body iterable
+        """
+        self.hub.unsubscribe(self)
+
+
+class EventHub(tyming.Tymee):
+    """
+    EventHub broadcasts server sent events to subscribed event-stream
+    responses of http.Server per channel. Each published event is encoded
+    once with its chunk framing into immutable bytes that are queued as is
+    on the transmit queue of every subscriber so with Reel .txbs they are
+    shared not copied. Subscribers whose unsent bytes exceed .highwater are
+    dropped. Recent events of each channel are kept in a ring for replay to
+    resubscribers that provide Last-Event-ID.
+
+    Usage:
+        hub = EventHub()
+
+        def app(environ, start_response):
+            return hub.subscribe(environ, start_response, channel="news")
+
+        hub.publish("hello", channel="news")
+
+    See Tymee for inherited attributes, properties, and methods.
+
+    Attributes:
+        highwater (int): max unsent bytes of subscriber before dropped
+        ringsize (int): max events per channel kept for replay
+        heartbeat (float): seconds between keep alive comments. 0.0 means none
+        retry (int | None): reconnection milliseconds sent to subscribers
+        channels (dict): sets of Subscribers keyed by channel
+        rings (dict): deques of (eid, payload, frame) keyed by channel
+        count (int): last assigned event id
+        tymer (Tymer | None): heartbeat tymer once wound
+
+    Methods:
+        subscribe(environ, start_response, channel) returns Subscriber
+        unsubscribe(subscriber)
+        publish(data, channel, event, eid) returns event id
+        replay(channel, last) returns event payloads after last
+        service() sends heartbeats
+        close() ends all subscribers
+    """
+    HighWater = 1 << 20  # default max unsent bytes per subscriber
+    RingSize = 256  # default max events per channel kept for replay
+    Heartbeat = 15.0  # default seconds between keep alive comments
+
+    def __init__(self, highwater=None, ringsize=None, heartbeat=None,
+                 retry=None, **kwa):
+        """
+        Initialize instance
+
+        Parameters:
+            highwater (int | None): max unsent bytes of subscriber before it
+                is dropped. None means .HighWater
+            ringsize (int | None): max events per channel kept for replay.
+                None means .RingSize
+            heartbeat (float | None): seconds between keep alive comments.
+                0.0 means none. None means .Heartbeat
+            retry (int | None): reconnection milliseconds sent to new
+                subscribers. None means not sent
+        """
+        self.highwater = highwater if highwater is not None else self.HighWater
+        self.ringsize = ringsize if ringsize is not None else self.RingSize
+        self.heartbeat = heartbeat if heartbeat is not None else self.Heartbeat
+        self.retry = retry
+        self.channels = dict()
+        self.rings = dict()
+        self.count = 0
+        self.tymer = None
+        super(EventHub, self).__init__(**kwa)
+        if self.tymth:
+            self.wind(self.tymth)
+
+
+    def wind(self, tymth):
+        """
+        Inject new tymist.tymth as new ._tymth. Changes tymist.tyme base.
+        Updates winds .tymer .tymth
+        """
+        super(EventHub, self).wind(tymth)
+        if self.heartbeat:
+            self.tymer = tyming.Tymer(tymth=tymth, duration=self.heartbeat)
+
+
+    def subscribe(self, environ, start_response, channel=''):
+        """
+        Returns Subscriber of channel as body iterable of event-stream
+        response. Starts response and replays events after Last-Event-ID
+        of request if any
+
+        Parameters:
+            environ (dict): wsgi environ with 'hio.responder'
+            start_response (Callable): wsgi start_response
+            channel (str): channel to subscribe
+        """
+        responder = environ.get('hio.responder')
+        if responder is None:
+            raise ValueError("Missing 'hio.responder' in environ.")
+
+        start_response('200 OK', [('Content-Type', 'text/event-stream'),
+                                  ('Cache-Control', 'no-cache')])
+        backlog = [httping.packEvent(retry=self.retry)]  # sends head now
+        backlog.extend(self.replay(channel, environ.get('HTTP_LAST_EVENT_ID')))
+        subscriber = Subscriber(hub=self, responder=responder,
+                                channel=channel, backlog=backlog)
+        self.channels.setdefault(channel, set()).add(subscriber)
+        return subscriber
+
+
+    def unsubscribe(self, subscriber):
+        """
+        Remove subscriber from its channel
+        """
+        subscribers = self.channels.get(subscriber.channel)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self.channels[subscriber.channel]
+
+
+    def publish(self, data, channel='', event=None, eid=None):
+        """
+        Returns str event id of event encoded once and queued to all
+        subscribers of channel and kept in ring of channel for replay
+
+        Parameters:
+            data (bytes | str | dict | list): event data. dict or list is json
+            channel (str): channel of event
+            event (str | None): event type. None means default message type
+            eid (str | None): event id. None means next .count
+        """
+        if eid is None:
+            self.count += 1
+            eid = self.count
+        eid = str(eid)
+        payload = httping.packEvent(data, event=event, eid=eid)
+        frame = httping.packChunk(payload)
+
+        ring = self.rings.get(channel)
+        if ring is None:
+            ring = self.rings[channel] = deque(maxlen=self.ringsize)
+        ring.append((eid, payload, frame))
+
+        for subscriber in list(self.channels.get(channel, ())):
+            subscriber.push(payload, frame)
+        return eid
+
+
+    def replay(self, channel, last=None):
+        """
+        Returns list of event payloads of ring of channel after event with
+        id last. All payloads when last is not in ring. None when last is None
+
+        Parameters:
+            channel (str): channel of events
+            last (str | None): Last-Event-ID of resubscriber if any
+        """
+        if last is None or channel not in self.rings:
+            return []
+        ring = self.rings[channel]
+        for i in range(len(ring) - 1, -1, -1):
+            if ring[i][0] == last:
+                return [payload for eid, payload, frame in list(ring)[i + 1:]]
+        return [payload for eid, payload, frame in ring]
+
+
+    def service(self):
+        """
+        Send keep alive comment to all subscribers once per .heartbeat
+        """
+        if self.tymer is None or not self.tymer.expired:
+            return
+        payload = httping.packEvent()
+        frame = httping.packChunk(payload)
+        for subscribers in list(self.channels.values()):
+            for subscriber in list(subscribers):
+                subscriber.push(payload, frame)
+        self.tymer.restart()
+
+
+    def close(self):
+        """
+        End all subscribers
+        """
+        for subscribers in list(self.channels.values()):
+            for subscriber in list(subscribers):
+                subscriber.end()
+
+
+class EventHubDoer(doing.Doer):
+    """
+    EventHub Doer
+
+    See Doer for inherited attributes, properties, and methods.
+
+    Attributes:
+       .hub is EventHub instance
+    """
+
+    def __init__(self, hub, **kwa):
+        """
+        Initialize
+
+        Parameters:
+           hub is EventHub instance
+        """
+        super(EventHubDoer, self).__init__(**kwa)
+        self.hub = hub
+        if self.tymth:
+            self.hub.wind(self.tymth)
+
+
+    def wind(self, tymth):
+        """
+        Inject new tymist.tymth as new ._tymth. Changes tymist.tyme base.
+        Updates winds .tymer .tymth
+        """
+        super(EventHubDoer, self).wind(tymth)
+        self.hub.wind(tymth)
+
+
+    def recur(self, tyme):
+        """"""
+        self.hub.service()
+
+
+    def exit(self):
+        """"""
+        self.hub.close()
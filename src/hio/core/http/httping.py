@@ -5,16 +5,26 @@ http async io (nonblocking) support
 """
 
 import os
+import io
+import time
+import datetime
+import tempfile
 from collections import deque
 import codecs
 import json
+import re
 
-from urllib.parse import quote_plus, unquote, unquote_plus
+from urllib.parse import quote_plus, unquote, unquote_plus, urlsplit
 
 from multidict import MultiDict as mudict, CIMultiDict as  cimdict
 
 from ...help import helping
+from ...base import filing
 
+try:
+    import httptools  # optional native llhttp parser for NativeBackend
+except ImportError:
+    httptools = None
 
 
 
@@ -23,6 +33,8 @@ LF = b"\n"
 CR = b"\r"
 MAX_LINE_SIZE = 65536
 MAX_HEADERS = 100
+MAX_HEAD_SIZE = 262144  # max size of heading start line plus header lines
+MAX_EVENT_SIZE = 1048576  # max size of server sent event
 
 HTTP_PORT = 80
 HTTPS_PORT = 443
@@ -195,6 +207,21 @@ class LineTooLong(HTTPException):
         HTTPException.__init__(self, "got more than %d bytes while parsing %s"
                                      % (MAX_LINE_SIZE, kind))
 
+class HeadTooLong(HTTPException):
+    def __init__(self, kind):
+        HTTPException.__init__(self, "got more than %d bytes while parsing %s"
+                                     % (MAX_HEAD_SIZE, kind))
+
+class EventTooLong(HTTPException):
+    def __init__(self, kind):
+        HTTPException.__init__(self, "got more than %d bytes while parsing %s"
+                                     % (MAX_EVENT_SIZE, kind))
+
+class BodyTooLarge(HTTPException):
+    def __init__(self, kind, size):
+        HTTPException.__init__(self, "got more than %d bytes while parsing %s"
+                                     % (size, kind))
+
 class PrematureClosure(HTTPException):
     def __init__(self, msg):
         self.args = msg,
@@ -286,6 +313,22 @@ def httpDate1123(dt):
     return "%s, %02d %s %04d %02d:%02d:%02d GMT" % (weekday, dt.day, month,
         dt.year, dt.hour, dt.minute, dt.second)
 
+DateStamp = (None, "", b"")  # cached (second, Date value, packed Date header)
+
+def httpDateNow(packed=False):
+    """
+    Returns RFC 1123 date string of current UTC time for Date header or when
+    packed the pre-encoded Date header line. Both are cached for the current
+    second since the date only changes once per second.
+    """
+    global DateStamp
+    now = int(time.time())
+    if DateStamp[0] != now:
+        value = httpDate1123(datetime.datetime.fromtimestamp(now,
+                                                             datetime.timezone.utc))
+        DateStamp = (now, value, b"Date: " + value.encode('ascii'))
+    return DateStamp[2] if packed else DateStamp[1]
+
 def normalizeHostPort(host, port=None, defaultPort=80):
     """
     Given hostname host which could also be netloc which includes port
@@ -401,15 +444,23 @@ def unquoteQuery(query):
     return query
 
 
+HeaderNames = dict()  # title case bytes of header names keyed by name
+MAX_HEADER_NAMES = 1024  # max cached header names
+
 def packHeader(name, *values):
     """
     Format and return a header line.
+    Title case bytes of name are cached in HeaderNames
 
     For example: h.packHeader('Accept', 'text/html')
     """
-    if isinstance(name, str):  # not bytes
-        name = name.encode('ascii')
-    name = name.title()  # make title case
+    title = HeaderNames.get(name)
+    if title is None:
+        if len(HeaderNames) >= MAX_HEADER_NAMES:
+            HeaderNames.clear()
+        title = name.encode('ascii') if isinstance(name, str) else name
+        title = HeaderNames[name] = title.title()  # make title case
+    name = title
     values = list(values)  # make copy
     for i, value in enumerate(values):
         if isinstance(value, str):
@@ -419,16 +470,62 @@ def packHeader(name, *values):
     value = b', '.join(values)
     return (name + b': ' + value)
 
+def packStatics(headers):
+    """
+    Returns tuple of (name, value, line) triples of constant headers such as
+    Server where line is the header line pre-encoded once by packHeader so
+    every response reuses it
+
+    Parameters:
+        headers (dict | Iterable[tuple]): constant header values keyed by name
+    """
+    headers = headers.items() if hasattr(headers, "items") else headers
+    return tuple((name, value, packHeader(name, value)) for name, value in headers)
+
+def packChunkParts(msg):
+    """
+    Return tuple of (size line, msg, CRLF) bytes parts of chunk of msg
+    so the parts may be queued as segments without concatenation
+    """
+    size = len(msg)
+    return (u"{0:x}\r\n".format(size).encode('ascii'), msg, b'\r\n')
+
+
 def packChunk(msg):
     """
     Return msg bytes in a chunk
     """
+    return (b''.join(packChunkParts(msg)))
+
+
+def packEvent(data=b'', event=None, eid=None, retry=None):
+    """
+    Returns bytes of server sent event of data for text/event-stream.
+    Each line of data is its own data field. Empty data with no other field
+    returns comment that keeps connection alive.
+
+    Parameters:
+        data (bytes | str | dict | list): event data. dict or list is json
+        event (str | None): event type. None means default message type
+        eid (str | int | None): event id. None means no id field
+        retry (int | None): reconnection time in milliseconds if any
+    """
+    if isinstance(data, (dict, list)):
+        data = json.dumps(data, separators=(',', ':'))
+    if isinstance(data, str):
+        data = data.encode('utf-8')
     lines = []
-    size = len(msg)
-    lines.append(u"{0:x}\r\n".format(size).encode('ascii'))  # convert to bytes
-    lines.append(msg)
-    lines.append(b'\r\n')
-    return (b''.join(lines))
+    if eid is not None:
+        lines.append(b"id: " + str(eid).encode('utf-8'))
+    if event:
+        lines.append(b"event: " + event.encode('utf-8'))
+    if retry is not None:
+        lines.append(b"retry: " + str(int(retry)).encode('ascii'))
+    for line in data.splitlines():
+        lines.append(b"data: " + line)
+    if not lines:  # comment
+        lines.append(b":")
+    return b"\n".join(lines) + b"\n\n"
 
 def parseLine(raw, eols=(CRLF, LF, CR ), kind="event line"):
     """
@@ -506,6 +603,85 @@ def parseLeader(raw, eols=(CRLF, LF), kind="leader header line", headers=None):
             (yield headers) # leader done
     return
 
+def cutHeading(raw, kind="heading"):
+    """
+    Generator to cut entire heading, start line and leader of header lines,
+    from raw bytearray in one pass without splitting it into lines.
+    Heading ends with empty line. Lines are demarcated by CRLF or LF.
+    Search for end of heading resumes where previous search left off when
+    more bytes arrive. Heading is consumed from raw with one delete.
+    Empty lines before the start line are skipped.
+
+    Yields None If more to parse
+    Returns heading bytes Otherwise up to but excluding the LF that ends the
+        last line so the terminating empty line is not included
+
+    Raise error if heading longer than MAX_HEAD_SIZE
+    """
+    offset = 0  # resume search for end of heading from here
+    while True:
+        if not offset:  # skip empty lines before start line
+            while raw.startswith(CRLF) or raw.startswith(LF):
+                del raw[:2 if raw.startswith(CRLF) else 1]
+
+        end = raw.find(b"\n\r\n", offset)  # LF then empty CRLF line
+        size = 3
+        index = raw.find(b"\n\n", offset)  # LF then empty LF line
+        if index >= 0 and (end < 0 or index < end):  # earlier terminator
+            end, size = index, 2
+
+        if end < 0:  # not found
+            if len(raw) > MAX_HEAD_SIZE:
+                raise HeadTooLong(kind)
+            offset = max(len(raw) - 2, 0)  # terminator may span arrivals
+            (yield None)  # more data needed not done parsing heading
+            continue
+
+        if end > MAX_HEAD_SIZE:  # found but heading too long
+            raise HeadTooLong(kind)
+
+        heading = bytes(raw[:end])
+        del raw[:end + size]  # remove used bytes once
+        return heading
+
+
+def parseHeading(raw, kind="heading", headers=None):
+    """
+    Generator to parse entire heading, start line and leader of header lines,
+    from raw bytearray in one pass.
+    Heading ends with empty line. Lines are demarcated by CRLF or LF.
+    Heading is found by cutHeading then split into lines.
+
+    Yields None If more to parse
+    Yields duple (line, headers) Otherwise where line is bytes start line and
+        headers is cimdict of header lines
+
+    Raise error if heading longer than MAX_HEAD_SIZE or line longer than
+    MAX_LINE_SIZE or more than MAX_HEADERS header lines
+    """
+    headers = headers if headers is not None else cimdict()
+    heading = yield from cutHeading(raw, kind=kind)
+
+    line, sep, leader = heading.partition(LF)
+    lines = leader.decode('iso-8859-1').split("\n") if leader else []
+    if len(lines) > MAX_HEADERS:
+        raise HTTPException("Too many headers, more than {0}".format(MAX_HEADERS))
+    if len(line) > MAX_LINE_SIZE:
+        raise LineTooLong(kind)
+    if line.endswith(CR):
+        line = line[:-1]
+
+    for text in lines:
+        if len(text) > MAX_LINE_SIZE:
+            raise LineTooLong(kind)
+        key, sep, value = text.partition(":")
+        if not sep:
+            raise HTTPException("Invalid {0} '{1}'".format(kind, text))
+        headers[key] = value.strip(" \t\r")
+
+    (yield (line, headers))
+    return
+
 def parseChunk(raw):  # reading transfer encoded raw
     """
     Generator to parse next chunk from raw bytearray
@@ -655,26 +831,48 @@ def parseRequestLine(line):
 
 
 
+# end of server sent event is end of line followed by end of line. Lone CR
+# must not be followed by LF so CRLF is one end of line not two
+EventEnd = re.compile(rb"(?:\r\n|\r(?!\n)|\n)(?:\r\n|\r|\n)")
+
+
 class EventSource(object):
     """
     Server Sent Event Stream Client parser
+    Parses events incrementally from .raw. Each pass resumes scanning at
+    .offset and splits every whole event block found at once then consumes
+    them from .raw with one delete. Each event block is decoded once.
+
+    Events are dicts with id, name, and data items delivered to .callback
+    if any otherwise appended to .events. When .maxevents the oldest event
+    in .events is dropped to append a new one when full and .dropped counts
+    dropped events.
     """
     Bom = codecs.BOM_UTF8 # utf-8 encoded bom b'\xef\xbb\xbf'
 
-    def __init__(self, raw=None, events=None, dictable=False):
+    def __init__(self, raw=None, events=None, dictable=False, callback=None,
+                 maxevents=None):
         """
         Initialize Instance
         raw must be bytearray
         IF events is not None then used passed in deque
             .events will be deque of event odicts
         IF dictable then deserialize event data as json
+        callback = callable given each event instead of appending to .events
+        maxevents = max events in .events before oldest is dropped.
+                    None or 0 means unbounded
 
         """
         self.raw = raw if raw is not None else bytearray()
         self.events = events if events is not None else deque()
         self.dictable = True if dictable else False
+        self.callback = callback
+        self.maxevents = maxevents
+        self.count = 0  # number of events delivered
+        self.dropped = 0  # number of events dropped from full .events
 
         self.parser = None
+        self.offset = 0  # offset in .raw to resume scan for end of event
         self.leid = None  # last event id
         self.bom = None  # bom if any
         self.retry = None  # reconnection time in milliseconds
@@ -689,20 +887,77 @@ class EventSource(object):
         """
         self.closed = True
 
+    def dispatch(self, block):
+        """
+        Parse fields of event block bytes without its terminating empty line
+        and deliver event if it has data.
+        Assigns .leid and .retry if any
+        """
+        text = block.decode('utf-8', errors='replace')  # once per event
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+        ename = u''
+        parts = []
+        for line in text.split('\n'):
+            if not line:  # empty line at start of block ends no event
+                ename = u''
+                parts = []
+                continue
+            field, sep, value = line.partition(':')
+            if not field:  # comment so ignore
+                continue
+            if value[:1] == ' ':
+                value = value[1:]
+
+            if field == u'data':
+                parts.append(value)
+            elif field == u'event':
+                ename = value
+            elif field == u'id':
+                self.leid = value
+            elif field == u'retry':
+                if value.isdigit():
+                    self.retry = int(value)
+
+        if not parts:  # no data so no event
+            return
+
+        edata = u'\n'.join(parts)
+        if self.dictable:
+            try:
+                edata = json.loads(edata, object_pairs_hook=dict)
+            except ValueError as ex:
+                pass  # not json so keep str
+
+        event = dict(id=self.leid, name=ename, data=edata)
+        self.count += 1
+        if self.callback is not None:
+            self.callback(event)
+            return
+        if self.maxevents and len(self.events) >= self.maxevents:
+            self.events.popleft()
+            self.dropped += 1
+        self.events.append(event)
+
     def parseEvents(self):
         """
-        Generator to parse events from .raw bytearray and append to .events
+        Generator to parse events from .raw bytearray and deliver each event
+        to .callback or .events
         Each event is dict with the following items:
              id: event id utf-8 decoded or empty
            name: event name utf-8 decoded or empty
-           data: event data utf-8 decoded
-           json: event data deserialized to dict when applicable pr None
+           data: event data utf-8 decoded or deserialized from json when
+                 .dictable and applicable
 
+        assigns .bom if any at start of .raw
         assigns .retry if any
+        assigns .leid if any
 
         Yields None If waiting for more bytes
-        Yields True When done
+        Yields True When done once .closed
 
+        Raises EventTooLong if no end of event within MAX_EVENT_SIZE bytes
 
         event         = *( comment / field ) end-of-line
         comment       = colon *any-char end-of-line
@@ -718,75 +973,46 @@ class EventSource(object):
         any-char      = a Unicode character other than LF or CR
         Event streams in this format must always be encoded as UTF-8. [RFC3629]
         """
-        eid = self.leid
-        ename = u''
-        edata = u''
-        parts = []
-        ejson = None
-        lineParser = parseLine(raw=self.raw, eols=(CRLF, LF, CR ), kind="event line")
-        while True:
-            line = next(lineParser)
-            if line is None:
-                (yield None)
-                continue
-
-            if not line or self.closed:  # empty line or closed so attempt dispatch
-                if parts:
-                    edata = u'\n'.join(parts)
-                if edata:  # data so dispatch event by appending to .events
-                    if self.dictable:
-                        try:
-                            ejson = json.loads(edata, object_pairs_hook=dict)
-                        except ValueError as ex:
-                            ejson = None
-                        else:  # valid json set edata to ejson
-                            edata = ejson
-
-                    self.events.append(dict([('id', eid),
-                                              ('name', ename),
-                                              ('data', edata),
-                                             ]))
-                if self.closed:  # all done
-                    lineParser.close()  # close generator
-                    break
-                ename = u''
-                edata = u''
-                parts = []
-                ejson = None
-                continue  # parse another event if any
-
-            field, sep, value = line.partition(b':')
-            if sep:  # has colon
-                if not field:  # comment so ignore
-                    # may need to update retry timer here
-                    continue
+        raw = self.raw
+        self.offset = 0
+        size = len(self.Bom)
+        while len(raw) < size and self.Bom.startswith(bytes(raw)):  # maybe bom
+            if self.closed:
+                break
+            (yield None)
+        if raw[:size] == self.Bom:
+            del raw[:size]
+            self.bom = self.Bom.decode('UTF-8')
 
-            field = field.decode('UTF-8')
-            if value and value[0:1] == b' ':
-                del value[0]
-            value = value.decode('UTF-8')
+        while True:
+            start = 0  # start of next event block
+            while (match := EventEnd.search(raw, self.offset)) is not None:
+                self.dispatch(bytes(raw[start:match.start()]))
+                start = self.offset = match.end()
+            if start:
+                del raw[:start]  # consume all dispatched blocks at once
+            # resume where a split end of event could still complete
+            self.offset = max(0, len(raw) - 3)
+
+            if self.closed:  # eof ends event of any whole lines remaining
+                index = max(raw.rfind(LF), raw.rfind(CR))
+                if index >= 0:
+                    self.dispatch(bytes(raw[:index]))
+                del raw[:]
+                self.offset = 0
+                break
 
-            if field == u'event':
-                ename = value
-            elif field == u'data':
-                parts.append(value)
-            elif field == u'id':
-                self.leid = eid = value
-            elif field == u'retry':  #
-                try:
-                    value = int(value)
-                except ValueError as ex:
-                    pass  # ignore
-                else:
-                    self.retry = value
+            if len(raw) > MAX_EVENT_SIZE:
+                raise EventTooLong("event")
+            (yield None)
 
-        (yield (eid, ename, edata))
+        (yield True)
         return
 
     def parseEventStream(self):
         """
         Generator to parse event stream from .raw bytearray stream
-        appends each event to .events deque.
+        delivers each event to .callback or .events deque.
         assigns .bom if any
         assigns .retry if any
         Parses until connection closed
@@ -794,29 +1020,14 @@ class EventSource(object):
         Each event is dict with the following items:
               id: event id utf-8 decoded or empty
             name: event name utf-8 decoded or empty
-            data: event data utf-8 decoded
-            json: event data deserialized to dict when applicable pr None
+            data: event data utf-8 decoded or deserialized from json when
+                  .dictable and applicable
 
         Yields None If waiting for more bytes
         Yields True When completed and sets .ended to True
         If BOM present at beginning of event stream then assigns to .bom and
         deletes.
         Consumes bytearray as it parses
-
-        stream        = [ bom ] *event
-        event         = *( comment / field ) end-of-line
-        comment       = colon *any-char end-of-line
-        field         = 1*name-char [ colon [ space ] *any-char ] end-of-line
-        end-of-line   = ( cr lf / cr / lf / eof )
-        eof           = < matches repeatedly at the end of the stream >
-        lf            = \n 0xA
-        cr            = \r 0xD
-        space         = 0x20
-        colon         = 0x3A
-        bom           = \uFEFF when encoded as utf-8 b'\xef\xbb\xbf'
-        name-char     = a Unicode character other than LF, CR, or :
-        any-char      = a Unicode character other than LF or CR
-        Event streams in this format must always be encoded as UTF-8. [RFC3629]
         """
         self.bom = None
         self.retry = None
@@ -824,27 +1035,15 @@ class EventSource(object):
         self.ended = None
         self.closed = None
 
-        bomParser = parseBom(raw=self.raw, bom=self.Bom)
-        while True:  # parse bom if any
-            bom = next(bomParser)
-            if bom is not None:
-                bomParser.close()  # close generator
-                self.bom = bom.decode('UTF-8')
-                break
-
-            if self.closed:  # no more data so finish
-                bomParser.close()
-                break
-            (yield None)
-
         eventsParser = self.parseEvents()
         while True:  # parse event(s) so far if any
-            result = next(eventParser)
+            result = next(eventsParser)
             if result is not None:
                 eventsParser.close()
                 break
             (yield None)
 
+        self.ended = True
         (yield True)
         return
 
@@ -870,6 +1069,361 @@ class EventSource(object):
             if result is not None:
                 self.parser.close()
                 self.parser = None
+                self.ended = True
+
+
+SpoolFiler = None  # shared Filer of temporary directory of Spool files
+
+
+def spoolFiler():
+    """
+    Returns shared Filer of temporary directory for Spool files.
+    Made on first use. Spool files are removed when their Spool is closed.
+    """
+    global SpoolFiler
+    if SpoolFiler is None or not SpoolFiler.opened:
+        SpoolFiler = filing.Filer(name="spool", temp=True, reopen=True)
+    return SpoolFiler
+
+
+class Spool(object):
+    """
+    Spool is a seekable file like body buffer. It holds body bytes in memory
+    until there are more than .high bytes and then spills them to a file in
+    the temporary directory of a base.filing.Filer so large bodies do not
+    stay in memory. Bytes are appended with .extend. Once .rewind is called
+    the spool is read like a file from its start.
+
+    Closing the spool closes and removes its file.
+
+    Attributes:
+        high (int): max bytes held in memory before spilling to file
+        filer (Filer): Filer of temporary directory of spill file
+        buffer (bytearray): bytes while in memory
+        file (BufferedRandom | BytesIO | None): spill file once spilled or
+            BytesIO of buffer once rewound when not spilled
+        path (str | None): path of spill file once spilled
+        size (int): total number of bytes
+
+    Properties:
+        spilled (bool): True once bytes spilled to file
+    """
+    High = 1048576  # default max bytes in memory
+
+    def __init__(self, high=None, filer=None):
+        """
+        Initialize instance
+
+        Parameters:
+            high (int): max bytes in memory. None means .High
+            filer (Filer): Filer of temporary directory for spill file.
+                None means shared spoolFiler()
+        """
+        self.high = high if high is not None else self.High
+        self.filer = filer
+        self.buffer = bytearray()
+        self.file = None
+        self.path = None
+        self.size = 0
+
+
+    @property
+    def spilled(self):
+        """
+        Returns True once bytes spilled to file
+        """
+        return self.path is not None
+
+
+    def extend(self, data):
+        """
+        Append bytes data spilling to file once more than .high
+        """
+        self.size += len(data)
+        if self.path is None:
+            if self.size <= self.high:
+                self.buffer.extend(data)
+                return
+            self.filer = self.filer if self.filer is not None else spoolFiler()
+            fd, self.path = tempfile.mkstemp(suffix=".body", prefix="spool_",
+                                             dir=self.filer.path)
+            self.file = os.fdopen(fd, "w+b")
+            self.file.write(self.buffer)
+            del self.buffer[:]
+        self.file.write(data)
+
+
+    def rewind(self):
+        """
+        Seek to start for reading
+        """
+        if self.file is None:
+            self.file = io.BytesIO(self.buffer)
+        else:
+            self.file.flush()
+        self.file.seek(0)
+
+
+    def read(self, size=-1):
+        return self.file.read(size)
+
+
+    def readline(self, size=-1):
+        return self.file.readline(size)
+
+
+    def readlines(self, hint=-1):
+        return self.file.readlines(hint)
+
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.file.seek(offset, whence)
+
+
+    def tell(self):
+        return self.file.tell()
+
+
+    def __iter__(self):
+        return iter(self.file)
+
+
+    def __len__(self):
+        return self.size
+
+
+    def close(self):
+        """
+        Close and remove spill file if any
+        """
+        if self.file is not None:
+            self.file.close()
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class Backend(object):
+    """
+    Backend is the pure python parser backend of Parsent. Parsent subclasses
+    get the start line and headers of a message heading from their backend
+    generators and then fill their attributes from them the same way for
+    every backend. Alternative backends subclass Backend and override its
+    methods. Backend is the default and the fallback when an alternative is
+    not installed.
+
+    Class Attributes:
+        Name (str): name of backend for selectBackend
+
+    Methods:
+        requestHeading(raw, kind): generator of request heading
+        statusHeading(raw, kind): generator of response status heading
+        splitUrl(url): returns parts of request url
+    """
+    Name = "python"
+
+    def requestHeading(self, raw, kind="request heading"):
+        """
+        Generator to parse request heading from raw bytearray
+
+        Yields None If more to parse
+        Yields tuple (method, url, version, headers) Otherwise where method,
+            url, and version are str from request line and headers is cimdict
+        """
+        headingParser = parseHeading(raw=raw, kind=kind)
+        while (heading := next(headingParser)) is None:
+            (yield None)
+        line, headers = heading
+        method, url, version = parseRequestLine(line)
+        (yield (method, url, version, headers))
+
+    def statusHeading(self, raw, kind="response heading"):
+        """
+        Generator to parse response heading from raw bytearray
+
+        Yields None If more to parse
+        Yields tuple (version, status, reason, headers) Otherwise where
+            version is str, status is int, reason is str from status line and
+            headers is cimdict
+        """
+        headingParser = parseHeading(raw=raw, kind=kind)
+        while (heading := next(headingParser)) is None:
+            (yield None)
+        line, headers = heading
+        version, status, reason = parseStatusLine(line)
+        (yield (version, status, reason, headers))
+
+    def splitUrl(self, url):
+        """
+        Returns tuple (scheme, hostname, port, path, query, fragment) of
+        request line url with path unquoted and query left quoted per WSGI.
+        hostname and port are None when url is relative.
+        """
+        splits = urlsplit(url)
+        return (splits.scheme, splits.hostname, splits.port,
+                unquote(splits.path), splits.query, splits.fragment)
+
+
+class Heading(object):
+    """
+    Heading is the httptools protocol that collects the parts of a heading
+    fed to a httptools parser by NativeBackend. Its callbacks are the bound
+    builtin methods of its collections so llhttp does not call back into
+    python functions per header line.
+
+    Attributes:
+        url (bytearray): request target from request line
+        reason (bytearray): reason phrase from status line
+        fields (dict): header values keyed by header name as bytes in order
+            where later repeated names replace earlier values
+    """
+    __slots__ = ("url", "reason", "fields", "on_url", "on_status", "on_header")
+
+    def __init__(self):
+        self.url = bytearray()
+        self.reason = bytearray()
+        self.fields = dict()
+        self.on_url = self.url.extend
+        self.on_status = self.reason.extend
+        self.on_header = self.fields.__setitem__
+
+    @property
+    def headers(self):
+        """
+        Returns cimdict of decoded .fields
+        """
+        headers = cimdict()
+        for name, value in self.fields.items():
+            headers[name.decode('iso-8859-1')] = value.decode('iso-8859-1')
+        return headers
+
+
+class NativeBackend(Backend):
+    """
+    NativeBackend is the parser backend that parses headings with the
+    httptools binding of the llhttp C parser. Only available when httptools
+    is installed. The end of the heading is found by cutHeading so only the
+    heading is fed to llhttp and the body is left in raw for the Parsent
+    body parser just like Backend. Lenient about bare LF line endings,
+    http versions, and Transfer-Encoding with Content-Length like Backend.
+    Otherwise llhttp validates the heading more strictly than Backend such
+    as the characters allowed in methods, urls and header names.
+    Lines may be up to MAX_HEAD_SIZE long instead of MAX_LINE_SIZE.
+    See benchmarks/bench_parser.py for throughput versus Backend.
+    """
+    Name = "httptools"
+
+    def __init__(self):
+        if httptools is None:
+            raise HTTPException("Native parser backend requires httptools")
+
+    def feed(self, parser, heading, kind):
+        """
+        Feed heading bytes terminated by empty line to httptools parser.
+        Bare LF line endings are replaced by CRLF since llhttp requires CRLF
+        after the start line.
+        Raise HTTPException subclass when llhttp rejects heading.
+        """
+        if heading.endswith(CR):  # last line ends with CRLF
+            heading = heading[:-1]
+        if heading.count(LF) != heading.count(CRLF):  # some bare LF
+            heading = heading.replace(CRLF, LF).replace(LF, CRLF)
+        parser.set_dangerous_leniencies(lenient_version=True,
+                                        lenient_chunked_length=True,
+                                        lenient_transfer_encoding=True)
+        try:
+            parser.feed_data(heading + CRLF + CRLF)
+        except httptools.HttpParserUpgrade:  # heading parsed before upgrade
+            pass
+        except httptools.HttpParserError as ex:
+            line = heading.partition(LF)[0].rstrip(CR).decode("iso-8859-1")
+            if isinstance(ex, httptools.HttpParserInvalidMethodError):
+                raise BadMethod(line.partition(" ")[0])
+            if isinstance(ex, httptools.HttpParserInvalidStatusError):
+                raise BadStatusLine(line)
+            raise HTTPException("Invalid {0} '{1}' {2}".format(kind, line, ex))
+
+    def requestHeading(self, raw, kind="request heading"):
+        """
+        Generator to parse request heading from raw bytearray
+
+        Yields None If more to parse
+        Yields tuple (method, url, version, headers) Otherwise where method,
+            url, and version are str from request line and headers is cimdict
+        """
+        heading = yield from cutHeading(raw, kind=kind)
+        protocol = Heading()
+        parser = httptools.HttpRequestParser(protocol)
+        self.feed(parser, heading, kind)
+        if len(protocol.fields) > MAX_HEADERS:
+            raise HTTPException("Too many headers, more than {0}".format(MAX_HEADERS))
+        method = parser.get_method().decode("iso-8859-1")
+        if method not in METHODS:
+            raise BadMethod(method)
+        version = "HTTP/" + parser.get_http_version()
+        (yield (method, protocol.url.decode("iso-8859-1"), version,
+                protocol.headers))
+
+    def statusHeading(self, raw, kind="response heading"):
+        """
+        Generator to parse response heading from raw bytearray
+
+        Yields None If more to parse
+        Yields tuple (version, status, reason, headers) Otherwise where
+            version is str, status is int, reason is str from status line and
+            headers is cimdict
+        """
+        heading = yield from cutHeading(raw, kind=kind)
+        protocol = Heading()
+        parser = httptools.HttpResponseParser(protocol)
+        self.feed(parser, heading, kind)
+        if len(protocol.fields) > MAX_HEADERS:
+            raise HTTPException("Too many headers, more than {0}".format(MAX_HEADERS))
+        version = "HTTP/" + parser.get_http_version()
+        reason = u" ".join(protocol.reason.decode("iso-8859-1").split())
+        (yield (version, parser.get_status_code(), reason, protocol.headers))
+
+    def splitUrl(self, url):
+        """
+        Returns tuple (scheme, hostname, port, path, query, fragment) of
+        request line url with path unquoted and query left quoted per WSGI.
+        hostname and port are None when url is relative.
+        Falls back to Backend.splitUrl for urls llhttp does not parse such as *
+        """
+        try:
+            parts = httptools.parse_url(url.encode("iso-8859-1"))
+        except (httptools.HttpParserInvalidURLError, UnicodeEncodeError):
+            return super(NativeBackend, self).splitUrl(url)
+        return ((parts.schema or b"").decode("iso-8859-1").lower(),
+                parts.host.decode("iso-8859-1").lower() if parts.host else None,
+                parts.port,
+                unquote((parts.path or b"").decode("iso-8859-1")),
+                (parts.query or b"").decode("iso-8859-1"),
+                (parts.fragment or b"").decode("iso-8859-1"))
+
+
+Backends = {Backend.Name: Backend, NativeBackend.Name: NativeBackend}
+DefaultBackend = Backend()  # shared default backend instance
+
+
+def selectBackend(backend=None):
+    """
+    Returns parser backend instance for backend
+
+    Parameters:
+        backend (Backend | str | None): Backend instance is returned as is.
+            str is name of backend in Backends such as "httptools".
+            Falls back to DefaultBackend when None or when named backend is not
+            installed.
+    """
+    if backend is None:
+        return DefaultBackend
+    if isinstance(backend, Backend):
+        return backend
+    if backend not in Backends:
+        raise ValueError("Unknown parser backend '{0}'".format(backend))
+    if backend == NativeBackend.Name and httptools is None:
+        return DefaultBackend  # fallback when not installed
+    return Backends[backend]()
 
 
 class Parsent(object):
@@ -879,14 +1433,22 @@ class Parsent(object):
     def __init__(self,
                  msg=None,
                  dictable=None,
-                 method=u'GET'):
+                 method=u'GET',
+                 backend=None,
+                 spoolsize=0,
+                 maxbody=0):
         """
         Initialize Instance
         msg = bytearray of request msg to parse
         dictable = True If should attempt to convert body to json
         method = method of associated request
+        backend = parser Backend instance or name of backend See selectBackend
+        spoolsize = max body bytes kept in memory. Larger bodies are spooled
+                    into .spool that spills to a temporary file. 0 means never
+        maxbody = max body bytes. Larger raises BodyTooLarge. 0 means no limit
         """
         self.msg = msg if msg is not None else bytearray()
+        self.backend = selectBackend(backend)  # parser backend of heading
         self.dictable = True if dictable else False  # convert body json
         self.parser = None  # response parser generator
         self.version = None # HTTP-Version from status line
@@ -910,6 +1472,10 @@ class Parsent(object):
         self.text = u''  # body decoded as unicode string
         self.data = None  # content dict deserialized from body json
         self.method = method.upper() if method else u'GET'
+        self.spoolsize = spoolsize
+        self.maxbody = maxbody
+        self.spool = None  # Spool of body when larger than .spoolsize
+        self.oversized = False  # True when body larger than .maxbody
 
         self.makeParser()  # set up for new msg
 
@@ -945,6 +1511,36 @@ class Parsent(object):
         """
         self.persisted = False
 
+    def checkBody(self, size, kind="body"):
+        """
+        Raise BodyTooLarge and set .oversized when size of body is larger
+        than .maxbody
+        """
+        if self.maxbody and size > self.maxbody:
+            self.oversized = True
+            raise BodyTooLarge(kind, self.maxbody)
+
+    def makeSpool(self):
+        """
+        Returns new Spool of body that may be larger than .spoolsize or None
+        when not spooling or body fits in memory.
+        """
+        if self.spoolsize and (self.length is None or self.length > self.spoolsize):
+            return Spool(high=self.spoolsize)
+        return None
+
+    def endSpool(self):
+        """
+        Finish spooling body into .spool. Body that was not spilled is moved
+        to .body instead. Returns length of body
+        """
+        if not self.spool.spilled:  # fits in memory
+            self.body = self.spool.buffer
+            self.spool = None
+            return len(self.body)
+        self.spool.rewind()
+        return self.spool.size
+
     def parseHead(self):
         """
         Generator to parse headers in heading of .msg
@@ -982,6 +1578,8 @@ class Parsent(object):
         self.closed = False
         self.errored = False
         self.error = None
+        self.spool = None
+        self.oversized = False
 
         while not self.started:
             if self.msg:
@@ -1008,6 +1606,9 @@ class Parsent(object):
         except HTTPException as ex:
             self.errored = True
             self.error = str(ex)
+            if self.spool is not None:  # remove partial body
+                self.spool.close()
+                self.spool = None
 
         self.ended = True
         self.started = False
@@ -9,14 +9,16 @@ import os
 import io
 import json
 import copy
-import datetime
 import mimetypes
+import threading
+import concurrent.futures
 
 from urllib.parse import urlsplit, unquote, quote
+from collections import deque
 from contextlib import contextmanager
 
 from ... import help
-from ...base import doing
+from ...base import doing, tyming
 from .. import tcp
 
 from . import httping
@@ -29,23 +31,326 @@ LF = b"\n"
 CR = b"\r"
 
 
+EnvironKeys = dict()  # interned HTTP_ wsgi environ keys keyed by header name
+MAX_ENVIRON_KEYS = 1024  # max cached environ keys
+
+
+def environKey(name):
+    """
+    Returns interned wsgi environ key of header name, all caps with HTTP_
+    prepended. Keys are cached in EnvironKeys
+    """
+    key = EnvironKeys.get(name)
+    if key is None:
+        if len(EnvironKeys) >= MAX_ENVIRON_KEYS:
+            EnvironKeys.clear()
+        key = EnvironKeys[name] = sys.intern("HTTP_" + name.replace("-", "_").upper())
+    return key
+
+
 #  Class Definitions
 
+class EmptyInput():
+    """
+    EmptyInput is the stateless wsgi.input of requests without a body so one
+    shared instance serves them all instead of making a stream per request
+    """
+    def read(self, size=-1):
+        return b""
+
+
+    def readline(self, size=-1):
+        return b""
+
+
+    def readlines(self, hint=-1):
+        return []
+
+
+    def __iter__(self):
+        return iter(())
+
+
+    def close(self):
+        pass
+
+
+class WorkerPool():
+    """
+    WorkerPool runs blocking WSGI app calls and body iteration of Responders
+    on a bounded concurrent.futures thread pool so that a slow app such as
+    one waiting on a database query does not stall every connection serviced
+    by the Doist thread. At most .workers steps run at once and at most
+    .backlog more wait queued. Once saturated new responses are refused.
+    A running step abandoned past its deadline cannot be stopped so it keeps
+    its worker and counts in .load until it is actually done. Abandoned steps
+    are logged and counted in .abandoned so a starving pool is visible.
+
+    Attributes:
+        workers (int): max worker threads
+        backlog (int): max steps queued beyond running workers
+        load (int): number of submitted steps not yet done
+        abandoned (int): number of abandoned steps still running
+        executor (ThreadPoolExecutor | None): thread pool made on first submit
+
+    Properties:
+        saturated (bool): True when .load reached .workers + .backlog
+
+    Methods:
+        submit(fn) returns future of fn called on worker thread
+        abandon(future) cancels step or counts it as abandoned until done
+        close() shuts down executor
+
+    Hidden:
+        ._lock (threading.Lock): guards .load and .abandoned updated by
+            worker threads
+    """
+    Workers = 4  # default max worker threads
+
+    def __init__(self, workers=None, backlog=None):
+        """
+        Initialize instance
+
+        Parameters:
+            workers (int): max worker threads. None means .Workers
+            backlog (int): max queued steps. None means same as workers
+        """
+        self.workers = workers if workers is not None else self.Workers
+        self.backlog = backlog if backlog is not None else self.workers
+        self.load = 0
+        self.abandoned = 0
+        self.executor = None
+        self._lock = threading.Lock()
+
+
+    @property
+    def saturated(self):
+        """
+        Returns True when .load reached .workers + .backlog
+        """
+        return self.load >= self.workers + self.backlog
+
+
+    def submit(self, fn):
+        """
+        Returns future of fn called on worker thread
+        """
+        if self.executor is None:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                                                max_workers=self.workers,
+                                                thread_name_prefix="hio.wsgi")
+        with self._lock:
+            self.load += 1
+        future = self.executor.submit(fn)
+        future.add_done_callback(self._done)
+        return future
+
+
+    def _done(self, future):
+        """
+        Future done callback that decrements .load
+        """
+        with self._lock:
+            self.load -= 1
+
+
+    def abandon(self, future):
+        """
+        Cancel step of future if still queued. Otherwise step is running so
+        count it in .abandoned until done since its worker is not freed
+
+        Returns True if cancelled False if abandoned while running
+        """
+        if future.cancel():
+            return True
+        with self._lock:
+            self.abandoned += 1
+            abandoned = self.abandoned
+        logger.error("Abandoned running app step past deadline. %s of %s "
+                     "workers held by abandoned steps.\n", abandoned,
+                     self.workers)
+        future.add_done_callback(self._found)
+        return False
+
+
+    def _found(self, future):
+        """
+        Done callback of abandoned future that decrements .abandoned
+        """
+        with self._lock:
+            self.abandoned -= 1
+            abandoned = self.abandoned
+        logger.info("Abandoned app step done. %s of %s workers held by "
+                    "abandoned steps.\n", abandoned, self.workers)
+
+
+    def close(self):
+        """
+        Shutdown executor without waiting for running steps. Cancels queued
+        steps. A later submit makes a new executor
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+class InputStream():
+    """
+    Nonblocking file like WSGI input stream of a request body. Requestant
+    feeds it body bytes incrementally as they are received and decoded so the
+    WSGI app may start reading before the whole body has been received.
+    Requestant stops feeding while .full so buffered body bytes are bounded
+    by about .high and its remoter stops receiving so TCP flow controls the
+    client.
+
+    Reads never block. .read and .readline return None when no bytes are
+    available yet and the body has not ended. They return b"" once the body
+    has ended and all its bytes have been read. Iteration yields lines and
+    yields None while waiting. An app that reads the body should be a
+    generator that yields b"" when it gets None so the server can receive
+    more of the body.
+
+    Usage:
+        def app(environ, start_response):
+            stream = environ['wsgi.input']
+            while (data := stream.read(4096)) != b"":
+                if data is None:  # wait for more
+                    yield b""
+                    continue
+                ...
+
+    Attributes:
+        buffer (bytearray): fed body bytes not yet read
+        high (int): high water mark of .buffer in bytes
+        size (int): total number of body bytes fed
+        ended (bool): True once whole body has been fed
+        errored (bool): True if body failed such as connection closed
+        error (str | None): error description when errored
+
+    Properties:
+        full (bool): True when .buffer holds .high or more bytes
+    """
+    High = 65536  # default high water mark of buffer
+
+    def __init__(self, high=None):
+        """
+        Initialize instance
+
+        Parameters:
+            high (int): high water mark of buffer. None means .High
+        """
+        self.buffer = bytearray()
+        self.high = high if high is not None else self.High
+        self.size = 0
+        self.ended = False
+        self.errored = False
+        self.error = None
+
+
+    @property
+    def full(self):
+        """
+        Returns True when .buffer holds .high or more bytes
+        """
+        return len(self.buffer) >= self.high
+
+
+    def extend(self, data):
+        """
+        Feed body bytes data
+        """
+        self.buffer.extend(data)
+        self.size += len(data)
+
+
+    def read(self, size=-1):
+        """
+        Returns up to size bytes of body, all available bytes when size is
+        negative or None. Returns None when none available yet, b"" at end.
+        Raises OSError when errored
+        """
+        if self.errored:
+            raise OSError(self.error)
+        if not self.buffer:
+            return b"" if self.ended else None
+        if size is None or size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+    def readline(self, size=-1):
+        """
+        Returns next line of body including its LF or up to size bytes of it
+        when size is not negative. Returns partial line when body ended or
+        .buffer is full. Returns None when no line available yet, b"" at end.
+        Raises OSError when errored
+        """
+        if self.errored:
+            raise OSError(self.error)
+        if size == 0:
+            return b""
+        end = self.buffer.find(LF) + 1  # 0 when not found
+        if (size is not None and 0 < size <= len(self.buffer) and
+                (not end or end > size)):
+            end = size
+        if not end:  # no complete line
+            if not self.ended and not self.full:
+                return None
+            end = len(self.buffer)  # partial line or b"" at end
+        return self.read(end) if end else b""
+
+
+    def readlines(self, hint=-1):
+        """
+        Returns list of available lines until about hint bytes when hint is
+        positive. May be short when waiting for more.
+        """
+        lines = []
+        total = 0
+        while (line := self.readline()):
+            lines.append(line)
+            total += len(line)
+            if hint is not None and 0 < hint <= total:
+                break
+        return lines
+
+
+    def __iter__(self):
+        """
+        Generator of lines until end. Yields None while waiting for more
+        """
+        while (line := self.readline()) != b"":
+            yield line
+
+
+    def close(self):
+        """
+        WSGI apps must not close wsgi.input so nothing to do
+        """
+
+
 class Requestant(httping.Parsent):
     """
     Nonblocking HTTP Server Requestant class
     Parses request msg
     """
 
-    def __init__(self, remoter=None, **kwa):
+    def __init__(self, remoter=None, streamable=False, **kwa):
         """
         Initialize Instance
         Parameters:
             remoter = Remoter incoming connection instance
+            streamable = True means feed body of request into .stream
+                         instead of collecting it in .body
 
         """
         super(Requestant, self).__init__(**kwa)
         self.remoter = remoter
+        self.streamable = True if streamable else False
+        self.stream = None  # InputStream of body when streamable and body
+        self.dispatched = False  # True once streamed request queued for app
         self.url = u''   # full path in request line either relative or absolute
         self.scheme = u''  # scheme used in request line path
         self.hostname = u''  # hostname used in request line path
@@ -53,8 +358,21 @@ class Requestant(httping.Parsent):
         self.path = u''  # partial path in request line without scheme host port query fragment
         self.query = u'' # query string from full path
         self.fragment = u''  # fragment from full path
+        self.count = 0  # number of requests parsed on connection
         # self.headers = None  # never received a request
 
+    def close(self):
+        """
+        Assign True to .closed and fail .stream if body not yet ended.
+        Close .spool if body not yet ended
+        """
+        super(Requestant, self).close()
+        if self.stream is not None and not self.stream.ended:
+            self.stream.errored = True
+            self.stream.error = "Connection closed while streaming request body"
+        if self.spool is not None and not self.bodied:  # never dispatched
+            self.spool.close()
+
     def checkPersisted(self):
         """
         Checks headers to determine if connection should be kept open until
@@ -79,9 +397,6 @@ class Requestant(httping.Parsent):
             if connection and "keep-alive" in connection.lower():
                 self.persisted = True
 
-        if self.persisted:  # override timeout so server never timesout
-            self.remoter.tymeout =  0.0  # never timesout
-
 
     def parseHead(self):
         """
@@ -95,20 +410,20 @@ class Requestant(httping.Parsent):
         self.headers = help.Hict()
 
         # create generator
-        lineParser = httping.parseLine(raw=self.msg, eols=(CRLF, LF), kind="status line")
-        while True:  # parse until we get full start line
+        headingParser = self.backend.requestHeading(raw=self.msg,
+                                                    kind="request heading")
+        while True:  # parse until we get full heading
             if self.closed:  # connection closed prematurely
                 raise httping.PrematureClosure("Connection closed unexpectedly "
-                                               "while parsing request start line")
+                                               "while parsing request heading")
 
-            line = next(lineParser)
-            if line is None:
-                (yield None)
-                continue
-            lineParser.close()  # close generator
-            break
+            heading = next(headingParser)
+            if heading is not None:
+                headingParser.close()  # close generator
+                break
+            (yield None)
 
-        method, url, version = httping.parseRequestLine(line)
+        method, url, version, headers = heading
 
         self.method = method
         self.url = url.strip()
@@ -122,27 +437,10 @@ class Requestant(httping.Parsent):
             self.version = (1, 1)  # use HTTP/1.1 code for HTTP/1.x where x>=1
 
 
-        pathSplits = urlsplit(self.url)
-        self.path = unquote(pathSplits.path)  # unquote non query path portion here
-        self.scheme = pathSplits.scheme
-        self.hostname = pathSplits.hostname
-        self.port = pathSplits.port
-        self.query = pathSplits.query  # WSGI spec leaves it quoted do not unquote
-        self.fragment = pathSplits.fragment
+        # path is unquoted here, WSGI spec leaves query quoted do not unquote
+        (self.scheme, self.hostname, self.port, self.path, self.query,
+         self.fragment) = self.backend.splitUrl(self.url)
 
-        leaderParser = httping.parseLeader(raw=self.msg,
-                                   eols=(CRLF, LF),
-                                   kind="leader header line")
-        while True:
-            if self.closed:  # connection closed prematurely
-                raise httping.PrematureClosure("Connection closed unexpectedly "
-                                               "while parsing request header")
-
-            headers = next(leaderParser)
-            if headers is not None:
-                leaderParser.close()
-                break
-            (yield None)
         self.headers.update(headers)
 
         # are we using the chunked-style of transfer encoding?
@@ -183,6 +481,12 @@ class Requestant(httping.Parsent):
         # Should connection be kept open until client closes
         self.checkPersisted()  # sets .persisted
 
+        if self.streamable and (self.chunked or self.length):
+            self.stream = InputStream()  # body fed to stream as it arrives
+        else:
+            self.stream = None
+        self.dispatched = False
+
         self.headed = True
         yield True
         return
@@ -190,6 +494,11 @@ class Requestant(httping.Parsent):
     def parseBody(self):
         """
         Parse body
+        When .stream feed body bytes to it as they arrive instead of .body
+        and pause while .stream is full.
+        Otherwise when body may be larger than .spoolsize feed body bytes to
+        .spool as they arrive which spills them to a temporary file.
+        Raise BodyTooLarge when body larger than .maxbody
         """
         if self.bodied:
             return  # already parsed the body
@@ -197,15 +506,27 @@ class Requestant(httping.Parsent):
         if self.length and self.length < 0:
             raise ValueError("Invalid content length of {0}".format(self.length))
 
+        if self.length:
+            self.checkBody(self.length, kind="request body")
+
         del self.body[:]  # self.body.clear() clear body python2 bytearrays don't clear
+        stream = self.stream
+        self.spool = self.makeSpool() if stream is None else None
+        sink = stream if stream is not None else self.spool  # fed as arrives
+        body = sink if sink is not None else self.body  # extended by chunks
 
         if self.chunked:  # chunked takes precedence over length
             self.parms = dict()
+            total = 0  # size of body so far
             while True:  # parse all chunks here
                 if self.closed:  # connection closed prematurely
                     raise httping.PrematureClosure("Connection closed unexpectedly"
                                                    " while parsing request body chunk")
 
+                if stream is not None and stream.full:  # wait for app to read
+                    (yield None)
+                    continue
+
                 chunkParser = httping.parseChunk(raw=self.msg)
                 while True:  # parse another chunk
                     result = next(chunkParser)
@@ -220,7 +541,9 @@ class Requestant(httping.Parsent):
                     self.parms.update(parms)
 
                 if size:  # size non zero so append chunk but keep iterating
-                    self.body.extend(chunk)
+                    total += size
+                    self.checkBody(total, kind="request body")
+                    body.extend(chunk)
 
                     if self.closed:  # no more data so finish
                         chunkParser.close()
@@ -232,6 +555,21 @@ class Requestant(httping.Parsent):
                     chunkParser.close()
                     break
 
+        elif sink is not None:  # known content length fed as it arrives
+            while sink.size < self.length:
+                if self.msg and (stream is None or not stream.full):
+                    size = min(self.length - sink.size, len(self.msg))
+                    if stream is not None:  # bounded by free space of stream
+                        size = min(size, stream.high - len(stream.buffer))
+                    sink.extend(self.msg[:size])
+                    del self.msg[:size]
+                    continue
+
+                if self.closed:  # connection closed prematurely
+                    raise httping.PrematureClosure("Connection closed unexpectedly"
+                                                   " while parsing request body")
+                (yield None)
+
         elif self.length != None:  # known content length
             while len(self.msg) < self.length:
                 if self.closed:  # connection closed prematurely
@@ -248,7 +586,13 @@ class Requestant(httping.Parsent):
 
         # only gets to here once content length has become finite
         # closed or not chunked or chunking has ended
-        self.length = len(self.body)
+        if stream is not None:
+            stream.ended = True
+            self.length = stream.size
+        elif self.spool is not None:
+            self.length = self.endSpool()
+        else:
+            self.length = len(self.body)
         self.bodied = True
         (yield True)
         return
@@ -261,13 +605,21 @@ class Responder():
     """
     HttpVersionString = httping.HTTP_11_VERSION_STRING  # http version string
     Delay = 1.0
+    Statics = httping.packStatics([(u'Server', u"Ioflo WSGI Server")])
+    # names of pre-encoded app headers also decoded into .headers
+    Inspects = (b'content-length', b'content-type', b'transfer-encoding',
+                b'connection', b'date', b'server')
 
     def __init__(self,
                  incomer,
                  app,
                  environ,
                  chunkable=False,
-                 delay=None):
+                 delay=None,
+                 persisted=True,
+                 statics=None,
+                 pool=None,
+                 deadline=0.0):
         """
         Initialize Instance
         Parameters:
@@ -275,12 +627,31 @@ class Responder():
             app = wsgi app callable
             environ = wsgi environment dict
             chunkable = True if may send body in chunks
+            persisted = False if connection closes after response so send
+                        Connection: close header
+            statics = pre-encoded constant headers from httping.packStatics
+                      added unless app provides them. None means .Statics
+            pool = WorkerPool that runs app and body iteration on worker
+                   threads while .service polls for each step without
+                   blocking. None means run app inline
+            deadline = seconds for pooled app to finish response. Past
+                       deadline response is 503 and app is abandoned.
+                       0.0 means no deadline
+
+        environ of each response gets 'hio.responder' of this responder so an
+        app may queue pre-encoded bytes directly such as with EventHub.
+
+        App response_headers whose field and value are bytes are pre-encoded
+        and sent as is without Hict normalization. They are kept in .raws
+        not .headers except those named in .Inspects.
         """
         status = "200 OK"  # integer or string with reason, WSGI is string with reason
         self.incomer = incomer
         self.app = app
         self.environ = environ
+        environ['hio.responder'] = self  # so app may push such as EventHub
         self.chunkable = True if chunkable else False
+        self.persisted = True if persisted else False
         self.started = False  # True once start called (start_response)
         self.headed = False  # True once headers sent
         self.chunked = False  # True if should send in chunks
@@ -289,9 +660,17 @@ class Responder():
         self.iterator = None  # iterator on application body
         self.status = status
         self.headers = help.Hict()  # headers
+        self.raws = []  # pre-encoded header lines from app
+        self.statics = statics if statics is not None else self.Statics
         self.length = None  # if content-length provided must not exceed
         self.size = 0  # number of body bytes sent so far
         self.evented = False  # True if response is event-stream
+        self.pool = pool
+        self.deadline = deadline
+        self.future = None  # future of pending app step on .pool
+        self.outbox = deque()  # msgs from write callable of worker thread
+        self.tymer = None  # deadline tymer once app submitted to .pool
+        self.abandoned = False  # True once app abandoned past deadline
 
 
     def close(self):
@@ -302,26 +681,65 @@ class Responder():
             self.write(b'')  # in case chunked send empty chunk to terminate
         self.ended = True
         self.closed = True
+        self.closeIterator()
+
+
+    def closeIterator(self, future=None):
+        """
+        Close app body iterable if any as wsgi requires once response ended
+        or aborted. When a step of app still runs on .pool worker thread the
+        iterable is closed by that thread once the step is done.
 
+        Parameters:
+            future (Future | None): done step future when called back
+        """
+        if future is None:
+            if self.abandoned:  # closed by abandoned step's done callback
+                return
+            if self.future is not None and not self.future.done():
+                self.future.add_done_callback(self.closeIterator)
+                return
+        iterator, self.iterator = self.iterator, None
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception as ex:
+                logger.error("Error closing app body iterable.\n%s\n", ex)
 
-    def reset(self, environ, chunkable=None):
+
+    def reset(self, environ, chunkable=None, persisted=None, app=None):
         """
         Reset attributes for another request-response
         """
+        self.closeIterator()  # of prior response if not yet closed
         self.environ = environ
+        environ['hio.responder'] = self
+
+        if app is not None:
+            self.app = app
 
         if self.chunkable is not None:
             self.chunkable = chunkable
 
+        if persisted is not None:
+            self.persisted = True if persisted else False
+
         self.started = False
         self.headed = False
         self.chunked = False
+        self.evented = False
         self.ended = False
         self.iterator = None
         self.status = "200 OK"
         self.headers = help.Hict()
+        self.raws = []
         self.length = None
         self.size = 0
+        self.future = None
+        self.outbox.clear()
+        self.tymer = None
+        self.abandoned = False
 
 
     def build(self):
@@ -347,21 +765,35 @@ class Responder():
         lines.append(startLine)
 
         # Override if AttributiveGenerator
-        self.headers.update(getattr(self.iterator, '_headers', help.Hict()))
+        headers = self.headers
+        _headers = getattr(self.iterator, '_headers', None)
+        if _headers:
+            headers.update(_headers)
 
-        if u'server' not in self.headers:  # create Server header
-            self.headers[u'server'] = "Ioflo WSGI Server"
+        for name, value in headers.items():
+            lines.append(httping.packHeader(name, value))
+        lines.extend(self.raws)
 
-        if u'date' not in self.headers:  # create Date header
-            self.headers[u'date'] = httping.httpDate1123(datetime.datetime.utcnow())
+        # default headers are pre-encoded and only recorded in .headers
+        for name, value, line in self.statics:  # such as Server header
+            if name not in headers:
+                headers[name] = value
+                lines.append(line)
 
-        if self.chunkable and ('transfer-encoding' not in self.headers or
-                               self.headers['transfer-encoding'] == 'chunked'):
-            self.chunked = True
-            self.headers[u'transfer-encoding'] = u'chunked'
+        if u'date' not in headers:  # create Date header
+            headers[u'date'] = httping.httpDateNow()
+            lines.append(httping.httpDateNow(packed=True))
 
-        for name, value in self.headers.items():
-            lines.append(httping.packHeader(name, value))
+        if not self.persisted and u'connection' not in headers:
+            headers[u'connection'] = u'close'
+            lines.append(b"Connection: close")
+
+        if self.chunkable and ('transfer-encoding' not in headers or
+                               headers['transfer-encoding'] == 'chunked'):
+            self.chunked = True
+            if u'transfer-encoding' not in headers:
+                headers[u'transfer-encoding'] = u'chunked'
+                lines.append(b"Transfer-Encoding: chunked")
 
         lines.extend((b"", b""))
         head = CRLF.join(lines)  # b'/r/n'
@@ -373,6 +805,8 @@ class Responder():
         """
         WSGI write callback This writes out the headers the first time its called
         otherwise writes the msg bytes
+        Head, chunk framing, and msg are each queued separately so when
+        incomer .txbs is Reel they are sent as segments without concatenation
         """
         if not self.started:
             raise AssertionError("WSGI write() before start_response()")
@@ -383,7 +817,9 @@ class Responder():
             self.headed = True
 
         if self.chunked:
-            msg = httping.packChunk(msg)
+            for part in httping.packChunkParts(msg):
+                self.incomer.tx(part)
+            return
 
         if self.length is not None:  # limit total size to length
             size = self.size + len(msg)
@@ -445,7 +881,21 @@ class Responder():
             raise AssertionError("Already started!")
 
         self.status = status
-        self.headers = help.Hict(response_headers)
+        self.raws = []
+        if (isinstance(response_headers, (list, tuple)) and
+                any(isinstance(header[0], bytes) for header in response_headers)):
+            # bytes fields are pre-encoded so bypass Hict
+            self.headers = help.Hict()
+            for name, value in response_headers:
+                if isinstance(name, bytes):
+                    if name.lower() not in self.Inspects:
+                        self.raws.append(name + b": " + value)
+                        continue
+                    name = name.decode('iso-8859-1')
+                    value = value.decode('iso-8859-1')
+                self.headers.add(name, value)
+        else:
+            self.headers = help.Hict(response_headers)
 
         if u'content-length' in self.headers:
             self.length = int(self.headers['content-length'])
@@ -458,19 +908,82 @@ class Responder():
                     self.evented = True
 
         self.started = True
-        return self.write
+        # write callable of worker thread queues for .service to write
+        return self.write if self.pool is None else self.outbox.append
+
+
+    def step(self):
+        """
+        Returns next msg of app body iterator initiating app first if needed.
+        Run on worker thread of .pool
+        """
+        if self.iterator is None:  # initiate application
+            self.iterator = iter(self.app(self.environ,
+                                          start_response=self.start))
+        return next(self.iterator)
+
+
+    def poll(self):
+        """
+        Returns True once pending app step on .pool is done. Submits next
+        step when none pending. Raises HTTPError 503 when .pool is saturated
+        before the app started or when .deadline expired before headed.
+        Past deadline once headed the response is ended instead.
+        """
+        if self.future is None:
+            if self.iterator is None:  # new response
+                if self.pool.saturated:
+                    self.persisted = False  # shed load
+                    raise httping.HTTPError(httping.SERVICE_UNAVAILABLE,
+                                            title="Worker pool saturated",
+                                            headers={'Retry-After': '1'})
+                if self.deadline and self.incomer.tymth:
+                    self.tymer = tyming.Tymer(tymth=self.incomer.tymth,
+                                              duration=self.deadline)
+            self.future = self.pool.submit(self.step)
+
+        while self.outbox:  # write callable of worker thread
+            self.write(self.outbox.popleft())
+
+        if self.future.done():
+            return True
+
+        if self.tymer is not None and self.tymer.expired:  # abandon app
+            future, self.future = self.future, None
+            self.pool.abandon(future)  # counted until done
+            future.add_done_callback(self.closeIterator)  # once step done
+            self.abandoned = True
+            self.persisted = False
+            if self.headed:
+                logger.error("Deadline expired streaming body after headers "
+                             "sent.\n")
+                self.write(b'')  # in case chunked send empty chunk to terminate
+                self.ended = True
+                return False
+            raise httping.HTTPError(httping.SERVICE_UNAVAILABLE,
+                                    title="Deadline expired")
+        return False
 
 
     def service(self):
         """
         Service wsgi compatible application
+        With .pool each app step runs on a worker thread and is polled
         """
         if not self.closed and not self.ended:
-            if self.iterator is None:  # initiate application
-                self.iterator = iter(self.app(self.environ,
-                                              start_response=self.start))
             try:
-                msg = next(self.iterator)
+                if self.pool is not None:  # app runs on worker threads
+                    if not self.poll():
+                        return  # step still pending
+                    while self.outbox:  # write callable of worker thread
+                        self.write(self.outbox.popleft())
+                    future, self.future = self.future, None
+                    msg = future.result()
+                else:
+                    if self.iterator is None:  # initiate application
+                        self.iterator = iter(self.app(self.environ,
+                                                      start_response=self.start))
+                    msg = next(self.iterator)
             except StopIteration as ex:
                 if hasattr(ex, "value") and ex.value:
                     self.write(ex.value)  # new style generators in python3.3+
@@ -500,6 +1013,9 @@ class Responder():
                     if self.length is not None and self.size >= self.length:
                         self.ended = True
 
+            if self.ended:
+                self.closeIterator()
+
 
 @contextmanager
 def openServer(cls=None, **kwa):
@@ -538,6 +1054,16 @@ class Server():
     Server WSGI HTTP Server Class
     """
     Tymeout = 5.0  # default tcp server connection tymeout
+    KeepTymeout = 5.0  # default idle tymeout between requests on keep-alive
+    HeadTymeout = 20.0  # default tymeout to read request head once started
+    MaxRequests = 0  # default max requests per connection. 0 means no limit
+    Pipelines = 8  # default max pipelined requests parsed ahead per connection
+    SpoolSize = 0  # default max request body bytes in memory. 0 means no spool
+    MaxBody = 0  # default max request body bytes. 0 means no limit
+    Workers = 0  # default worker threads of blocking apps. 0 means run inline
+    Deadline = 0.0  # default seconds for pooled app response. 0.0 means none
+    Empty = EmptyInput()  # shared wsgi.input of bodiless requests
+    Protocols = {(1, 1): "HTTP/1.1", (1, 0): "HTTP/1.0"}  # SERVER_PROTOCOL by version
 
     def __init__(self,
                  name="hio.wsgi.server",
@@ -553,6 +1079,18 @@ class Server():
                  eha=None,
                  scheme=u'',
                  tymeout=None,
+                 keeptymeout=None,
+                 headtymeout=None,
+                 maxrequests=None,
+                 pipelines=None,
+                 backend=None,
+                 streamable=False,
+                 spoolsize=None,
+                 maxbody=None,
+                 statics=None,
+                 workers=None,
+                 backlog=None,
+                 deadline=None,
                  **kwa):
         """
         Initialization method for instance.
@@ -576,6 +1114,37 @@ class Server():
                 for servant and WSGI environment
             kwa needed to pass additional parameters to servant
             tymeout is tymeout in seconds for dropping idle connections
+            keeptymeout is tymeout in seconds for dropping keep-alive
+                connections idle between requests. 0.0 means never
+            headtymeout is tymeout in seconds to finish reading request head
+                once started. Not restarted by activity. 0.0 means use tymeout
+            maxrequests is max requests per connection after which response
+                has Connection: close and connection is closed. 0 means no limit
+            pipelines is max pipelined requests per connection parsed ahead
+                and queued while a response is in progress. 0 means parse
+                next request only once response ended
+            backend is parser backend of requestants, Backend instance or
+                name such as "httptools". None means pure python default
+            streamable is True means requests with a body are queued for the
+                app once headed with wsgi.input a nonblocking InputStream fed
+                as the body arrives instead of once the whole body is buffered.
+                App must be a generator that yields b"" to wait for more body
+            spoolsize is max request body bytes kept in memory. Larger bodies
+                are spooled to a temporary file and wsgi.input is the seekable
+                httping.Spool of the file. 0 means never spool
+            maxbody is max request body bytes. Larger gets 413 response and
+                connection is closed. 0 means no limit
+            statics is dict of constant response headers such as Server added
+                to every response unless the app provides them.
+                None means Responder.Statics
+            workers is max worker threads of a WorkerPool that runs blocking
+                app calls and body iteration off the Doist thread.
+                0 means run app inline on the Doist thread
+            backlog is max app steps queued beyond running workers. Once
+                saturated new requests get 503 response.
+                None means same as workers
+            deadline is seconds for pooled app to finish its response. Past
+                deadline response is 503 and app is abandoned. 0.0 means none
 
         Attributes:
             .app is wsgi application callable
@@ -583,6 +1152,27 @@ class Server():
             .reps is dict of running Wsgi Responder instances keyed by ca
             .servant is instance of Server or ServerTls or None
             .tymeout is tymeout in seconds for dropping idle connections
+            .keeptymeout is tymeout in seconds for dropping idle keep-alive
+                connections between requests
+            .headtymeout is tymeout in seconds to read request head
+            .maxrequests is max requests per connection. 0 means no limit
+            .pipelines is max pipelined requests per connection parsed ahead
+            .pipes is dict of deques of parsed requests awaiting response as
+                (environ, persisted, chunkable, app) tuples keyed by ca
+            .backend is parser backend of requestants
+            .streamable is True if request bodies are streamed to the app
+            .spoolsize is max request body bytes in memory
+            .maxbody is max request body bytes
+            .statics is constant response headers pre-encoded once
+            .template is dict of static wsgi environ entries copied per request
+            .pool is WorkerPool of blocking app or None when inline
+            .deadline is seconds for pooled app response
+            .readies is set of ca of connections that received on the last
+                pass when servant is polled
+            .actives is set of ca of connections with pending work such as
+                an unfinished response or queued requests when servant is
+                polled. Only .readies and .actives are serviced each pass so
+                idle keep-alive connections cost nothing
             .scheme is http scheme http or https for servant and environment
             .secured is Boolean true if TLS
 
@@ -596,6 +1186,24 @@ class Server():
 
         if tymeout is None:
             tymeout = self.Tymeout
+        self.tymeout = tymeout
+        self.keeptymeout = (keeptymeout if keeptymeout is not None
+                            else self.KeepTymeout)
+        self.headtymeout = (headtymeout if headtymeout is not None
+                            else self.HeadTymeout)
+        self.maxrequests = (maxrequests if maxrequests is not None
+                            else self.MaxRequests)
+        self.pipelines = pipelines if pipelines is not None else self.Pipelines
+        self.pipes = dict()  # queued parsed requests keyed by ca
+        self.backend = httping.selectBackend(backend)
+        self.streamable = True if streamable else False
+        self.spoolsize = spoolsize if spoolsize is not None else self.SpoolSize
+        self.maxbody = maxbody if maxbody is not None else self.MaxBody
+        self.statics = (httping.packStatics(statics) if statics is not None
+                        else Responder.Statics)
+        workers = workers if workers is not None else self.Workers
+        self.pool = WorkerPool(workers=workers, backlog=backlog) if workers else None
+        self.deadline = deadline if deadline is not None else self.Deadline
 
         ha = ha or (host, port)  # ha = host address takes precendence over host, port
         if servant:
@@ -650,6 +1258,9 @@ class Server():
 
         self.secured = secured
         self.servant = servant
+        self.template = None  # static wsgi environ entries made by .makeTemplate
+        self.readies = set()  # ca of connections received last pass
+        self.actives = set()  # ca of connections with pending work
 
 
     def wind(self, tymth):
@@ -684,6 +1295,9 @@ class Server():
         # just in case there is an orphan ix
         self.servant.close()
 
+        if self.pool is not None:
+            self.pool.close()
+
 
     def idle(self):
         """
@@ -700,31 +1314,61 @@ class Server():
                 if not responder.ended:
                     idle = False
                     break
+        if idle:
+            for pipe in self.pipes.values():
+                if pipe:
+                    idle = False
+                    break
         return idle
 
-    def buildEnviron(self, requestant):
+    def makeTemplate(self):
         """
-        Returns wisgi environment dictionary for supplied requestant
+        Returns dict of wsgi environ entries that are the same for every
+        request of this server
         """
-        environ = dict()  # maybe should be mudict for cookies or other repeated headers
+        template = dict()
 
         # WSGI variables
-        environ['wsgi.version'] = (1, 0)
-        environ['wsgi.url_scheme'] = self.scheme
-        environ['wsgi.input'] = io.BytesIO(requestant.body)
-        environ['wsgi.errors'] = sys.stderr
-        environ['wsgi.multithread'] = False
-        environ['wsgi.multiprocess'] = False
-        environ['wsgi.run_once'] = False
-        environ["wsgi.server_name"] = self.name
-        environ["wsgi.server_version"] = (1, 0)
+        template['wsgi.version'] = (1, 0)
+        template['wsgi.url_scheme'] = self.scheme
+        template['wsgi.errors'] = sys.stderr
+        template['wsgi.multithread'] = self.pool is not None
+        template['wsgi.multiprocess'] = False
+        template['wsgi.run_once'] = False
+        template["wsgi.server_name"] = self.name
+        template["wsgi.server_version"] = (1, 0)
+
+        # Required CGI variables
+        template['SERVER_NAME'] = self.servant.eha[0]      # localhost
+        template['SERVER_PORT'] = str(self.servant.eha[1])  # 8888
+        template['SCRIPT_NAME'] = u''
+        return template
+
+
+    def buildEnviron(self, requestant):
+        """
+        Returns wisgi environment dictionary for supplied requestant
+        Copies .template of static entries then adds request entries
+        """
+        if self.template is None:
+            self.template = self.makeTemplate()
+        environ = self.template.copy()  # maybe should be mudict for cookies or other repeated headers
+
+        if requestant.stream is not None:  # body fed as it arrives
+            environ['wsgi.input'] = requestant.stream
+            environ['wsgi.input_terminated'] = True
+        elif requestant.spool is not None:  # body spilled to file
+            environ['wsgi.input'] = requestant.spool
+        elif requestant.body:
+            environ['wsgi.input'] = io.BytesIO(requestant.body)
+        else:  # bodiless shares stateless empty input
+            environ['wsgi.input'] = self.Empty
 
         # Required CGI variables
         environ['REQUEST_METHOD'] = requestant.method      # GET
-        environ['SERVER_NAME'] = self.servant.eha[0]      # localhost
-        environ['SERVER_PORT'] = str(self.servant.eha[1])  # 8888
-        environ['SERVER_PROTOCOL'] = "HTTP/{0}.{1}".format(*requestant.version)  # used by request http/1.1
-        environ['SCRIPT_NAME'] = u''
+        version = requestant.version
+        environ['SERVER_PROTOCOL'] = (self.Protocols.get(version) or
+                                      "HTTP/{0}.{1}".format(*version))  # used by request http/1.1
         environ['PATH_INFO'] = quote(requestant.path)        # /hello?name=john
 
         # Optional CGI variables
@@ -735,13 +1379,38 @@ class Server():
             environ['CONTENT_LENGTH'] = str(requestant.length)
 
         # recieved http headers mapped to all caps with HTTP_ prepended
-        for key, value in requestant.headers.items():
-            key = "HTTP_" + key.replace("-", "_").upper()
-            environ[key] = value
+        keys = EnvironKeys
+        for name, value in requestant.headers.items():
+            key = keys.get(name)
+            environ[key if key is not None else environKey(name)] = value
 
         return environ
 
 
+    @staticmethod
+    def closeInput(environ):
+        """
+        Close wsgi.input of environ such as Spool which removes its file
+        """
+        stream = environ.get('wsgi.input')
+        if stream is not None:
+            stream.close()
+
+
+    @staticmethod
+    def tooLarge(environ, start_response):
+        """
+        WSGI app of 413 response to request with body larger than .maxbody
+        """
+        body = httping.HTTPError(httping.REQUEST_ENTITY_TOO_LARGE).render()
+        start_response("{0} {1}".format(httping.REQUEST_ENTITY_TOO_LARGE,
+                                        httping.STATUS_DESCRIPTIONS[
+                                            httping.REQUEST_ENTITY_TOO_LARGE]),
+                       [('Content-Type', 'text/plain'),
+                        ('Content-Length', str(len(body)))])
+        return [body]
+
+
     def closeConnection(self, ca):
         """
         Close and remove connection given by ca
@@ -751,37 +1420,138 @@ class Server():
             del self.reqs[ca]
         if ca in self.reps:
             self.reps[ca].close()  # this signals response handler
+            self.closeInput(self.reps[ca].environ)
             if ca in self.servant.ixes:
                 self.servant.ixes[ca].serviceSends()  #  send final bytes to socket
             del self.reps[ca]
+        if ca in self.pipes:
+            for environ, persisted, chunkable, app in self.pipes[ca]:
+                self.closeInput(environ)
+            del self.pipes[ca]
+        self.readies.discard(ca)
+        self.actives.discard(ca)
         self.servant.removeIx(ca)
 
 
+    def retymeout(self, requestant):
+        """
+        Switch tymeout of requestant's remoter to that of its parse phase.
+        Reading a started head is bounded by .headtymeout which activity does
+        not restart so slow clients cannot hold the connection. Reading the
+        body and responding use idle .tymeout. Waiting for the next request
+        on a keep-alive connection uses .keeptymeout set by .serviceReps
+        """
+        if requestant.headed:
+            tymeout, refreshable = self.tymeout, True
+        elif requestant.started:
+            if self.headtymeout > 0.0:
+                tymeout, refreshable = self.headtymeout, False
+            else:
+                tymeout, refreshable = self.tymeout, True
+        else:  # still waiting for request
+            return
+        remoter = requestant.remoter
+        if remoter.tymeout != tymeout or remoter.refreshable != refreshable:
+            remoter.retymeout(tymeout, refreshable=refreshable)
+
+
+    def makeRequestant(self, ix):
+        """
+        Returns new Requestant of incomer ix with .msg its .rxbs
+        """
+        return Requestant(msg=ix.rxbs, remoter=ix,
+                          backend=self.backend,
+                          streamable=self.streamable,
+                          spoolsize=self.spoolsize,
+                          maxbody=self.maxbody)
+
+
+    def activate(self, ca):
+        """
+        Add ca to .actives when its connection has work pending that does
+        not wait on received bytes otherwise discard it from .actives
+        """
+        requestant = self.reqs.get(ca)
+        responder = self.reps.get(ca)
+        if (self.pipes.get(ca) or
+                (responder is not None and
+                    (not responder.ended or not responder.persisted)) or
+                (requestant is not None and requestant.parser is None and
+                    requestant.msg and requestant.persisted)):
+            self.actives.add(ca)
+        else:
+            self.actives.discard(ca)
+
+
     def serviceConnects(self):
         """
         Service new incoming connections
         Create requestants
         Timeout stale connections
+        When servant is polled and wheeled only visit connections that
+        received last pass for cutoff since new connections are in .readies
+        and expired ones come from the wheel
         """
         self.servant.serviceConnects()
-        for ca, ix in list(self.servant.ixes.items()):  # ixes changes during iteration
-            if ix.cutoff:
-                self.closeConnection(ca)
-                continue
+        if self.servant.polled and self.servant.wheel is not None:
+            for ca in list(self.readies):  # only received may be cutoff
+                ix = self.servant.ixes.get(ca)
+                if ix is not None and ix.cutoff:
+                    self.closeConnection(ca)
 
-            if ca not in self.reqs:  # point requestant.msg to incomer.rxbs
-                self.reqs[ca] = Requestant(msg=ix.rxbs, remoter=ix)
+        else:
+            for ca, ix in list(self.servant.ixes.items()):  # ixes changes during iteration
+                if ix.cutoff:
+                    self.closeConnection(ca)
+                    continue
 
-            if ix.tymeout > 0.0 and ix.tymer.expired:
-                self.closeConnection(ca)
+                if ca not in self.reqs:  # point requestant.msg to incomer.rxbs
+                    self.reqs[ca] = self.makeRequestant(ix)
+
+                if (self.servant.wheel is None and ix.tymeout > 0.0 and
+                        ix.tymer.expired):
+                    self.closeConnection(ca)
+
+        if self.servant.wheel is not None:  # only visit expired connections
+            for ca in self.servant.wheel.expire():
+                ix = self.servant.ixes.get(ca)
+                if ix is not None and ix.tymeout > 0.0:
+                    self.closeConnection(ca)
 
 
     def serviceReqs(self):
         """
         Service pending requestants
-        """
-        for ca, requestant in list(self.reqs.items()):
-            if requestant.parser:
+        Parses ahead pipelined requests on a persistent connection into its
+        .pipes queue while the current response is still in progress
+        When servant is polled only services connections in .readies that
+        received this pass and .actives
+        """
+        if self.servant.polled:
+            self.readies, self.servant.readies = self.servant.readies, set()
+            cas = self.readies | self.actives
+        else:
+            cas = list(self.reqs)
+
+        for ca in cas:
+            requestant = self.reqs.get(ca)
+            if requestant is None:  # new connection or stale ca
+                ix = self.servant.ixes.get(ca)
+                if ix is None or ix.cutoff:
+                    continue
+                requestant = self.reqs[ca] = self.makeRequestant(ix)
+
+            pipe = self.pipes.setdefault(ca, deque())
+            responder = self.reps.get(ca)
+            busy = responder is not None and not responder.ended
+            while True:
+                if requestant.parser is None:  # parse ahead next request
+                    if (not requestant.persisted or not requestant.msg or
+                            len(pipe) >= max(self.pipelines, 1) or
+                            (not self.pipelines and busy)):
+                        break
+                    requestant.makeParser()
+
                 try:
                     requestant.parse()
                 except httping.HTTPException as ex:  # unkown error cause this may be superfluous
@@ -790,54 +1560,132 @@ class Server():
                     #requestant.ended = True
                     sys.stderr.write(str(ex))
                     self.closeConnection(ca)
-                    continue  # give up on request since shouldn't be here
+                    break  # give up on request since shouldn't be here
 
-                if requestant.ended:
-                    if requestant.errored:  # parse may swallow error but set .errored and .error
-                        sys.stderr.write(requestant.error)
-                        self.closeConnection(ca)
-                        continue
+                if not busy and not pipe:  # phase tymeouts once responses done
+                    self.retymeout(requestant)
 
-                    logger.info("Parsed Request: %s %s %s", requestant.method,
-                                requestant.path,
-                                requestant.version)
-                    logger.debug("Headers/Body: %s -- %s", requestant.headers,
-                                 requestant.body)
-                    # create or restart wsgi app responder here
-                    environ = self.buildEnviron(requestant)
-                    if ca not in self.reps:
-                        chunkable = True if requestant.version >= (1, 1) else False
-                        responder = Responder(incomer=requestant.remoter,
-                                                  app=self.app,
-                                                  environ=environ,
-                                                  chunkable=chunkable)
-                        self.reps[ca] = responder
-                    else:  # reuse
-                        responder = self.reps[ca]
-                        responder.reset(environ=environ)
+                if (requestant.stream is not None and requestant.headed and
+                        not requestant.dispatched):  # app starts before body
+                    self.dispatch(requestant, pipe)
+
+                if not requestant.ended:
+                    break
+
+                if requestant.errored:  # parse may swallow error but set .errored and .error
+                    sys.stderr.write(requestant.error)
+                    if requestant.oversized and not requestant.dispatched:
+                        requestant.persisted = False  # close after 413
+                        self.dispatch(requestant, pipe, app=self.tooLarge)
+                        break
+                    self.closeConnection(ca)
+                    break
+
+                if not requestant.dispatched:
+                    self.dispatch(requestant, pipe)
+
+            # stop receiving while streamed body waits for app to read
+            stream = requestant.stream
+            requestant.remoter.paused = (stream is not None and stream.full and
+                                         not stream.ended)
+
+            if self.servant.polled and ca in self.reqs:
+                self.activate(ca)
+
+
+    def dispatch(self, requestant, pipe, app=None):
+        """
+        Queue wsgi environ of parsed request of requestant with its persisted,
+        chunkable, and app for responder in request order on pipe.
+        Streamed requests are dispatched once headed.
+        app None means .app
+        """
+        requestant.dispatched = True
+        requestant.count += 1
+        if self.maxrequests and requestant.count >= self.maxrequests:
+            requestant.persisted = False  # close after response
+
+        logger.info("Parsed Request: %s %s %s", requestant.method,
+                    requestant.path,
+                    requestant.version)
+        logger.debug("Headers/Body: %s -- %s", requestant.headers,
+                     requestant.body)
+        chunkable = True if requestant.version >= (1, 1) else False
+        pipe.append((self.buildEnviron(requestant),
+                     requestant.persisted,
+                     chunkable,
+                     app if app is not None else self.app))
 
 
     def serviceReps(self):
         """
         Service pending responders
+        Starts responses of queued requests in .pipes in request order.
+        Responses that end start the next queued response in the same pass
+        When servant is polled only services connections in .actives
         """
-        for ca, responder in list(self.reps.items()):
-            if responder.closed:
+        if self.servant.polled:
+            items = [(ca, self.pipes[ca]) for ca in list(self.actives)
+                     if ca in self.pipes]
+        else:
+            items = list(self.pipes.items())
+
+        for ca, pipe in items:
+            responder = self.reps.get(ca)
+            if responder is not None and responder.closed:
                 self.closeConnection(ca)
                 continue
 
-            if not responder.ended:
+            requestant = self.reqs[ca]
+            while True:
+                if responder is None or responder.ended:  # start next
+                    if not pipe:
+                        break
+                    environ, persisted, chunkable, app = pipe.popleft()
+                    if responder is None:  # create wsgi app responder
+                        responder = Responder(incomer=requestant.remoter,
+                                              app=app,
+                                              environ=environ,
+                                              chunkable=chunkable,
+                                              persisted=persisted,
+                                              statics=self.statics,
+                                              pool=self.pool,
+                                              deadline=self.deadline)
+                        self.reps[ca] = responder
+                    else:  # reuse
+                        responder.reset(environ=environ,
+                                        chunkable=chunkable,
+                                        persisted=persisted,
+                                        app=app)
+
                 responder.service()
+                if not responder.ended:  # pending response is activity
+                    responder.incomer.refresh()
+                    break
+
+                self.closeInput(responder.environ)  # remove spooled body file
 
-            if responder.ended:
-                requestant = self.reqs[ca]
-                if requestant.persisted:
-                    if requestant.parser is None:  # reuse
-                        requestant.makeParser()  # resets requestant parser
-                else:  # not persistent so close and remove requestant and responder
+                if responder.abandoned:  # app may still run so close connection
+                    requestant.persisted = False
+                    while pipe:
+                        self.closeInput(pipe.popleft()[0])
+
+                if not pipe and responder.persisted:  # wait for next request
+                    if requestant.started:  # next request already started
+                        self.retymeout(requestant)
+                    else:
+                        requestant.remoter.retymeout(self.keeptymeout)
+
+            if responder is not None and responder.ended and not pipe:
+                if not responder.persisted:  # close and remove requestant and responder
                     ix = self.servant.ixes[ca]
                     if not ix.txbs:  # wait for outgoing txbs to be empty
                         self.closeConnection(ca)
+                        continue
+
+            if self.servant.polled:
+                self.activate(ca)
+
 
     def service(self):
         """
@@ -862,15 +1710,21 @@ class CustomResponder():
     Content-Type: application/json\r\n
     Date: Thu, 30 Apr 2015 19:37:17 GMT\r\n
     Server: IoBook.local\r\n\r\n
+
+    When body is an iterator of bytes chunks instead of bytes, .build returns
+    only the head and .pour returns the body chunk by chunk, chunk framed
+    unless headers provide Content-Length.
     """
     HttpVersionString = httping.HTTP_11_VERSION_STRING  # http version string
+    Statics = httping.packStatics([(u'Server', u"Ioflo Server")])
 
     def __init__(self,
                  steward=None,
                  status=200,  # integer
                  headers=None,
                  body=b'',
-                 data=None):
+                 data=None,
+                 persisted=True):
         """
         Initialize Instance
         steward = managing Steward instance
@@ -878,8 +1732,11 @@ class CustomResponder():
         headers = http response headers
         body = http response body
         data = dict to jsonify as body if provided
+        persisted = False if connection closes after response so send
+                    Connection: close header
         """
         self.steward = steward
+        self.persisted = True if persisted else False
         self.status = status
         self.headers = help.Hict(headers) if headers else help.Hict()
         if body and isinstance(body, str):  # use default
@@ -889,6 +1746,8 @@ class CustomResponder():
         self.data = data
 
         self.ended = False  # True if response generated completed
+        self.iterator = None  # iterator of streamed body chunks if any
+        self.chunked = False  # True if streamed body is chunk framed
 
         self.msg = b""  # for debugging
         self.lines = []  # for debugging
@@ -919,6 +1778,8 @@ class CustomResponder():
             self.data = data
         else:
             self.data = None
+        self.iterator = None
+        self.chunked = False
 
 
     def build(self,
@@ -945,11 +1806,19 @@ class CustomResponder():
             startLine = startLine.encode('idna')
         self.lines.append(startLine)
 
-        if u'server' not in self.headers:  # create Server header
-            self.headers[u'server'] = "Ioflo Server"
+        packs = dict()  # pre-encoded lines of default headers keyed by name
+        for name, value, line in self.Statics:  # such as Server header
+            if name not in self.headers:
+                self.headers[name] = value
+                packs[name] = line
 
         if u'date' not in self.headers:  # create Date header
-            self.headers[u'date'] = httping.httpDate1123(datetime.datetime.utcnow())
+            self.headers[u'date'] = httping.httpDateNow()
+            packs[u'date'] = httping.httpDateNow(packed=True)
+
+        if not self.persisted and u'connection' not in self.headers:
+            self.headers[u'connection'] = u'close'
+            packs[u'connection'] = b"Connection: close"
 
         if self.data is not None:
             body = json.dumps(self.data, separators=(',', ':')).encode("utf-8")
@@ -957,41 +1826,249 @@ class CustomResponder():
         else:
             body = self.body
 
-        if body and (u'content-length' not in self.headers):
+        if not isinstance(body, (bytes, bytearray)):  # iterable of chunks
+            self.iterator = iter(body)
+            body = b''
+            if u'content-length' not in self.headers:
+                self.headers[u'transfer-encoding'] = u'chunked'
+                self.chunked = True
+
+        elif body and (u'content-length' not in self.headers):
             self.headers[u'content-length'] = str(len(body))
 
         for name, value in self.headers.items():
-            self.lines.append(httping.packHeader(name, value))
+            line = packs.get(name)
+            self.lines.append(line if line is not None
+                              else httping.packHeader(name, value))
 
         self.lines.extend((b"", b""))
         self.head = CRLF.join(self.lines)  # b'/r/n'
 
         self.msg = self.head + body
-        self.ended = True
+        self.ended = self.iterator is None
         return self.msg
 
 
+    def pour(self):
+        """
+        Returns next bytes of streamed body from .iterator, chunk framed when
+        .chunked, or empty bytes when next chunk is not yet available.
+        Sets .ended once .iterator is exhausted.
+        """
+        if self.iterator is None:
+            return b''
+        try:
+            chunk = next(self.iterator)
+        except StopIteration:
+            self.iterator = None
+            self.ended = True
+            return httping.packChunk(b'') if self.chunked else b''
+        if isinstance(chunk, str):
+            chunk = chunk.encode('iso-8859-1')
+        if not chunk:  # allows async production of chunks
+            return b''
+        return httping.packChunk(chunk) if self.chunked else chunk
+
+
+class RouteNode():
+    """
+    Node of segment trie of parameterized routes of Router
+
+    Attributes:
+        literals (dict): child RouteNodes keyed by literal path segment
+        param (tuple | None): (name, child RouteNode) of parameter segment
+        handlers (dict): route handlers keyed by method at this node
+    """
+    __slots__ = ('literals', 'param', 'handlers')
+
+    def __init__(self):
+        self.literals = dict()
+        self.param = None
+        self.handlers = dict()
+
+
+class Router():
+    """
+    Router class precompiled route table for BareServer (non-WSGI) dispatch
+    Routes without parameters are compiled into dict keyed by path so they
+    resolve with one lookup. Routes with {name} parameter segments such as
+    /users/{uid} are compiled into a segment trie of RouteNodes. Literal
+    segments take precedence over parameter segments.
+
+    Handlers are called as handler(requestant, params) with the parsed
+    Requestant and dict of parameter values keyed by name. A handler returns
+    body as bytes or str, dict or list to send as json, iterator of bytes
+    chunks to stream, or tuple (status, headers, body) with body as above.
+    A handler may raise httping.HTTPError to send an error response.
+
+    Attributes:
+        statics (dict): handlers keyed by method in dicts keyed by path
+        trie (RouteNode): root node of parameterized routes
+
+    Methods:
+        add(path, handler, methods) adds route
+        route(path, methods) decorator to add route
+        resolve(method, path) returns (handler, params) or raises HTTPError
+    """
+
+    def __init__(self, routes=None):
+        """
+        Initialize instance
+
+        Parameters:
+            routes (Iterable | None): of (path, handler, methods) triples
+        """
+        self.statics = dict()
+        self.trie = RouteNode()
+        for path, handler, methods in (routes if routes is not None else ()):
+            self.add(path, handler, methods=methods)
+
+
+    @staticmethod
+    def normalize(path):
+        """
+        Returns path without trailing slash except for root path
+        """
+        return path.rstrip('/') or '/'
+
+
+    def add(self, path, handler, methods=('GET', )):
+        """
+        Add route of path for methods to handler
+
+        Parameters:
+            path (str): route path starting with slash. Segments of form
+                {name} match any nonempty segment given to handler as params
+            handler (Callable): handler(requestant, params) of route
+            methods (Iterable): of str HTTP methods of route
+
+        Raises ValueError for path not starting with slash or with different
+        parameter name at same position as existing route
+        """
+        if not path.startswith('/'):
+            raise ValueError("Invalid route path '{0}'".format(path))
+        path = self.normalize(path)
+
+        if '{' not in path:  # static
+            handlers = self.statics.setdefault(path, dict())
+        else:
+            node = self.trie
+            for segment in path.split('/')[1:]:
+                if segment.startswith('{') and segment.endswith('}'):
+                    name = segment[1:-1]
+                    if node.param is None:
+                        node.param = (name, RouteNode())
+                    elif node.param[0] != name:
+                        raise ValueError("Conflicting parameter '{0}' and '{1}'"
+                                         " of route path '{2}'".format(
+                                             name, node.param[0], path))
+                    node = node.param[1]
+                else:
+                    node = node.literals.setdefault(segment, RouteNode())
+            handlers = node.handlers
+
+        for method in methods:
+            handlers[method.upper()] = handler
+
+
+    def route(self, path, methods=('GET', )):
+        """
+        Returns decorator that adds route of path for methods to decorated
+        handler
+        """
+        def decorator(handler):
+            self.add(path, handler, methods=methods)
+            return handler
+        return decorator
+
+
+    def resolve(self, method, path):
+        """
+        Returns duple (handler, params) of route matching method and path
+        where params is dict of parameter values keyed by name
+
+        Static route of path takes precedence. When it does not match method
+        parameterized routes of path are tried.
+
+        Raises httping.HTTPError 404 if no route matches path or 405 with
+        Allow header if no route of path matches method
+        """
+        path = self.normalize(path)
+        params = dict()
+        statics = self.statics.get(path)
+        if statics is not None and method in statics:
+            return (statics[method], params)
+
+        handlers = self.match(self.trie, path.split('/')[1:], 0, params)
+        if handlers is not None and method in handlers:
+            return (handlers[method], params)
+
+        if statics is None and handlers is None:
+            raise httping.HTTPError(httping.NOT_FOUND)
+        allows = dict.fromkeys(statics or ())  # ordered union of methods
+        allows.update(dict.fromkeys(handlers or ()))
+        raise httping.HTTPError(httping.METHOD_NOT_ALLOWED,
+                                headers=dict(Allow=", ".join(allows)))
+
+
+    def match(self, node, segments, index, params):
+        """
+        Returns handlers dict of RouteNode in trie below node matching
+        segments from index on or None if none. Backtracks from literal to
+        parameter segments. Fills in params with matched parameter values
+        """
+        if index == len(segments):
+            return node.handlers or None
+
+        segment = segments[index]
+        child = node.literals.get(segment)
+        if child is not None:
+            handlers = self.match(child, segments, index + 1, params)
+            if handlers is not None:
+                return handlers
+
+        if node.param is not None and segment:
+            name, child = node.param
+            handlers = self.match(child, segments, index + 1, params)
+            if handlers is not None:
+                params[name] = segment
+                return handlers
+
+        return None
+
+
 class Steward():
     """
     Manages the associated requestant and responder for an incoming connection
     for BareServer (non-wsgi) HTTP server
+    Dispatches requests to handlers of router when provided otherwise
+    .respond echoes request
     """
     def __init__(self,
                  remoter,
                  requestant=None,
                  responder=None,
-                 dictable=False):
+                 dictable=False,
+                 backend=None,
+                 maxbody=0,
+                 router=None):
         """
         incomer = Incomer instance for connection
         requestant = Requestant instance for connection
         responder = Responder instance for connection
         dictable = True if should attempt to convert request body as json
+        backend = parser backend of requestant if not provided
+        maxbody = max request body bytes of requestant if not provided
+        router = Router instance to dispatch requests if any
         """
         self.remoter = remoter
+        self.router = router
         if requestant is None:
             requestant = Requestant(msg=self.remoter.rxbs,
                                     remoter=remoter,
-                                    dictable=dictable)
+                                    dictable=dictable,
+                                    backend=backend,
+                                    maxbody=maxbody)
         self.requestant = requestant
 
         if responder is None:
@@ -1003,16 +2080,20 @@ class Steward():
 
     def refresh(self):
         """
-        Restart incomer tymer
+        Restart incomer tymer and tymeout in its wheel if any
         """
-        self.remoter.tymer.restart()
+        self.remoter.refresh()
 
 
     def respond(self):
         """
         Respond to request  Override in subclass
-        Echo request
+        Dispatch to .router if any otherwise echo request
         """
+        if self.router is not None:
+            self.dispatch()
+            return
+
         logger.info("Responding to Request:\n%s %s %s\n"
                                 "%s\n%s\n", self.requestant.method,
                                                     self.requestant.path,
@@ -1044,13 +2125,57 @@ class Steward():
         self.waited = not self.responder.ended
 
 
+    def dispatch(self):
+        """
+        Respond to request with result of handler resolved by .router
+        Sends error response for HTTPError raised by router or handler and
+        500 for other exceptions
+        """
+        status, headers, data = 200, None, None
+        try:
+            handler, params = self.router.resolve(self.requestant.method,
+                                                  self.requestant.path)
+            body = handler(self.requestant, params)
+        except httping.HTTPError as ex:
+            status = ex.status
+            headers = help.Hict(ex.headers.items())
+            if 'content-type' not in headers:
+                headers['content-type'] = 'text/plain'
+            body = ex.render()
+        except Exception as ex:  # handle exceptions not caught by handler
+            logger.error("Unexcepted Server Error.\n%s\n", ex)
+            status = httping.INTERNAL_SERVER_ERROR
+            body = httping.HTTPError(status).render()
+
+        if isinstance(body, tuple):
+            status, headers, body = body
+        if isinstance(body, (dict, list)):
+            data, body = body, None
+
+        msg = self.responder.build(status=status,
+                                   headers=headers if headers is not None else {},
+                                   body=body,
+                                   data=data)
+        self.remoter.tx(msg)
+        self.waited = not self.responder.ended
+
+
     def pour(self):
         """
         Run generator to stream response message
-
+        Closes connection after response when generator fails after head sent
         """
+        try:
+            msg = self.responder.pour()
+        except Exception as ex:
+            logger.error("Error streaming body after headers sent.\n%s\n", ex)
+            self.responder.iterator = None
+            self.responder.ended = True
+            self.requestant.persisted = False  # body incomplete so close
+            msg = b''
 
-        # putnext generator here
+        if msg:
+            self.remoter.tx(msg)
 
         if self.responder.ended:
             self.waited = False
@@ -1061,9 +2186,15 @@ class Steward():
 class BareServer():
     """
     BareServer class nonblocking Bare (non-WSGI) HTTP server
-    Define CustomResponder subclass to respond to requests as per Steward
+    Provide Router to dispatch requests to handlers without building wsgi
+    environs or define CustomResponder subclass to respond to requests as
+    per Steward
     """
     Timeout = 5.0  # default tcp server (servant) connection timeout
+    KeepTimeout = 5.0  # default idle timeout between requests on keep-alive
+    HeadTimeout = 20.0  # default timeout to read request head once started
+    MaxRequests = 0  # default max requests per connection. 0 means no limit
+    MaxBody = 0  # default max request body bytes. 0 means no limit
 
     def __init__(self,
                  servant=None,
@@ -1078,6 +2209,12 @@ class BareServer():
                  scheme=u'',
                  dictable=False,
                  timeout=None,
+                 keeptimeout=None,
+                 headtimeout=None,
+                 maxrequests=None,
+                 backend=None,
+                 maxbody=None,
+                 router=None,
                  **kwa):
         """
         Initialization method for instance.
@@ -1097,12 +2234,35 @@ class BareServer():
         eha = external destination address for incoming connections used in TLS
         scheme = http scheme u'http' or u'https' or empty
         dictable = Boolean flag If True attempt to convert body from json for requestants
+        timeout = timeout in seconds for dropping idle connections
+        keeptimeout = timeout in seconds for dropping keep-alive connections
+                      idle between requests. 0.0 means never
+        headtimeout = timeout in seconds to finish reading request head once
+                      started. Not restarted by activity. 0.0 means use timeout
+        maxrequests = max requests per connection after which response has
+                      Connection: close and connection is closed. 0 means no limit
+        backend = parser backend of requestants, Backend instance or name such
+                  as "httptools". None means pure python default
+        maxbody = max request body bytes. Larger gets 413 response and
+                  connection is closed. 0 means no limit
+        router = Router instance to dispatch requests of stewards. None means
+                 stewards echo requests
 
         """
         self.stewards = stewards if stewards is not None else dict()
         self.dictable = True if dictable else False  # for stewards
         if timeout is None:
             timeout = self.Timeout
+        self.timeout = timeout
+        self.keeptimeout = (keeptimeout if keeptimeout is not None
+                            else self.KeepTimeout)
+        self.headtimeout = (headtimeout if headtimeout is not None
+                            else self.HeadTimeout)
+        self.maxrequests = (maxrequests if maxrequests is not None
+                            else self.MaxRequests)
+        self.backend = httping.selectBackend(backend)
+        self.maxbody = maxbody if maxbody is not None else self.MaxBody
+        self.router = router
 
         ha = ha or (host, port)  # ha = host address takes precendence over host, port
         if servant:
@@ -1199,6 +2359,28 @@ class BareServer():
         del self.stewards[ca]
 
 
+    def retimeout(self, requestant):
+        """
+        Switch timeout of requestant's remoter to that of its parse phase.
+        Reading a started head is bounded by .headtimeout which activity does
+        not restart. Reading the body and responding use idle .timeout.
+        Waiting for the next request on a keep-alive connection uses
+        .keeptimeout set by .serviceStewards
+        """
+        if requestant.headed:
+            timeout, refreshable = self.timeout, True
+        elif requestant.started:
+            if self.headtimeout > 0.0:
+                timeout, refreshable = self.headtimeout, False
+            else:
+                timeout, refreshable = self.timeout, True
+        else:  # still waiting for request
+            return
+        remoter = requestant.remoter
+        if remoter.tymeout != timeout or remoter.refreshable != refreshable:
+            remoter.retymeout(timeout, refreshable=refreshable)
+
+
     def serviceConnects(self):
         """
         Service new incoming connections
@@ -1206,25 +2388,50 @@ class BareServer():
         Timeout stale connections
         """
         self.servant.serviceConnects()
-        for ca, ix in self.servant.ixes.items():
+        for ca, ix in list(self.servant.ixes.items()):  # ixes changes
             # check for and handle cutoff connections by client here
 
             if ca not in self.stewards:
-                self.stewards[ca] = Steward(remoter=ix, dictable=self.dictable)
+                self.stewards[ca] = Steward(remoter=ix, dictable=self.dictable,
+                                            backend=self.backend,
+                                            maxbody=self.maxbody,
+                                            router=self.router)
 
-            if ix.tymeout > 0.0 and ix.tymer.expired:
+            if (self.servant.wheel is None and ix.tymeout > 0.0 and
+                    ix.tymer.expired):
                 self.closeConnection(ca)
 
+        if self.servant.wheel is not None:  # only visit expired connections
+            for ca in self.servant.wheel.expire():
+                ix = self.servant.ixes.get(ca)
+                if ix is not None and ix.tymeout > 0.0:
+                    self.closeConnection(ca)
+
 
     def serviceStewards(self):
         """
         Service pending requestants and responders
         """
-        for ca, steward in self.stewards.items():
-            if not steward.waited:
+        for ca, steward in list(self.stewards.items()):  # stewards changes
+            if not steward.waited and steward.requestant.parser:
                 steward.requestant.parse()
+                self.retimeout(steward.requestant)
 
                 if steward.requestant.ended:
+                    steward.requestant.count += 1
+                    if (self.maxrequests and
+                            steward.requestant.count >= self.maxrequests):
+                        steward.requestant.persisted = False  # close after
+                    if steward.requestant.oversized:  # body larger than maxbody
+                        steward.requestant.persisted = False  # close after 413
+                        steward.responder.persisted = False
+                        msg = steward.responder.build(status=httping.REQUEST_ENTITY_TOO_LARGE,
+                                                      body=httping.HTTPError(
+                                                          httping.REQUEST_ENTITY_TOO_LARGE).render())
+                        steward.remoter.tx(msg)
+                        continue
+
+                    steward.responder.persisted = steward.requestant.persisted
                     steward.requestant.dictify()
                     logger.info("Parsed Request:\n%s %s %s\n"
                                     "%s\n%s\n", steward.requestant.method,
@@ -1240,8 +2447,9 @@ class BareServer():
             if not steward.waited and steward.requestant.ended:
                 if steward.requestant.persisted:
                     steward.requestant.makeParser()  #set up for next time
-                else:  # remove and close connection
-                    self.closeConnection(ca)
+                    steward.remoter.retymeout(self.keeptimeout)
+                elif not steward.remoter.txbs:  # wait for txbs to be empty
+                    self.closeConnection(ca)  # remove and close connection
 
 
     def service(self):
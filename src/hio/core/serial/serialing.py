@@ -12,6 +12,7 @@ from collections import deque
 
 from ... import hioing, help
 from ...base import doing
+from .. import coring
 
 logger = help.ogler.getLogger()
 
@@ -286,18 +287,21 @@ class Device():
     Needs os module
     """
 
-    def __init__(self, port=None, speed=9600, bs=1024):
+    def __init__(self, port=None, speed=9600, bs=1024, selector=None):
         """
         Initialization method for instance.
 
         port = serial device port path string
         speed = serial port speed in bps
         bs = buffer size for reads
+        selector = selectors.BaseSelector such as Doist.selector to register
+                   read readiness of .fd with. None means do not register
         """
         self.fd = None  # serial device port file descriptor, must be opened first
         self.port = port or os.ctermid() #default to console
         self.speed = speed or 9600
         self.bs = bs or 1024
+        self.selector = selector
         self.opened = False
 
 
@@ -399,6 +403,7 @@ class Device():
             termios.tcsetattr(self.fd, termios.TCSANOW, settings)
             #print(settings)
 
+        coring.selectorRegister(self.selector, self.fd, self)
         self.opened = True
 
         return self.opened
@@ -411,6 +416,7 @@ class Device():
 
         """
         if self.fd:
+            coring.selectorUnregister(self.selector, self.fd)
             os.close(self.fd)
             self.fd = None
             self.opened = False
@@ -463,13 +469,15 @@ class Serial():
     Needs os module
     """
 
-    def __init__(self, port=None, speed=9600, bs=1024):
+    def __init__(self, port=None, speed=9600, bs=1024, selector=None):
         """
         Initialization method for instance.
 
         port = serial device port path string
         speed = serial port speed in bps
         bs = buffer size for reads
+        selector = selectors.BaseSelector such as Doist.selector to register
+                   read readiness of .serial with. None means do not register
 
 
         """
@@ -477,6 +485,7 @@ class Serial():
         self.port = port or os.ctermid() #default to console
         self.speed = speed or 9600
         self.bs = bs or 1024
+        self.selector = selector
         self.opened = False
 
 
@@ -504,6 +513,7 @@ class Serial():
                                     writeTimeout=0)
         #self.serial.nonblocking()
         self.serial.reset_input_buffer()
+        coring.selectorRegister(self.selector, self.serial.fileno(), self)
         self.opened = True
 
         return self.opened
@@ -514,6 +524,7 @@ class Serial():
         Closes .serial
         """
         if self.serial:
+            coring.selectorUnregister(self.selector, self.serial.fileno())
             self.serial.reset_output_buffer()
             self.serial.close()
             self.serial = None
@@ -568,7 +579,8 @@ class Driver():
                  port=None,
                  speed=9600,
                  bs=1024,
-                 server=None):
+                 server=None,
+                 selector=None):
         """
         Initialization method for instance.
 
@@ -580,6 +592,9 @@ class Driver():
             canonical = canonical mode True or False
             bs = buffer size for reads
             server = serial port device server if any
+            selector = selectors.BaseSelector such as Doist.selector for
+                created server to register read readiness with. None means
+                do not register. Ignored when server provided.
 
         Attributes:
            name = user friendly name for driver
@@ -597,13 +612,15 @@ class Driver():
                 import serial
                 self.server = Serial(port=port,
                                        speed=speed,
-                                       bs=bs)
+                                       bs=bs,
+                                       selector=selector)
 
             except ImportError as  ex:
                 logger.error("Error: importing pyserial\n%s\n", ex)
                 self.server = Device(port=port,
                                        speed=speed,
-                                       bs=bs)
+                                       bs=bs,
+                                       selector=selector)
         else:
             self.server = server
 
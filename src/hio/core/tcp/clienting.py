@@ -74,6 +74,7 @@ class Client(tyming.Tymee):
                  txbs=None,
                  rxbs=None,
                  wl=None,
+                 selector=None,
                  **kwa):
         """
         Initialization method for instance.
@@ -87,9 +88,13 @@ class Client(tyming.Tymee):
             port = socket port
             reconnectable = Boolean retry auto reconnect if timed out
             bs = buffer size
-            txbs = bytearray of data to send
-            rxbs = bytearray of data received
+            txbs = bytearray or Reel of data to send
+                Reel queues segments without copying and sends with sendmsg
+            rxbs = bytearray or Ring of data received
+                Ring receives directly into its free space with recv_into
             wl = WireLog object if any
+            selector = selectors.BaseSelector such as Doist.selector to register
+                read readiness of .cs with. None means do not register
         """
         super(Client, self).__init__(**kwa)
         self.tymeout = tymeout if tymeout is not None else self.Tymeout
@@ -112,6 +117,7 @@ class Client(tyming.Tymee):
         self.txbs = txbs if txbs is not None else bytearray()  # byte array of data to send
         self.rxbs = rxbs if rxbs is not None else bytearray()  # byte array of data recieved
         self.wl = wl
+        self.selector = selector
 
 
     @property
@@ -295,6 +301,7 @@ class Client(tyming.Tymee):
         Shutdown and close connected socket .cs
         """
         if self.cs:
+            coring.selectorUnregister(self.selector, self.cs)
             self.shutdown()
             self.cs.close()  #close socket
             self.cs = None
@@ -334,6 +341,8 @@ class Client(tyming.Tymee):
         self.ca = self.cs.getsockname()  # resolved local connection address
         # self.cs.getpeername() is self.ha
         self.ha = self.cs.getpeername()  # resolved remote connection address
+        # register once connected since unconnected socket polls as hung up
+        coring.selectorRegister(self.selector, self.cs, self)
 
         self.accepted = True  # also sets .connected == True
         self.cutoff = False
@@ -368,7 +377,7 @@ class Client(tyming.Tymee):
         return self.connected
 
 
-    def receive(self):
+    def receive(self, into=None):
         """
         Perform non blocking receive from connected socket .cs
 
@@ -376,9 +385,17 @@ class Client(tyming.Tymee):
         If connection closed then returns empty
         Otherwise returns data
         data is string in python2 and bytes in python3
+
+        Parameters:
+            into (Ring): when provided receive directly into free space of
+                ring buffer into with recv_into instead of allocating bytes.
+                Then data is memoryview of received bytes already in into
         """
         try:
-            data = self.cs.recv(self.bs)
+            if into is not None:  # receive directly into free space of ring
+                data = into.fill(self.cs.recv_into, self.bs)
+            else:
+                data = self.cs.recv(self.bs)
         except OSError as ex:
             # ex.args[0] == ex.errno for better os compatibility.
             # the value of a given errno.XXXXX may be different on each os
@@ -414,12 +431,15 @@ class Client(tyming.Tymee):
     def serviceReceives(self):
         """
         Service receives until no more
+        When .rxbs is Ring then receive directly into it
         """
+        ringed = isinstance(self.rxbs, help.Ring)
         while self.connected and not self.cutoff:
-            data = self.receive()
+            data = self.receive(into=self.rxbs if ringed else None)
             if not data:
                 break
-            self.rxbs.extend(data)
+            if not ringed:
+                self.rxbs.extend(data)
 
 
     def serviceReceiveOnce(self):
@@ -427,9 +447,12 @@ class Client(tyming.Tymee):
         Retrieve from server only one reception
         '''
         if self.connected and not self.cutoff:
-            data = self.receive()
-            if data:
-                self.rxbs.extend(data)
+            if isinstance(self.rxbs, help.Ring):
+                self.receive(into=self.rxbs)
+            else:
+                data = self.receive()
+                if data:
+                    self.rxbs.extend(data)
 
 
     def clearRxbs(self):
@@ -443,10 +466,16 @@ class Client(tyming.Tymee):
         """
         Perform non blocking send on connected socket .cs.
         Return number of bytes sent
-        data is string in python2 and bytes in python3
+        data is bytes or Reel. Reel sends all its segments with one sendmsg
         """
         try:
-            count = self.cs.send(data)  # result is number of bytes sent
+            if isinstance(data, help.Reel):
+                if hasattr(self.cs, "sendmsg"):  # gather write
+                    count = self.cs.sendmsg(data.buffers())
+                else:
+                    count = self.cs.send(data.peek())
+            else:
+                count = self.cs.send(data)  # result is number of bytes sent
         except OSError as ex:
             # ex.args[0] == ex.errno for better os compatibility.
             # the value of a given errno.XXXXX may be different on each os
@@ -480,6 +509,7 @@ class Client(tyming.Tymee):
     def tx(self, data):
         """
         Copy data onto .txbs, .extend copies data.
+        When .txbs is Reel bytes data is queued as segment without copying
         """
         self.txbs.extend(data)
 
@@ -511,7 +541,17 @@ class ClientTls(Client):
     Nonblocking TCP Socket Client Class.
 
     Attributes:
-
+        .context is TLS context instance
+        .certedhost is server's certificate common name (hostname)
+        .resumable is boolean, True means resume TLS sessions cached in
+            .sessions on reconnect to skip full handshake. False means always
+            full handshake
+        .sessions is dict of ssl.SSLSession keyed by (hostname, port). Share
+            dict and .context together across ClientTls instances to resume
+            across them since a session only resumes with its own context
+        .handshakes is int count of completed handshakes
+        .resumptions is int count of completed handshakes that resumed a
+            session. Full handshakes is .handshakes - .resumptions
 
     Properties:
 
@@ -527,11 +567,15 @@ class ClientTls(Client):
                  keypath=None,
                  certpath=None,
                  cafilepath=None,
+                 resumable=False,
+                 sessions=None,
                  **kwa):
         """
         Initialization method for instance.
 
         IF no context THEN create one
+        ELSE share provided context such as .context of a prior ClientTls
+             without reloading default CA certs
         IF no version THEN create using library default
         IF certify is not None then use certify else use default
         IF hostify is not none the use hostify else use default
@@ -551,11 +595,19 @@ class ClientTls(Client):
                       If given apply to context
             hostify = verify server hostName If None use default
             certedhost = server's certificate common name (hostname) to check against
+            resumable = True means resume cached TLS sessions on reconnect
+            sessions = dict of ssl.SSLSession keyed by (hostname, port) to
+                share with other ClientTls of same context. None means new dict
         """
         super(ClientTls, self).__init__(**kwa)
 
         self._connected = False  # attributed supporting connected property
+        self.resumable = True if resumable else False
+        self.sessions = sessions if sessions is not None else dict()
+        self.handshakes = 0  # completed handshakes
+        self.resumptions = 0  # completed handshakes that resumed a session
 
+        created = context is None
         if context is None:  # create context
             if not version:  # use default context
                 context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH)
@@ -581,7 +633,7 @@ class ClientTls(Client):
             context.load_verify_locations(cafile=cafilepath,
                                           capath=None,
                                           cadata=None)
-        elif context.verify_mode != ssl.CERT_NONE:
+        elif created and context.verify_mode != ssl.CERT_NONE:
             context.load_default_certs(purpose=ssl.Purpose.SERVER_AUTH)
 
         if keypath or certpath:
@@ -611,6 +663,9 @@ class ClientTls(Client):
         Shutdown and close connected socket .cs
         """
         if self.cs:
+            if self.connected:  # tls 1.3 tickets may arrive after handshake
+                self.cacheSession()
+            coring.selectorUnregister(self.selector, self.cs)
             self.shutdown()
             self.cs.close()  #close socket
             self.cs = None
@@ -619,14 +674,35 @@ class ClientTls(Client):
             self.opened = False
 
 
+    @property
+    def sessionKey(self):
+        """
+        Returns (hostname, port) key of .sessions for this client
+        """
+        return (self.hostname, self.ha[1])
+
+
+    def cacheSession(self):
+        """
+        Cache session of connected .cs in .sessions when .resumable
+        """
+        if self.resumable and self.cs is not None:
+            session = self.cs.session
+            if session is not None:
+                self.sessions[self.sessionKey] = session
+
+
     def wrap(self):
         """
         Wrap socket .cs in ssl context
+        When .resumable offer cached session if any for resumption
         """
+        session = self.sessions.get(self.sessionKey) if self.resumable else None
         self.cs = self.context.wrap_socket(self.cs,
                                            server_side=False,
                                            do_handshake_on_connect=False,
-                                           server_hostname=self.certedhost)
+                                           server_hostname=self.certedhost,
+                                           session=session)
 
     def handshake(self):
         """
@@ -655,6 +731,10 @@ class ClientTls(Client):
             raise
 
         self.connected = True
+        self.handshakes += 1
+        if self.cs.session_reused:
+            self.resumptions += 1
+        self.cacheSession()
         return True
 
     def connect(self):
@@ -677,7 +757,7 @@ class ClientTls(Client):
 
         return self.connected
 
-    def receive(self):
+    def receive(self, into=None):
         """
         Perform non blocking receive from connected socket .cs
 
@@ -685,9 +765,17 @@ class ClientTls(Client):
         If connection closed then returns ''
         Otherwise returns data
         data is string in python2 and bytes in python3
+
+        Parameters:
+            into (Ring): when provided receive directly into free space of
+                ring buffer into with recv_into instead of allocating bytes.
+                Then data is memoryview of received bytes already in into
         """
         try:
-            data = self.cs.recv(self.bs)
+            if into is not None:  # receive directly into free space of ring
+                data = into.fill(self.cs.recv_into, self.bs)
+            else:
+                data = self.cs.recv(self.bs)
         except OSError as ex:  # ssl.SSLError is a subtype of OSError
             # ex.args[0] == ex.errno for better os compatibility.
             # the value of a given errno.XXXXX may be different on each os
@@ -723,10 +811,14 @@ class ClientTls(Client):
         """
         Perform non blocking send on connected socket .cs.
         Return number of bytes sent
-        data is string in python2 and bytes in python3
+        data is bytes or Reel. SSLSocket has no sendmsg so Reel sends its
+        first segment
         """
         try:
-            result = self.cs.send(data) #result is number of bytes sent
+            if isinstance(data, help.Reel):
+                result = self.cs.send(data.peek())
+            else:
+                result = self.cs.send(data) #result is number of bytes sent
         except OSError as ex:  # ssl.SSLError is a subtype of OSError
             # ex.args[0] == ex.errno for better os compatibility.
             # the value of a given errno.XXXXX may be different on each os
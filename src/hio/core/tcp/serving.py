@@ -17,6 +17,7 @@ import os
 import errno
 import socket
 import ssl
+import selectors
 from collections import deque
 from contextlib import contextmanager
 
@@ -75,15 +76,44 @@ class Acceptor(tyming.Tymee):
         .ss is server listen socket for incoming accept requests
         .axes is deque of accepte connection duples (ca, cs)
         .opened is boolean, True if listen socket .ss opened. False otherwise
+        .selector is selectors.BaseSelector such as Doist.selector to register
+                  socket read readiness with so Doist wakes when ready or None
+        .accepts is max number of accepts per .serviceAccepts pass. Rest wait
+                 in listen backlog for later passes. 0 means accept all ready
+        .maxlive is max number of live connections given by .live. 0 means
+                 no limit
+        .refusable is boolean, True means at .maxlive accept and close new
+                   connections. False means defer by leaving them in listen
+                   backlog until below .maxlive
+        .admits is count of accepted connections queued on .axes
+        .refusals is count of accepted connections closed at .maxlive
+        .deferrals is count of passes that deferred accepts at .maxlive
+        .depth is length of .axes accept queue after last accepts pass
+        .peak is max .depth seen
+        .reusable is boolean, True means set SO_REUSEPORT on listen socket so
+                   several processes may each open their own listen socket on
+                   same ha and kernel load balances connections across them
+
+    Properties:
+        .live is number of live connections counted against .maxlive
     """
+    Accepts = 0  # max accepts per pass, 0 means no limit
+    MaxLive = 0  # max live connections, 0 means no limit
 
-    def __init__(self, ha=None, bs=8096, bl=128, **kwa):
+    def __init__(self, ha=None, bs=8096, bl=128, selector=None, accepts=None,
+                 maxlive=None, refusable=False, reusable=False, **kwa):
         """
         Initialization method for instance.
         ha is host address duple (host, port) listen interfaces
               host = "" or "0.0.0.0" means listen on all interfaces
         bs = buffer size
         bl (int): backlog size of not yet accepted concurrent tcp connections
+        selector (selectors.BaseSelector): such as Doist.selector to register
+              listen socket read readiness with. None means do not register
+        accepts (int): max accepts per pass. None means use .Accepts
+        maxlive (int): max live connections. None means use .MaxLive
+        refusable (bool): True means refuse at maxlive False means defer
+        reusable (bool): True means listen with SO_REUSEPORT
 
         """
         super(Acceptor, self).__init__(**kwa)
@@ -98,9 +128,27 @@ class Acceptor(tyming.Tymee):
         self.eha = (host, port)
         self.bs = bs
         self.bl = bl
+        self.selector = selector
         self.ss = None  # listen socket for accepts
         self.axes = deque()  # deque of duple (ca, cs) accepted connections
         self.opened = False
+        self.accepts = accepts if accepts is not None else self.Accepts
+        self.maxlive = maxlive if maxlive is not None else self.MaxLive
+        self.refusable = True if refusable else False
+        self.reusable = True if reusable else False
+        self.admits = 0
+        self.refusals = 0
+        self.deferrals = 0
+        self.depth = 0
+        self.peak = 0
+
+
+    @property
+    def live(self):
+        """
+        Returns number of live connections. Subclasses add their connections
+        """
+        return len(self.axes)
 
     def actualBufSizes(self):
         """
@@ -128,6 +176,11 @@ class Acceptor(tyming.Tymee):
         # TIME_WAIT state, without waiting for its natural timeout to expire.
         self.ss.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
+        # the SO_REUSEPORT flag allows other sockets such as those of other
+        # worker processes to bind the same (host, port)
+        if self.reusable:
+            self.ss.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
         # Linux TCP allocates twice the requested size
         if sys.platform.startswith('linux'):
             bs = 2 * self.bs  # get size is twice the set size
@@ -150,6 +203,7 @@ class Acceptor(tyming.Tymee):
             return False
 
         self.ha = self.ss.getsockname()  # get resolved ha after bind
+        coring.selectorRegister(self.selector, self.ss, self)
         self.opened = True
         return True
 
@@ -165,6 +219,7 @@ class Acceptor(tyming.Tymee):
         Closes listen socket.
         """
         if self.ss:
+            coring.selectorUnregister(self.selector, self.ss)
             try:
                 self.ss.shutdown(socket.SHUT_RDWR)  # shutdown socket
             except OSError as ex:
@@ -192,13 +247,33 @@ class Acceptor(tyming.Tymee):
     def serviceAccepts(self):
         """
         Service any accept requests
-        Adds to .cxes dict key by ca
-        """
-        while True:
+        Adds to .axes deque of (cs, ca)
+        Accepts at most .accepts per pass when nonzero.
+        At .maxlive when nonzero refuses or defers per .refusable
+        """
+        count = 0
+        while not self.accepts or count < self.accepts:
+            if self.maxlive and self.live >= self.maxlive:
+                if not self.refusable:  # leave in listen backlog
+                    self.deferrals += 1
+                    break
+                cs, ca = self.accept()
+                if not cs:
+                    break
+                count += 1
+                self.refusals += 1
+                logger.info("Acceptor at %s refused %s at max live %s.\n",
+                            self.ha, ca, self.maxlive)
+                cs.close()
+                continue
             cs, ca = self.accept()
             if not cs:
                 break
+            count += 1
+            self.admits += 1
             self.axes.append((cs, ca))
+        self.depth = len(self.axes)
+        self.peak = max(self.peak, self.depth)
 
 
 class Server(Acceptor):
@@ -218,11 +293,35 @@ class Server(Acceptor):
         .ss is server listen socket for incoming accept requests
         .axes is deque of accepte connection duples (ca, cs)
         .opened is boolean, True if listen socket .ss opened. False otherwise
+        .selector is selectors.BaseSelector to register readiness with or None
 
     Attributes:
         .tymeout is tymeout in seconds for connection refresh
         .wl is WireLog instance if any
         .ixes is dict of incoming connections indexed by remote (host, port) duple
+        .polled is boolean, True means service receives and sends only for
+            remoters whose sockets .poller reports ready so cost scales with
+            active connections not total connections. False means service
+            every remoter in .ixes on every pass.
+        .poller is selectors.DefaultSelector (epoll on linux) of remoter
+            sockets keyed by ca when .polled. None otherwise. Closed by
+            .close and made anew by .open
+        .readies is set of ca of remoters that were newly added or serviced
+            for receives since a consumer such as http.Server last took it
+            when .polled so protocol servers only visit ready connections
+        .ringed is boolean, True means remoters receive directly into a
+            help.Ring .rxbs with recv_into. False means into bytearray .rxbs
+        .reeled is boolean, True means remoters queue transmits as segments
+            on a help.Reel .txbs sent with sendmsg. False means bytearray .txbs
+        .wheel is tyming.Wheel of remoter idle tymeouts keyed by ca when
+            wheeled so only expired remoters are visited. None otherwise
+
+    Hidden:
+        ._polls is dict of remoter sockets registered with .poller keyed by ca
+        ._blocked is set of ca of remoters whose last send was partial so
+            wait for writable before sending again when .polled
+        ._sendables is set of ca of remoters with transmits queued by .tx
+            since their last send when .polled so sends skip idle remoters
     """
 
     Tymeout = 1.0  # tymeout in seconds virtual tyme
@@ -233,6 +332,10 @@ class Server(Acceptor):
                  port=56000,
                  tymeout=None,
                  wl=None,
+                 polled=False,
+                 ringed=False,
+                 reeled=False,
+                 wheeled=False,
                  **kwa):
         """
         Initialization method for instance.
@@ -243,12 +346,37 @@ class Server(Acceptor):
             port is default TCP/IP port
             tymeout is default tymeout for to pass to remoters for incoming connections
             wl is WireLog instance if any
+            polled is boolean, True means service only remoters whose
+                sockets are ready per .poller. False means service all
+            ringed is boolean, True means remoters receive into Ring .rxbs
+                False means remoters receive into bytearray .rxbs
+            reeled is boolean, True means remoters transmit from Reel .txbs
+                False means remoters transmit from bytearray .txbs
+            wheeled is boolean, True means remoters tymeouts are kept in shared
+                .wheel. False means only in each remoter's own .tymer
         """
         ha = ha or (host, port)
         super(Server, self).__init__(ha=ha, **kwa)
         self.tymeout = tymeout if tymeout is not None else self.Tymeout
         self.wl = wl
         self.ixes = dict()  # ready to rx tx incoming connections, Remoter instances
+        self.polled = True if polled else False
+        self.ringed = True if ringed else False
+        self.reeled = True if reeled else False
+        self.wheel = tyming.Wheel(tymth=self.tymth) if wheeled else None
+        self.poller = selectors.DefaultSelector() if self.polled else None
+        self._polls = dict()  # remoter sockets registered with .poller by ca
+        self._blocked = set()  # ca of remoters waiting on writable
+        self._sendables = set()  # ca of remoters with queued transmits
+        self.readies = set()  # ca of new or received remoters when polled
+
+
+    @property
+    def live(self):
+        """
+        Returns number of live connections accepted or in .ixes
+        """
+        return len(self.axes) + len(self.ixes)
 
 
     def wind(self, tymth):
@@ -257,6 +385,8 @@ class Server(Acceptor):
         Updates winds .tymer .tymth
         """
         super(Server, self).wind(tymth)
+        if self.wheel is not None:
+            self.wheel.wind(tymth)
         for rm in self.ixes.values():  # remotoer
             rm.wind(tymth)
 
@@ -281,10 +411,15 @@ class Server(Acceptor):
                               cs=cs,
                               bs=self.bs,
                               wl=self.wl,
-                              timeout=self.tymeout)
+                              tymeout=self.tymeout,
+                              selector=self.selector,
+                              rxbs=help.Ring() if self.ringed else None,
+                              txbs=help.Reel() if self.reeled else None,
+                              wheel=self.wheel)
             if ca in self.ixes and self.ixes[ca] is not remoter:
                 self.shutdownIx(ca)
             self.ixes[ca] = remoter
+            self.pollIx(ca)
 
 
     def serviceConnects(self):
@@ -338,16 +473,33 @@ class Server(Acceptor):
         """
         Shutdown and close all remoter connections
         """
-        for rm in self.ixes.values():  # remoter
+        for ca, rm in self.ixes.items():  # remoter
+            self.unpollIx(ca)
             rm.close()
 
 
+    def open(self):
+        """
+        Opens listen socket. Makes new .poller when .polled and prior one
+        was closed by .close so reopened server still polls
+        """
+        if self.polled and (self.poller is None or self.poller.get_map() is None):
+            self.poller = selectors.DefaultSelector()
+        return super(Server, self).open()
+
+
     def close(self):
         """
-        Close all sockets
+        Close all sockets. Closes .poller to release its fd
         """
         super(Server, self).close()  #  call super close
         self.closeAllIx()
+        if self.poller is not None:
+            self.poller.close()
+            self._polls.clear()
+            self._blocked.clear()
+            self._sendables.clear()
+            self.readies.clear()
 
 
     def removeIx(self, ca, close=True):
@@ -357,6 +509,7 @@ class Server(Acceptor):
         if ca not in self.ixes:
             emsg = "Invalid connection address '{0}'".format(ca)
             raise ValueError(emsg)
+        self.unpollIx(ca)
         if close:
             self.ixes[ca].close()  # shutdown and close socket
         del self.ixes[ca]
@@ -377,10 +530,86 @@ class Server(Acceptor):
             self.removeIx(ca=ca)  # also closes ix
 
 
+    def pollIx(self, ca):
+        """
+        Register socket of remoter given by connection address ca with .poller
+        for read readiness when .polled. A stale registration left by a socket
+        closed outside of .removeIx whose fd was reused is replaced.
+        """
+        if not self.poller:
+            return
+        self.unpollIx(ca)
+        cs = self.ixes[ca].cs
+        try:
+            key = self.poller.get_key(cs)
+        except (KeyError, ValueError):
+            pass
+        else:  # stale key for reused fd
+            self.unpollIx(key.data)
+        try:
+            self.poller.register(cs, selectors.EVENT_READ, ca)
+        except (ValueError, OSError):  # closed socket
+            return
+        self._polls[ca] = cs
+        self.ixes[ca].sendables = self._sendables  # tx marks sendable
+        if self.ixes[ca].txbs:
+            self._sendables.add(ca)
+        self.readies.add(ca)  # new remoter ready for first service
+
+
+    def unpollIx(self, ca):
+        """
+        Unregister socket of remoter given by connection address ca from
+        .poller when .polled
+        """
+        if not self.poller:
+            return
+        cs = self._polls.pop(ca, None)
+        if cs is not None:
+            try:
+                self.poller.unregister(cs)
+            except (KeyError, ValueError):  # already closed
+                pass
+        self._blocked.discard(ca)
+        self._sendables.discard(ca)
+        self.readies.discard(ca)
+
+
+    def pollReadies(self):
+        """
+        Returns duple (readables, writables) of sets of connection addresses
+        ca of remoters whose sockets .poller reports as ready to read and ready
+        to write. Does not block.
+        """
+        readables = set()
+        writables = set()
+        for key, events in self.poller.select(timeout=0):
+            if events & selectors.EVENT_READ:
+                readables.add(key.data)
+            if events & selectors.EVENT_WRITE:
+                writables.add(key.data)
+        return (readables, writables)
+
+
     def serviceReceivesAllIx(self):
         """
         Service receives for all remoters in .ixes
-        """
+        When .polled only for remoters whose sockets are ready to read
+        """
+        if self.polled:
+            readables, writables = self.pollReadies()
+            for ca in readables:
+                ix = self.ixes.get(ca)
+                if ix is None:  # stale key of removed remoter
+                    continue
+                self.readies.add(ca)
+                try:
+                    ix.serviceReceives()
+                except OSError as ex:
+                    logger.error("Closing incoming socket on %s.\n%s\n", ix.ca, ex)
+                    self.removeIx(ca=ca)  # also closes ix
+            return
+
         for ca, ix in list(self.ixes.items()):  # list so can remove while iterating
             try:
                 ix.serviceReceives()
@@ -404,7 +633,36 @@ class Server(Acceptor):
     def serviceSendsAllIx(self):
         """
         Service transmits for all remoters in .ixes
-        """
+        When .polled only for remoters with pending .txbs in ._sendables that
+        are not blocked waiting for their sockets to become writable
+        """
+        if self.polled:
+            writables = set()
+            if self._blocked:
+                readables, writables = self.pollReadies()
+            for ca in list(self._sendables):  # list so can discard
+                rm = self.ixes.get(ca)  # remoter
+                if rm is None:
+                    self._sendables.discard(ca)
+                    continue
+                if rm.txbs and ca in self._blocked and ca not in writables:
+                    continue
+                if rm.txbs:
+                    rm.serviceSends()
+                if rm.txbs and rm.cs and not rm.cutoff:  # partial so wait for writable
+                    if ca not in self._blocked:
+                        self.poller.modify(rm.cs,
+                                           selectors.EVENT_READ | selectors.EVENT_WRITE,
+                                           ca)
+                        self._blocked.add(ca)
+                    continue
+                self._sendables.discard(ca)
+                if ca in self._blocked:  # unblocked so stop polling writable
+                    if rm.cs:
+                        self.poller.modify(rm.cs, selectors.EVENT_READ, ca)
+                    self._blocked.discard(ca)
+            return
+
         for rm in self.ixes.values():  # remoter
             rm.serviceSends()
 
@@ -435,6 +693,11 @@ def initServerContext(context=None,
 
     If certify is not None then use certify value provided Otherwise use default
 
+    Default CA certs are only loaded into a context created here. A provided
+    context is assumed to already have its verify locations.
+    Build once and share the returned context across connections since
+    loading certs and key parses PEM files from disk.
+
     context = context object for tls/ssl If None use default
     version = ssl protocol version If None use default
     certify = cert requirement If None use default
@@ -448,6 +711,7 @@ def initServerContext(context=None,
     cafilepath = Cert Authority file path to use to verify client cert
               If given apply to context
     """
+    created = context is None
     if context is None:  # create context
         if not version:  # use default context with default protocol version
             context = ssl.create_default_context(purpose=ssl.Purpose.CLIENT_AUTH)
@@ -473,7 +737,7 @@ def initServerContext(context=None,
         context.load_verify_locations(cafile=cafilepath,
                                       capath=None,
                                       cadata=None)
-    elif context.verify_mode != ssl.CERT_NONE:
+    elif created and context.verify_mode != ssl.CERT_NONE:
         context.load_default_certs(purpose=ssl.Purpose.CLIENT_AUTH)
 
     if keypath or certpath:
@@ -512,7 +776,27 @@ class ServerTls(Server):
         .keypath is path to key file
         .certpath is path to cert file
         .cafilepath is path to ca file
+        .resumable is boolean, True means enable TLS session tickets on the
+            shared .context so clients may resume sessions. False means
+            disable them. Only applied to .context created by the server not
+            to a provided context
+        .handshakes is int count of completed handshakes
+        .resumptions is int count of completed handshakes that resumed a
+            session. Full handshakes is .handshakes - .resumptions
+        .cxes is dict of accepted connections pending handshake, RemoterTls
+            instances, indexed by remote (host, port) duple
+        .shaketymeout is tymeout in seconds for pending connection in .cxes to
+            complete handshake before it is dropped. 0.0 means no tymeout.
+            Only applies when wound with tymth
+        .shakes is max number of handshakes attempted per .serviceCxes pass.
+            0 means no limit
+        .maxcxes is max number of connections pending handshake in .cxes.
+            Newly accepted connections beyond are refused. 0 means no limit
     """
+    ShakeTymeout = 10.0  # handshake tymeout in seconds virtual tyme
+    Shakes = 0  # max handshake attempts per pass, 0 means no limit
+    MaxCxes = 0  # max pending handshake connections, 0 means no limit
+
     def __init__(self,
                  context=None,
                  version=None,
@@ -520,13 +804,26 @@ class ServerTls(Server):
                  keypath=None,
                  certpath=None,
                  cafilepath=None,
+                 resumable=False,
+                 shaketymeout=None,
+                 shakes=None,
+                 maxcxes=None,
                  **kwa):
         """
         Initialization method for instance.
+
+        Parameters:
+            shaketymeout is tymeout for pending connections to handshake
+            shakes is max handshake attempts per pass
+            maxcxes is max connections pending handshake
         """
         super(ServerTls, self).__init__(**kwa)
 
         self.cxes = dict()  # accepted incoming connections, RemoterTLS instances
+        self.shaketymeout = (shaketymeout if shaketymeout is not None
+                             else self.ShakeTymeout)
+        self.shakes = shakes if shakes is not None else self.Shakes
+        self.maxcxes = maxcxes if maxcxes is not None else self.MaxCxes
 
         self.context = context
         self.version = version
@@ -542,6 +839,33 @@ class ServerTls(Server):
                                          certpath=certpath,
                                          cafilepath=cafilepath
                                         )
+        self.resumable = True if resumable else False
+        if context is None:  # only change session tickets of own context
+            if self.resumable:  # enable session tickets
+                self.context.options &= ~ssl.OP_NO_TICKET
+            else:  # disable session tickets so clients can not resume
+                self.context.options |= ssl.OP_NO_TICKET
+        self.handshakes = 0  # completed handshakes
+        self.resumptions = 0  # completed handshakes that resumed a session
+
+
+    @property
+    def live(self):
+        """
+        Returns number of live connections accepted, pending handshake in
+        .cxes, or in .ixes
+        """
+        return len(self.axes) + len(self.cxes) + len(self.ixes)
+
+
+    def wind(self, tymth):
+        """
+        Inject new tymist.tymth as new ._tymth. Changes tymist.tyme base.
+        Updates winds .tymth of pending remoters in .cxes
+        """
+        super(ServerTls, self).wind(tymth)
+        for cx in self.cxes.values():
+            cx.wind(tymth)
 
 
     def serviceAxes(self):
@@ -550,6 +874,7 @@ class ServerTls(Server):
 
         For each new accepted connection create RemoterTLS and add to .cxes
         Not Handshaked
+        When .maxcxes and .cxes is full refuse by closing accepted connection
         """
         self.serviceAccepts()  # populate .axes
         while self.axes:
@@ -558,19 +883,24 @@ class ServerTls(Server):
                 raise ValueError("Accepted socket host addresses malformed for "
                                  "peer. ca {0} != {1} or ha port {2} != {3}\n"
                                  "".format(ca, cs.getpeername(), self.eha, cs.getsockname()))
+            if self.maxcxes and len(self.cxes) >= self.maxcxes:  # refuse
+                logger.info("Server at %s refused %s too many pending "
+                            "handshakes.\n", self.ha, ca)
+                cs.close()
+                continue
             remoter = RemoterTls(tymth=self.tymth,
                                  ha=cs.getsockname(),
                                  ca=ca,
                                  bs=self.bs,
                                  cs=cs,
                                  wl=self.wl,
-                                 timeout=self.tymeout,
-                                 context=self.context,
-                                 version=self.version,
-                                 certify=self.certify,
-                                 keypath=self.keypath,
-                                 certpath=self.certpath,
-                                 cafilepath=self.cafilepath,
+                                 tymeout=self.tymeout,
+                                 selector=self.selector,
+                                 rxbs=help.Ring() if self.ringed else None,
+                                 txbs=help.Reel() if self.reeled else None,
+                                 wheel=self.wheel,
+                                 context=self.context,  # shared not rebuilt
+                                 shaketymeout=self.shaketymeout,
                                 )
 
             self.cxes[ca] = remoter
@@ -578,18 +908,37 @@ class ServerTls(Server):
 
     def serviceCxes(self):
         """
-        Service handshakes for every remoter in .cxes
+        Service handshakes for remoters in .cxes, at most .shakes when nonzero
         If successful move to .ixes
-        """
-        for ca, cx in list(self.cxes.items()):  # list so can remove during iteration
+        If handshake tymed out drop it
+        Still pending remoters rotate to back of .cxes so all get a turn
+        when .shakes limits attempts per pass
+        """
+        cxes = list(self.cxes.items())  # list so can remove during iteration
+        if self.shakes:
+            cxes = cxes[:self.shakes]
+        for ca, cx in cxes:
+            if (cx.shaketymeout > 0.0 and cx.tymth is not None and
+                    cx.shaker.expired):  # drop slow handshake
+                logger.info("Server at %s dropped %s handshake tymed out.\n",
+                            self.ha, ca)
+                cx.close()
+                del self.cxes[ca]
+                continue
             cx.handshake()
             if cx.connected:  # handshake completed successfully
+                self.handshakes += 1
+                if cx.cs.session_reused:
+                    self.resumptions += 1
                 del self.cxes[ca]
                 self.ixes[ca] = cx  # add to incoming connections
+                self.pollIx(ca)
                 continue
             if cx.aborted:  # handshake completed unsuccessfully
                 del self.cxes[ca] # remove and let client startover
                 continue
+            del self.cxes[ca]  # rotate pending to back
+            self.cxes[ca] = cx
 
 
 
@@ -620,6 +969,11 @@ class Remoter(tyming.Tymee):
                  refreshable=True,
                  bs=8096,
                  wl=None,
+                 selector=None,
+                 rxbs=None,
+                 txbs=None,
+                 wheel=None,
+                 sendables=None,
                  **kwa
                 ):
 
@@ -635,6 +989,16 @@ class Remoter(tyming.Tymee):
         refreshable = True if tx/rx activity refreshes timer False otherwise
         bs = buffer size
         wl = WireLog object if any
+        selector = selectors.BaseSelector such as Doist.selector to register
+                   read readiness of .cs with. None means do not register
+        rxbs = bytearray or Ring of data received. None means new bytearray
+               Ring receives directly into its free space with recv_into
+        txbs = bytearray or Reel of data to send. None means new bytearray
+               Reel queues segments without copying and sends with sendmsg
+        wheel = tyming.Wheel shared by server to also keep tymeout of .ca in
+                instead of visiting .tymer of every remoter. None means no wheel
+        sendables = set shared by polled server that .tx adds .ca to so server
+                    only services sends of remoters with queued transmits
         """
         super(Remoter, self).__init__(**kwa)
         self.ha = ha  # connection address of server
@@ -645,11 +1009,18 @@ class Remoter(tyming.Tymee):
         self.tymeout = tymeout if tymeout is not None else self.Tymeout
         self.tymer = tyming.Tymer(tymth=self.tymth, duration=self.tymeout)
         self.cutoff = False # True when detect connection closed on far side
+        self.paused = False  # True means do not receive so TCP flow controls peer
         self.refreshable = refreshable
         self.bs = bs
-        self.txbs = bytearray()  # bytearray of data to send
-        self.rxbs = bytearray()  # bytearray of data received
+        self.txbs = txbs if txbs is not None else bytearray()  # data to send
+        self.rxbs = rxbs if rxbs is not None else bytearray()  # data received
         self.wl = wl
+        self.selector = selector
+        coring.selectorRegister(self.selector, self.cs, self)
+        self.wheel = wheel
+        if self.wheel is not None and self.tymeout > 0.0:
+            self.wheel.start(self.ca, self.tymeout)
+        self.sendables = sendables
 
 
     def wind(self, tymth):
@@ -699,19 +1070,44 @@ class Remoter(tyming.Tymee):
         Shutdown and close connected socket .cs
         """
         if self.cs:
+            coring.selectorUnregister(self.selector, self.cs)
             self.shutdown()
             self.cs.close()  #close socket
             self.cs = None
+        if self.wheel is not None:
+            self.wheel.remove(self.ca)
 
 
     def refresh(self):
         """
-        Restart tymer
+        Restart tymer and tymeout in .wheel if any from now for .tymeout
+        so idle tymeout is measured from last activity
         """
-        self.tymer.restart()
+        if self.tymth:  # not wound has no tyme to restart from
+            self.tymer.start(duration=self.tymeout)
+        if self.wheel is not None:
+            if self.tymeout > 0.0:
+                self.wheel.start(self.ca, self.tymeout)
+            else:  # tymeout disabled such as persisted http connection
+                self.wheel.remove(self.ca)
 
 
-    def receive(self):
+    def retymeout(self, tymeout, refreshable=True):
+        """
+        Change .tymeout and .refreshable then restart tymer from now.
+        Used by protocol servers to apply different tymeouts to different
+        phases of a connection such as reading a request head versus idle
+
+        Parameters:
+            tymeout (float): new tymeout in seconds. 0.0 means never tymeout
+            refreshable (bool): True means rx/tx activity restarts tymer
+        """
+        self.tymeout = tymeout
+        self.refreshable = True if refreshable else False
+        self.refresh()
+
+
+    def receive(self, into=None):
         """
         Perform non blocking receive on connected socket .cs
 
@@ -720,9 +1116,17 @@ class Remoter(tyming.Tymee):
         Otherwise returns data
 
         data is string in python2 and bytes in python3
+
+        Parameters:
+            into (Ring): when provided receive directly into free space of
+                ring buffer into with recv_into instead of allocating bytes.
+                Then data is memoryview of received bytes already in into
         """
         try:
-            data = self.cs.recv(self.bs)
+            if into is not None:  # receive directly into free space of ring
+                data = into.fill(self.cs.recv_into, self.bs)
+            else:
+                data = self.cs.recv(self.bs)
         except OSError as ex:
             # ex.args[0] == ex.errno for better os compatibility.
             # the value of a given errno.XXXXX may be different on each os
@@ -758,22 +1162,29 @@ class Remoter(tyming.Tymee):
     def serviceReceives(self):
         """
         Service receives until no more
+        When .rxbs is Ring then receive directly into it
+        Does not receive while .paused
         """
-        while not self.cutoff:
-            data = self.receive()
+        ringed = isinstance(self.rxbs, help.Ring)
+        while not self.cutoff and not self.paused:
+            data = self.receive(into=self.rxbs if ringed else None)
             if not data:
                 break
-            self.rxbs.extend(data)
+            if not ringed:
+                self.rxbs.extend(data)
 
 
     def serviceReceiveOnce(self):
         '''
         Retrieve from server only one reception
         '''
-        if not self.cutoff:
-            data = self.receive()
-            if data:
-                self.rxbs.extend(data)
+        if not self.cutoff and not self.paused:
+            if isinstance(self.rxbs, help.Ring):
+                self.receive(into=self.rxbs)
+            else:
+                data = self.receive()
+                if data:
+                    self.rxbs.extend(data)
 
 
     def clearRxbs(self):
@@ -788,10 +1199,16 @@ class Remoter(tyming.Tymee):
         Perform non blocking send on connected socket .cs.
         Return number of bytes sent
 
-        data is string in python2 and bytes in python3
+        data is bytes or Reel. Reel sends all its segments with one sendmsg
         """
         try:
-            count = self.cs.send(data) #result is number of bytes sent
+            if isinstance(data, help.Reel):
+                if hasattr(self.cs, "sendmsg"):  # gather write
+                    count = self.cs.sendmsg(data.buffers())
+                else:
+                    count = self.cs.send(data.peek())
+            else:
+                count = self.cs.send(data) #result is number of bytes sent
         except OSError as ex:
             # ex.args[0] == ex.errno for better compat
             # the value of a given errno.XXXXX may be different on each os
@@ -822,9 +1239,12 @@ class Remoter(tyming.Tymee):
 
     def tx(self, data):
         '''
-        Queue data onto .txbs
+        Queue data onto .txbs. When .txbs is Reel bytes data is not copied
+        Marks .ca in .sendables if any
         '''
         self.txbs.extend(data)
+        if self.sendables is not None:
+            self.sendables.add(self.ca)
 
 
     def serviceSends(self):
@@ -849,7 +1269,12 @@ class RemoterTls(Remoter):
     Attributes:
         connected (bool): True means TLS handshake completed False otherwise
         aborted (bool): True means client aborted TLS handshake False otherwise
+        shaketymeout (float): tymeout in seconds to complete handshake.
+            0.0 means no tymeout
+        shaker (Tymer): handshake tymer started when accepted
     """
+    ShakeTymeout = 0.0  # handshake tymeout in seconds virtual tyme
+
     def __init__(self,
                  context=None,
                  version=None,
@@ -857,11 +1282,15 @@ class RemoterTls(Remoter):
                  keypath=None,
                  certpath=None,
                  cafilepath=None,
+                 shaketymeout=None,
                  **kwa):
 
         """
         Initialization method for instance.
-        context = context object for tls/ssl If None use default
+        context = context object for tls/ssl. When provided such as shared
+                  .context of ServerTls it is used as is for wrap without
+                  reloading certs or key. If None create one with
+                  initServerContext from the parameters below
         version = ssl version If None use default
         certify = cert requirement If None use default
                   ssl.CERT_NONE = 0
@@ -873,31 +1302,48 @@ class RemoterTls(Remoter):
                   If given apply to context
         cafilepath = Cert Authority file path to use to verify client cert
                   If given apply to context
+        shaketymeout = tymeout for .shaker to complete handshake
         """
         super(RemoterTls, self).__init__(**kwa)
 
         self.connected = False  # True once ssl handshake completed
         self.aborted = False # True if client aborts TLS handshake prematurely
-
-        self.context = initServerContext(context=context,
-                                    version=version,
-                                    certify=certify,
-                                    keypath=keypath,
-                                    certpath=certpath,
-                                    cafilepath=cafilepath
-                                  )
+        self.shaketymeout = (shaketymeout if shaketymeout is not None
+                             else self.ShakeTymeout)
+        self.shaker = tyming.Tymer(tymth=self.tymth, duration=self.shaketymeout)
+
+        if context is None:
+            context = initServerContext(version=version,
+                                        certify=certify,
+                                        keypath=keypath,
+                                        certpath=certpath,
+                                        cafilepath=cafilepath
+                                       )
+        self.context = context
         self.wrap()
 
 
+    def wind(self, tymth):
+        """
+        Inject new tymist.tymth as new ._tymth. Changes tymist.tyme base.
+        Updates winds .shaker .tymth
+        """
+        super(RemoterTls, self).wind(tymth)
+        self.shaker.wind(tymth)
+
+
     def close(self):
         """
         Shutdown and close connected socket .cs
         """
         if self.cs:
+            coring.selectorUnregister(self.selector, self.cs)
             self.shutdown()
             self.cs.close()  #close socket
             self.cs = None
             self.connected = False
+        if self.wheel is not None:
+            self.wheel.remove(self.ca)
 
 
     def wrap(self):
@@ -950,7 +1396,7 @@ class RemoterTls(Remoter):
         self.connected = True  # handshake completed successfully
 
 
-    def receive(self):
+    def receive(self, into=None):
         """
         Perform non blocking receive on connected socket .cs
 
@@ -959,9 +1405,17 @@ class RemoterTls(Remoter):
         Otherwise returns data
 
         data is string in python2 and bytes in python3
+
+        Parameters:
+            into (Ring): when provided receive directly into free space of
+                ring buffer into with recv_into instead of allocating bytes.
+                Then data is memoryview of received bytes already in into
         """
         try:
-            data = self.cs.recv(self.bs)
+            if into is not None:  # receive directly into free space of ring
+                data = into.fill(self.cs.recv_into, self.bs)
+            else:
+                data = self.cs.recv(self.bs)
         except OSError as ex:  # ssl.SSLError is a subtype of OSError
             # ex.args[0] == ex.errno for better compat
             # the value of a given errno.XXXXX may be different on each os
@@ -997,10 +1451,14 @@ class RemoterTls(Remoter):
         Perform non blocking send on connected socket .cs.
         Return number of bytes sent
 
-        data is string in python2 and bytes in python3
+        data is bytes or Reel. SSLSocket has no sendmsg so Reel sends its
+        first segment
         """
         try:
-            result = self.cs.send(data) #result is number of bytes sent
+            if isinstance(data, help.Reel):
+                result = self.cs.send(data.peek())
+            else:
+                result = self.cs.send(data) #result is number of bytes sent
         except OSError as ex:  # ssl.SSLError is a subtype of OSError
             # ex.args[0] == ex.errno for better compat
             # the value of a given errno.XXXXX may be different on each os
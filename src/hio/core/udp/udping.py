@@ -9,6 +9,7 @@ import socket
 
 
 from ... import help
+from .. import coring
 
 logger = help.ogler.getLogger()
 
@@ -30,7 +31,8 @@ class Peer(object):
                  port=55000,
                  bufsize=1024,
                  wl=None,
-                 bcast=False):
+                 bcast=False,
+                 selector=None):
         """
         Initialization method for instance.
 
@@ -41,11 +43,14 @@ class Peer(object):
         path = path to log file directory
         wl = WireLog instance ref for debug logging or over the wire tx and rx
         bcast = Flag if True enables sending to broadcast addresses on socket
+        selector = selectors.BaseSelector such as Doist.selector to register
+                   read readiness of socket with. None means do not register
         """
         self.ha = ha or (host, port)  # ha = host address duple (host, port)
         self.bs = bufsize
         self.wl = wl
         self.bcast = bcast
+        self.selector = selector
 
         self.ss = None #server's socket needs to be opened
         self.opened = False
@@ -93,6 +98,7 @@ class Peer(object):
             return False
 
         self.ha = self.ss.getsockname() #get resolved ha after bind
+        coring.selectorRegister(self.selector, self.ss, self)
         self.opened = True
         return True
 
@@ -108,6 +114,7 @@ class Peer(object):
         Closes  socket and logs if any
         """
         if self.ss:
+            coring.selectorUnregister(self.selector, self.ss)
             self.ss.close() #close socket
             self.ss = None
             self.opened = False
@@ -15,6 +15,8 @@ from . import ogling
 ogler = ogling.initOgler(prefix='hio')  # init only runs  once on import
 
 from .decking import Deck
+from .ringing import Ring
+from .reeling import Reel
 from .hicting import Hict, Mict
 from .timing import Timer, MonoTimer, TimerError, RetroTimerError
 
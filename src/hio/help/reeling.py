@@ -0,0 +1,220 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.help.reeling module
+
+Support for Reel class, a segmented scatter gather transmit queue
+
+"""
+from collections import deque
+
+
+class Reel():
+    """
+    Reel is a transmit queue of byte segments with a send cursor (offset) into
+    the first segment. Queueing an immutable bytes or read only memoryview
+    segment keeps a reference instead of copying its bytes. Mutable data such
+    as bytearray is copied once since the caller may change it after queueing.
+    All queued segments are flushed together with a single gather write such
+    as socket.sendmsg (writev). A partial send only advances the cursor and
+    pops fully sent segments so unsent bytes are never moved.
+
+    Reel exposes the subset of the bytearray interface used by the transmit
+    paths on the unsent bytes so it may be used as a drop in replacement for a
+    bytearray .txbs. Deleting a leading slice consumes sent bytes.
+
+    Usage:
+        reel = Reel()
+        reel.extend(head)
+        reel.extend(body)  # not concatenated with head
+        count = sock.sendmsg(reel.buffers())
+        del reel[:count]  # or reel.consume(count)
+
+    Properties:
+        segments (int): number of queued segments
+
+    Methods:
+        buffers(limit): returns list of unsent segments for sendmsg
+        peek(): returns memoryview of unsent bytes of first segment
+        consume(size): advances cursor by size
+        extend(data): appends data as segment
+        clear(): consumes all unsent bytes
+
+    Hidden:
+        ._segs (deque): queued segments
+        ._offset (int): offset into first segment of first unsent byte
+        ._size (int): total number of unsent bytes
+    """
+    IovMax = 1024  # default max segments per gather write, linux IOV_MAX
+
+    def __init__(self, data=b""):
+        """
+        Initialize instance
+
+        Parameters:
+            data (bytes | bytearray | memoryview): initial unsent bytes
+        """
+        self._segs = deque()
+        self._offset = 0
+        self._size = 0
+        if data:
+            self.extend(data)
+
+
+    @property
+    def segments(self):
+        """
+        Returns number of queued segments
+        """
+        return len(self._segs)
+
+
+    def extend(self, data):
+        """
+        Append data as new segment at tail. Empty data is ignored.
+        Keeps reference to bytes or read only contiguous memoryview.
+        Otherwise appends bytes copy of data.
+
+        Parameters:
+            data (bytes | bytearray | memoryview): bytes to append
+        """
+        if isinstance(data, Reel):
+            for seg in data.buffers(limit=None):
+                self.extend(seg)
+            return
+        if isinstance(data, memoryview):
+            if data.readonly and data.c_contiguous:
+                data = data.cast("B")
+            else:
+                data = bytes(data)
+        elif not isinstance(data, bytes):
+            data = bytes(data)
+        if data:
+            self._segs.append(data)
+            self._size += len(data)
+
+
+    def buffers(self, limit=-1):
+        """
+        Returns list of unsent segments suitable for socket.sendmsg.
+        First segment is memoryview starting at cursor.
+
+        Parameters:
+            limit (int | None): max number of segments. -1 means .IovMax
+                None means all
+        """
+        if not self._segs:
+            return []
+        limit = self.IovMax if limit == -1 else limit
+        bufs = [memoryview(self._segs[0])[self._offset:]]
+        for i, seg in enumerate(self._segs):
+            if i == 0:
+                continue
+            if limit is not None and i >= limit:
+                break
+            bufs.append(seg)
+        return bufs
+
+
+    def peek(self):
+        """
+        Returns memoryview of unsent bytes of first segment. Empty when none.
+        Useful for sockets without gather write such as ssl.SSLSocket
+        """
+        if not self._segs:
+            return memoryview(b"")
+        return memoryview(self._segs[0])[self._offset:]
+
+
+    def consume(self, size):
+        """
+        Advance cursor by size bytes, at most to end, popping fully sent
+        segments.
+
+        Parameters:
+            size (int): number of unsent bytes consumed
+        """
+        size = min(max(size, 0), self._size)
+        self._size -= size
+        size += self._offset
+        while self._segs and size >= len(self._segs[0]):
+            size -= len(self._segs.popleft())
+        self._offset = size if self._segs else 0
+
+
+    def clear(self):
+        """
+        Consume all unsent bytes
+        """
+        self._segs.clear()
+        self._offset = 0
+        self._size = 0
+
+
+    def __len__(self):
+        return self._size
+
+
+    def __bool__(self):
+        return self._size > 0
+
+
+    def __bytes__(self):
+        return b"".join(self.buffers(limit=None))
+
+
+    def __iter__(self):
+        return iter(bytes(self))
+
+
+    def __eq__(self, other):
+        if isinstance(other, Reel):
+            other = bytes(other)
+        try:
+            return bytes(self) == memoryview(other)
+        except TypeError:
+            return NotImplemented
+
+
+    def __repr__(self):
+        return "Reel({0!r})".format(bytes(self))
+
+
+    def __getitem__(self, key):
+        """
+        Returns int for index key or bytes copy for slice key of unsent bytes.
+        Leading slice only joins segments it covers.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._size)
+            if start == 0 and step == 1:
+                parts = []
+                size = max(stop, 0)
+                for buf in self.buffers(limit=None):
+                    if size <= 0:
+                        break
+                    parts.append(buf[:size])
+                    size -= len(buf)
+                return b"".join(parts)
+            return bytes(self)[key]
+        return bytes(self)[key]
+
+
+    def __delitem__(self, key):
+        """
+        Delete index or slice of unsent bytes like bytearray.
+        Deleting a leading slice advances the cursor without moving memory.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._size)
+            if start == 0 and step == 1:
+                self.consume(stop)
+                return
+        data = bytearray(bytes(self))
+        del data[key]
+        self.clear()
+        self.extend(data)
+
+
+    def __iadd__(self, data):
+        self.extend(data)
+        return self
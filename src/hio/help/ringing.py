@@ -0,0 +1,270 @@
+# -*- encoding: utf-8 -*-
+"""
+hio.help.ringing module
+
+Support for Ring class, a reusable growable receive buffer
+
+"""
+
+
+class Ring():
+    """
+    Ring is a preallocated growable byte buffer with a read cursor (head) and
+    a write cursor (tail). Receives write directly into the free space after
+    the tail with a recv_into style reader so no intermediate bytes object is
+    created and copied. Consumers read memoryview slices of the unread bytes
+    and advance the head. Consumed space is reclaimed by compacting the unread
+    bytes to the front only when the free space after the tail is too small
+    for the next fill and enough space has been consumed. Otherwise the buffer
+    doubles in capacity. When all bytes are consumed both cursors reset to
+    the front for free.
+
+    Ring exposes the subset of the bytearray interface used by the http
+    parsers, such as httping.parseLine, on the unread bytes so it may be used
+    as a drop in replacement for a bytearray .rxbs such as .msg of Requestant
+    and Respondent. Slicing returns bytearray copies like bytearray does.
+    Deleting a leading slice advances the head instead of moving memory.
+
+    Usage:
+        ring = Ring(size=8192)
+        data = ring.fill(sock.recv_into, 4096)  # memoryview of received bytes
+        index = ring.find(b"\r\n")
+        line = ring[:index]  # bytearray copy
+        del ring[:index + 2]  # advance head
+        with ring.view() as view:  # zero copy memoryview of unread bytes
+            count = sock.send(view)
+        ring.consume(count)
+
+    Views are only valid until the next fill, extend or compaction since
+    these may move the unread bytes.
+
+    Properties:
+        capacity (int): allocated size of underlying bytearray
+
+    Methods:
+        view(): returns memoryview of unread bytes
+        fill(reader, size): reads at most size bytes into free space
+        consume(size): advances head by size
+        extend(data): appends data at tail
+        clear(): consumes all unread bytes
+
+    Hidden:
+        ._buf (bytearray): underlying storage
+        ._head (int): offset into ._buf of first unread byte
+        ._tail (int): offset into ._buf one past last unread byte
+    """
+    Size = 8192  # default initial capacity
+
+    def __init__(self, data=b"", size=None):
+        """
+        Initialize instance
+
+        Parameters:
+            data (bytes | bytearray | memoryview): initial unread bytes
+            size (int): initial capacity. None means use .Size
+        """
+        size = size if size is not None else self.Size
+        self._buf = bytearray(max(size, len(data), 1))
+        self._head = 0
+        self._tail = 0
+        if data:
+            self.extend(data)
+
+
+    @property
+    def capacity(self):
+        """
+        Returns allocated size of underlying bytearray
+        """
+        return len(self._buf)
+
+
+    def reserve(self, size):
+        """
+        Ensure at least size bytes of free space after tail. Compacts unread
+        bytes to the front when afterwards at most half of capacity is in use
+        so compaction is amortized. Otherwise grows by doubling capacity.
+
+        Parameters:
+            size (int): number of free bytes needed after tail
+        """
+        free = len(self._buf) - self._tail
+        if free >= size:
+            return
+
+        count = self._tail - self._head
+        if count + size <= len(self._buf) // 2:
+            # same size slice assignment so memmove without resize
+            self._buf[:count] = self._buf[self._head:self._tail]
+        else:  # grow. new bytearray so any exported views stay valid
+            capacity = len(self._buf)
+            while capacity < count + size:
+                capacity *= 2
+            buf = bytearray(capacity)
+            buf[:count] = self._buf[self._head:self._tail]
+            self._buf = buf
+        self._head = 0
+        self._tail = count
+
+
+    def fill(self, reader, size):
+        """
+        Returns memoryview of bytes read into free space after tail by reader
+        and advances tail. Empty memoryview means reader read nothing.
+        Exceptions raised by reader propagate with tail unchanged.
+
+        Parameters:
+            reader (Callable): recv_into like callable reader(buffer) that
+                fills a writable buffer and returns number of bytes written
+                such as socket.recv_into or io.RawIOBase.readinto
+            size (int): max number of bytes to read
+        """
+        self.reserve(size)
+        start = self._tail
+        with memoryview(self._buf) as buf:
+            count = reader(buf[start:start + size])
+        count = count or 0  # readinto may return None when nonblocking
+        self._tail += count
+        return memoryview(self._buf)[start:start + count]
+
+
+    def view(self):
+        """
+        Returns memoryview of unread bytes without copying
+        """
+        return memoryview(self._buf)[self._head:self._tail]
+
+
+    def consume(self, size):
+        """
+        Advance head by size bytes, at most to tail. Resets cursors when empty
+
+        Parameters:
+            size (int): number of unread bytes consumed
+        """
+        self._head = min(self._head + max(size, 0), self._tail)
+        if self._head == self._tail:
+            self._head = self._tail = 0
+
+
+    def extend(self, data):
+        """
+        Append data at tail
+
+        Parameters:
+            data (bytes | bytearray | memoryview): bytes to append
+        """
+        size = len(data)
+        self.reserve(size)
+        self._buf[self._tail:self._tail + size] = data
+        self._tail += size
+
+
+    def clear(self):
+        """
+        Consume all unread bytes
+        """
+        self._head = self._tail = 0
+
+
+    def find(self, sub, start=None, end=None):
+        """
+        Returns lowest index of sub in unread bytes like bytearray.find or -1
+
+        Parameters:
+            sub (bytes | int): subsequence to find
+            start (int): optional index to start search
+            end (int): optional index to end search
+        """
+        start, end, step = slice(start, end).indices(len(self))
+        index = self._buf.find(sub, self._head + start, self._head + end)
+        return index - self._head if index >= 0 else index
+
+
+    def startswith(self, prefix):
+        """
+        Returns True if unread bytes start with prefix
+        """
+        return self._buf.startswith(prefix, self._head, self._tail)
+
+
+    def decode(self, encoding="utf-8", errors="strict"):
+        """
+        Returns str of decoded unread bytes
+        """
+        with self.view() as view:
+            return str(view, encoding, errors)
+
+
+    def __len__(self):
+        return self._tail - self._head
+
+
+    def __bool__(self):
+        return self._tail > self._head
+
+
+    def __bytes__(self):
+        with self.view() as view:
+            return bytes(view)
+
+
+    def __iter__(self):
+        return iter(self._buf[self._head:self._tail])
+
+
+    def __contains__(self, sub):
+        return self.find(sub) >= 0
+
+
+    def __eq__(self, other):
+        if isinstance(other, Ring):
+            other = other.view()
+        try:
+            with self.view() as view:
+                return view == other
+        except TypeError:
+            return NotImplemented
+
+
+    def __repr__(self):
+        return "Ring({0!r})".format(bytes(self))
+
+
+    def __getitem__(self, key):
+        """
+        Returns int for index key or bytearray copy for slice key of unread
+        bytes like bytearray
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._buf[self._head + start:self._head + max(start, stop)]
+            return bytearray(self._buf[self._head:self._tail])[key]
+        size = len(self)
+        if key < 0:
+            key += size
+        if not 0 <= key < size:
+            raise IndexError("Ring index out of range")
+        return self._buf[self._head + key]
+
+
+    def __delitem__(self, key):
+        """
+        Delete index or slice of unread bytes like bytearray.
+        Deleting a leading slice advances the head without moving memory.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if start == 0 and step == 1:
+                self.consume(stop)
+                return
+        data = bytearray(self._buf[self._head:self._tail])
+        del data[key]
+        self.clear()
+        self.extend(data)
+
+
+    def __iadd__(self, data):
+        self.extend(data)
+        return self
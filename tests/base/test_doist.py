@@ -4,9 +4,15 @@ tests.core.test_cycling module
 
 """
 import pytest
+import os
 import inspect
+import selectors
+import time
+import socket
+from collections import deque
 
 from hio.base import doing
+from hio.core import coring
 from hio.base.basing import State
 from hio.base.doing import TryDoer, tryDo
 
@@ -926,6 +932,265 @@ def test_doist_dos():
     """End Test """
 
 
+def test_doist_heaped():
+    """
+    Test Doist and DoDoer with heaped deeds run the same as with deque deeds
+    """
+    tock = 0.03125
+    doist = doing.Doist(tock=tock, heaped=True)
+    assert doist.heaped == True
+    assert doist.deeds == []
+
+    doer0 = doing.ExDoer(tock=tock, tymth=doist.tymen())
+    doer1 = doing.ExDoer(tock=tock*2, tymth=doist.tymen())
+    doist.doers = [doer0, doer1]
+    doist.enter()
+    assert [deed[0] for deed in doist.deeds] == [0.0, 0.0]  # retymes
+    assert [deed[1] for deed in doist.deeds] == [0, 1]  # enter orders
+    doist.recur()
+    assert doist.tyme == tock
+    assert sorted(deed[0] for deed in doist.deeds) == [tock, tock*2]
+    doist.exit()
+    assert not doist.deeds
+    assert doer0.done == doer1.done == False
+
+    def run(heaped):
+        """
+        Run nested doers and return list of states of each ExDoer
+        """
+        doist = doing.Doist(tock=tock, heaped=heaped)
+        doer0 = doing.ExDoer(tock=0.0, tymth=doist.tymen())
+        doer1 = doing.ExDoer(tock=tock*2, tymth=doist.tymen())
+        doer2 = doing.ExDoer(tock=0.0, tymth=doist.tymen())
+        doer3 = doing.ExDoer(tock=tock*4, tymth=doist.tymen())
+        aDoer = doing.DoDoer(tock=0.0, doers=[doer0, doer1], heaped=heaped)
+        bDoer = doing.DoDoer(tock=tock*2, doers=[doer2, doer3], heaped=heaped)
+        doer4 = doing.ExDoer(tock=tock*3, tymth=doist.tymen())
+        doist.do(doers=[aDoer, bDoer, doer4], limit=tock * 8)
+        assert doist.tyme == 0.25
+        assert aDoer.done == True
+        assert bDoer.done == False
+        return [doer.states for doer in (doer0, doer1, doer2, doer3, doer4)]
+
+    assert run(heaped=True) == run(heaped=False)
+
+    # same round robin order for deeds due at same tyme
+    order = []
+    def recorder(name):
+        @doing.doize(tock=tock)
+        def recordDo(tymth=None, tock=0.0, **opts):
+            yield
+            while True:
+                order.append(name)
+                yield tock
+        return recordDo
+
+    doist = doing.Doist(tock=tock, heaped=True, limit=tock * 3)
+    doist.do(doers=[recorder(name) for name in "abc"])
+    assert order == ["a", "b", "c"] * 3
+
+    # remove by own doer while other due deeds are pending
+    doist = doing.Doist(tock=1.0, limit=5.0, heaped=True)
+    @doing.doize(tock=0.0, doist=doist)
+    def removeDo(tymth=None, tock=0.0, doist=None, **opts):
+        yield
+        doist.remove([doer for doer in doist.doers if doer != removeDo])
+        yield
+        return True
+
+    doer0 = TryDoer(stop=1)
+    doer1 = TryDoer(stop=2)
+    doist.doers = [removeDo, doer0, doer1]  # removeDo runs first
+    doist.enter()
+    doist.recur()
+    assert doist.doers == [removeDo]
+    assert len(doist.deeds) == 1
+    assert doer0.states[-1].context == doer1.states[-1].context == "exit"
+    assert doer0.count == doer1.count == 2  # enter close exit so never recurred
+    doist.recur()
+    assert not doist.deeds
+    assert removeDo.done
+
+    with pytest.raises(TypeError):
+        doing.DoDoer(heaped=True).deeds = deque()
+    """End Test """
+
+
+def test_doist_warp():
+    """
+    Test Doist warp fast forwards tyme without changing the tymes doers see
+    """
+    tock = 0.125
+
+    def run(warp, heaped=False, limit=20.0):
+        """
+        Run doers with slow tocks and nested doers and return tuple of final
+        doist tyme, count of recurs and list of states of each ExDoer
+        """
+        doist = doing.Doist(tock=tock, warp=warp, heaped=heaped, limit=limit)
+        assert doist.warp == warp
+        doer0 = doing.ExDoer(tock=1.0)
+        doer1 = doing.ExDoer(tock=2.5)
+        doer2 = doing.ExDoer(tock=3.0)
+        doer3 = doing.ExDoer(tock=1.75)
+        doer4 = doing.ExDoer(tock=0.3)
+        aDoer = doing.DoDoer(tock=0.5, doers=[doer2], heaped=heaped)
+        bDoer = doing.DoDoer(tock=0.0, doers=[doer3, doer4], heaped=heaped)
+        cDoer = doing.DoDoer(tock=0.0, always=True, heaped=heaped)  # idle
+
+        counts = []
+        recur = doist.recur
+        def counter(deeds=None):
+            counts.append(doist.tyme)
+            recur(deeds=deeds)
+        doist.recur = counter
+
+        doist.do(doers=[doer0, doer1, aDoer, bDoer, cDoer])
+        return (doist.tyme, len(counts),
+                [doer.states for doer in (doer0, doer1, doer2, doer3, doer4)])
+
+    tyme, count, states = run(warp=False)
+    assert tyme == 20.0
+    assert count == 160
+
+    wtyme, wcount, wstates = run(warp=True)
+    assert wstates == states
+    assert wtyme == tyme
+    assert wcount < count
+
+    htyme, hcount, hstates = run(warp=True, heaped=True)
+    assert hstates == states
+    assert htyme == tyme
+    assert hcount == wcount
+
+    # heaped earliest reads heap head instead of walking every deed
+    doist = doing.Doist(tock=tock, heaped=True)
+    doist.doers = [doing.ExDoer(tock=1.0 + i) for i in range(100)]
+    doist.enter()
+    doist.recur()
+    visits = []
+    dueRetyme = doing.dueRetyme
+    def counter(retyme, doer):
+        visits.append(doer)
+        return dueRetyme(retyme, doer)
+    doing.dueRetyme = counter
+    try:
+        assert doist.earliest() == 1.0
+    finally:
+        doing.dueRetyme = dueRetyme
+    assert visits == [doist.doers[0]]
+    doist.exit()
+
+    # ignored when real
+    doist = doing.Doist(tock=tock, warp=True, real=True)
+    doer0 = doing.ExDoer(tock=1.0)
+    doist.doers = [doer0]
+    doist.enter()
+    doist.recur()
+    assert doist.earliest() == 1.0
+    assert doist.leap(limit=0.5) == 3  # last tick before limit
+    assert doist.tyme == 0.5
+    assert doist.leap() == 4
+    assert doist.tyme == 1.0
+    assert doist.leap() == 0  # already due
+    doist.exit()
+    assert doist.earliest() is None
+    """End Test """
+
+def test_doist_selecting():
+    """
+    Test real time Doist with selector blocks until due or fd ready
+    """
+    doist = doing.Doist(tock=0.015625, real=True, limit=0.375, selecting=True)
+    assert doist.selector is not None
+    assert doing.Doist().selector is None
+
+    rs, ws = socket.socketpair()
+    assert coring.selectorRegister(doist.selector, rs, data=rs)
+    assert coring.selectorRegister(doist.selector, rs, data=rs)  # idempotent
+
+    tymes = []
+    @doing.doize(tock=0.125)
+    def slowDo(tymth=None, tock=0.0, **opts):
+        yield
+        while True:
+            tymes.append(tymth())
+            yield tock
+
+    counts = []
+    recur = doist.recur
+    def counter(deeds=None):
+        counts.append(doist.tyme)
+        recur(deeds=deeds)
+    doist.recur = counter
+
+    start = time.monotonic()
+    doist.do(doers=[slowDo])
+    elapsed = time.monotonic() - start
+    assert tymes == [0.0, 0.125, 0.25]  # same tymes as sleeping every tock
+    assert len(counts) < 12  # instead of 24 recurs
+    assert doist.tyme == 0.375
+    assert elapsed == pytest.approx(0.375, abs=0.1)
+
+    # readiness wakes before tock expires
+    doist = doing.Doist(tock=1.0, real=True, limit=2.0, selecting=True)
+    coring.selectorRegister(doist.selector, rs, data=rs)
+    stamps = []
+    @doing.doize(tock=0.0)
+    def readDo(tymth=None, tock=0.0, **opts):
+        yield
+        ws.send(b"ready")
+        stamps.append(time.monotonic())
+        yield
+        assert rs.recv(64) == b"ready"
+        stamps.append(time.monotonic())
+        return True
+
+    doist.do(doers=[readDo])
+    assert readDo.done
+    assert stamps[1] - stamps[0] < 0.5  # not a full tock
+
+    assert doist.selector.get_map() is None  # closed by do
+    assert not coring.selectorUnregister(doist.selector, rs)
+
+    selector = selectors.DefaultSelector()
+    assert coring.selectorRegister(selector, rs, data=rs)
+    assert coring.selectorUnregister(selector, rs)
+    assert not coring.selectorUnregister(selector, rs)
+    assert not coring.selectorRegister(None, rs)
+    selector.close()
+    rs.close()
+    ws.close()
+    """End Test """
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+def test_doist_selector_closed():
+    """
+    Test Doist closes its selector when done and reopens it in place when run
+    again so no fd is left open
+    """
+    def fds():
+        return len(os.listdir("/proc/self/fd"))
+
+    before = fds()
+    doist = doing.Doist(tock=0.03125, real=True, limit=0.0625, selecting=True)
+    selector = doist.selector
+    assert fds() == before + 1  # epoll fd
+
+    rs, ws = socket.socketpair()
+    for i in range(2):
+        coring.selectorRegister(doist.selector, rs, data=rs)  # so waits on it
+        doist.do(doers=[doing.ExDoer(tock=0.03125)])
+        assert doist.selector is selector  # same instance reopened
+        assert doist.selector.closed
+        assert fds() == before + 2  # only socketpair left open
+
+    rs.close()
+    ws.close()
+    assert fds() == before
+    """End Test """
+
 
 if __name__ == "__main__":
     test_doist_remove_own_doer()
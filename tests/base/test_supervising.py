@@ -0,0 +1,130 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.base.test_supervising module
+
+"""
+import pytest
+
+import os
+import tempfile
+import threading
+import time
+import http.client
+
+from hio.base import doing, supervising
+from hio.core import http as hiohttp
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+
+
+def test_supervisor_restart():
+    """
+    Test Supervisor restarts crashed worker and returns when workers exit
+    """
+    with tempfile.TemporaryDirectory() as dirpath:
+        marker = os.path.join(dirpath, "crashed")
+        done = os.path.join(dirpath, "done")
+
+        def builder():
+            if not os.path.exists(marker):  # crash first time
+                open(marker, "w").close()
+                raise ValueError("Crash")
+
+            @doing.doize()
+            def doneDo(tymth=None, tock=0.0, **opts):
+                yield  # enter
+                with open(done, "w") as f:
+                    f.write(str(os.getpid()))
+                return True
+
+            return [doneDo]
+
+        supervisor = supervising.Supervisor(builder=builder, count=1,
+                                            tock=0.03125, limit=1.0)
+        assert supervisor.count == 1
+        assert supervisor.restartable
+        assert supervisor.grace == supervising.Supervisor.Grace
+        supervisor.run()
+
+        assert not supervisor.workers
+        assert supervisor.restarts == 1
+        assert os.path.exists(marker)
+        with open(done) as f:
+            assert int(f.read()) != os.getpid()
+    """Done Test"""
+
+
+def test_supervisor_exit_message():
+    """
+    Test Supervisor defaults worker tock and restarts worker exited by
+    SystemExit with message since that is unsuccessful
+    """
+    with tempfile.TemporaryDirectory() as dirpath:
+        marker = os.path.join(dirpath, "exited")
+
+        def builder():
+            if not os.path.exists(marker):  # exit with message first time
+                open(marker, "w").close()
+                raise SystemExit("Fatal config")
+            return []
+
+        supervisor = supervising.Supervisor(builder=builder, count=1, limit=1.0)
+        assert supervisor.tock == doing.Doist.Tock  # idle worker does not spin
+        supervisor.run()
+
+        assert not supervisor.workers
+        assert supervisor.restarts == 1
+        assert os.path.exists(marker)
+    """Done Test"""
+
+
+def test_supervisor_reuseport_http():
+    """
+    Test Supervisor of http.Server workers sharing port with SO_REUSEPORT and
+    graceful shutdown
+    """
+    port = 6101
+
+    def wsgiApp(environ, start_response):
+        body = str(os.getpid()).encode()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(body)))])
+        return [body]
+
+    def builder():
+        server = hiohttp.Server(port=port, app=wsgiApp, reusable=True)
+        assert server.servant.reusable
+        return [hiohttp.ServerDoer(server=server)]
+
+    supervisor = supervising.Supervisor(builder=builder, count=2, tock=0.01,
+                                        grace=2.0)
+    runner = threading.Thread(target=supervisor.run)
+    runner.start()
+    try:
+        pids = set()
+        tries = 0
+        while len(pids) < 2 and tries < 200:
+            tries += 1
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2.0)
+                conn.request("GET", "/", headers={"Connection": "close"})
+                response = conn.getresponse()
+                pids.add(int(response.read()))
+                conn.close()
+            except OSError:  # workers not listening yet
+                time.sleep(0.05)
+        assert len(pids) == 2  # both workers served
+        assert pids == set(supervisor.workers)
+    finally:
+        supervisor.stop()
+        runner.join(timeout=10.0)
+
+    assert not runner.is_alive()
+    assert not supervisor.workers
+    assert supervisor.restarts == 0
+    """Done Test"""
+
+
+if __name__ == "__main__":
+    test_supervisor_restart()
+    test_supervisor_reuseport_http()
@@ -191,6 +191,98 @@ def test_tymer():
     """End Test """
 
 
+def test_wheel():
+    """
+    Test Wheel class
+    """
+    tymist = tyming.Tymist(tock=0.125)
+    wheel = tyming.Wheel(tymth=tymist.tymen(), tock=0.25, sizes=(4, 4))
+    assert wheel.tock == 0.25
+    assert wheel.sizes == (4, 4)
+    assert len(wheel) == 0
+    assert wheel.expire() == []
+
+    wheel.start("a", 0.5)  # level 0
+    wheel.start("b", 2.0)  # level 1
+    wheel.start("c", 10.0)  # beyond top level
+    assert len(wheel) == 3
+    assert "a" in wheel and "d" not in wheel
+    assert wheel._places["a"] == (0, 2)
+    assert wheel._places["b"] == (1, 2)
+    assert "c" in wheel._over
+    assert wheel.remaining("a") == 0.5
+
+    tymist.tick()
+    assert wheel.expire() == []
+    tymist.tick()
+    assert wheel.tyme == 0.25
+    assert wheel.expire() == []
+    tymist.tick()
+    tymist.tick()
+    assert wheel.tyme == 0.5
+    assert wheel.expire() == ["a"]  # never early and at most one tock late
+    assert "a" not in wheel
+    assert len(wheel) == 2
+
+    wheel.restart("b")  # restart from now
+    assert wheel.remaining("b") == 2.0
+    wheel.remove("c")
+    wheel.remove("c")  # removing missing key is noop
+    assert len(wheel) == 1
+    while tymist.tyme < 2.375:
+        tymist.tick()
+        assert wheel.expire() == []
+    tymist.tick()
+    assert wheel.tyme == 2.5
+    assert wheel.expire() == ["b"]  # cascaded from level 1 down to level 0
+    assert len(wheel) == 0
+
+    # deadlines within partial tock round up to next tick so never early
+    wheel.start("a", 0.0)
+    wheel.start("b", 0.1)
+    assert wheel.expire() == ["a"]
+    tymist.tick()
+    assert wheel.expire() == []
+    tymist.tick()
+    assert wheel.expire() == ["b"]
+
+    # many keys expire in deadline tick order across levels and over
+    keys = {key: key * 0.75 for key in range(1, 40)}
+    for key, duration in keys.items():
+        wheel.start(key, duration)
+    start = tymist.tyme
+    expireds = []
+    while len(wheel):
+        tymist.tick()
+        for key in wheel.expire():
+            assert 0.0 <= tymist.tyme - (start + keys[key]) < wheel.tock
+            expireds.append(key)
+    assert expireds == list(keys)
+
+    # wind restarts tymeouts on new tyme base
+    wheel.start("a", 1.0)
+    tymist = tyming.Tymist(tyme=5.0, tock=0.125)
+    wheel.wind(tymist.tymen())
+    assert wheel.tyme == 5.0
+    assert wheel.remaining("a") == 1.0
+    while tymist.tyme < 6.0:
+        assert wheel.expire() == []
+        tymist.tick()
+    assert wheel.expire() == ["a"]
+
+    # not yet wound starts tymeouts at zero
+    wheel = tyming.Wheel()
+    assert wheel.tock == tyming.Wheel.Tock
+    assert wheel.sizes == tyming.Wheel.Sizes
+    wheel.start("a", 1.0)
+    assert wheel.expire() == []
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+    wheel.wind(tymist.tymen())
+    assert "a" in wheel
+    """End Test """
+
+
 
 if __name__ == "__main__":
     test_tymer()
+    test_wheel()
@@ -0,0 +1,204 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.http.test_eventing module
+
+"""
+import time
+
+import pytest
+
+from hio import help
+from hio.base import tyming
+from hio.core import http
+from hio.core.http import httping, eventing
+
+
+class Incomer():
+    """
+    Stand in for tcp.Remoter with transmit queue
+    """
+    ca = ("127.0.0.1", 50000)
+
+    def __init__(self):
+        self.txbs = help.Reel()
+
+    def tx(self, data):
+        self.txbs.extend(data)
+
+
+class Responder():
+    """
+    Stand in for serving.Responder of event-stream response
+    """
+    def __init__(self, chunked=True):
+        self.incomer = Incomer()
+        self.headed = False
+        self.chunked = chunked
+        self.ended = False
+        self.closed = False
+        self.persisted = True
+
+
+def test_pack_event():
+    """
+    Test httping.packEvent
+    """
+    assert httping.packEvent() == b":\n\n"
+    assert httping.packEvent(retry=1000) == b"retry: 1000\n\n"
+    assert httping.packEvent("hi", eid=3) == b"id: 3\ndata: hi\n\n"
+    assert httping.packEvent(b"1\n2", event="count") == (b"event: count\n"
+                                                         b"data: 1\n"
+                                                         b"data: 2\n\n")
+    assert httping.packEvent(dict(a=1)) == b'data: {"a":1}\n\n'
+
+
+def test_event_hub():
+    """
+    Test EventHub fan out, high water drop, and replay
+    """
+    hub = eventing.EventHub(highwater=64, ringsize=3, retry=500)
+    assert hub.highwater == 64
+    assert hub.ringsize == 3
+    assert hub.heartbeat == eventing.EventHub.Heartbeat
+    assert hub.tymer is None  # not wound
+
+    starts = []
+    def start_response(status, headers):
+        starts.append((status, headers))
+
+    alpha = Responder()
+    beta = Responder(chunked=False)
+    sa = hub.subscribe({'hio.responder': alpha}, start_response, channel="news")
+    sb = hub.subscribe({'hio.responder': beta}, start_response, channel="news")
+    assert starts[0] == ('200 OK', [('Content-Type', 'text/event-stream'),
+                                    ('Cache-Control', 'no-cache')])
+    assert hub.channels == {"news": {sa, sb}}
+    with pytest.raises(ValueError):
+        hub.subscribe({}, start_response)
+
+    assert hub.publish("one", channel="news") == "1"  # before headed
+    assert list(sa.backlog) == [b"retry: 500\n\n", b"id: 1\ndata: one\n\n"]
+    assert next(sa) == b"retry: 500\n\nid: 1\ndata: one\n\n"
+    assert next(sa) == b""
+    assert not sa.backlog and sa.size == 0
+
+    # push while backlog joined as from another thread is kept not lost
+    class Backlog(list):
+        def __iter__(self):
+            sa.push(b"late", b"")
+            return super(Backlog, self).__iter__()
+
+    sa.backlog = Backlog([b"early"])
+    sa.size = 5
+    assert next(sa) == b"early"
+    assert list(sa.backlog) == [b"late"] and sa.size == 4
+    assert next(sa) == b"late"
+    assert sa.size == 0
+    alpha.headed = beta.headed = True
+    next(sb)
+
+    assert hub.publish("two", channel="news") == "2"
+    frame = alpha.incomer.txbs.buffers()[0]
+    assert bytes(frame) == b"11\r\nid: 2\ndata: two\n\n\r\n"
+    payload = beta.incomer.txbs.buffers()[0]
+    assert bytes(payload) == b"id: 2\ndata: two\n\n"
+    assert frame.obj is hub.rings["news"][-1][2]  # encoded once not copied
+
+    hub.publish("three", channel="news", event="count")
+    hub.publish("four", channel="news", eid="x")
+    assert [eid for eid, payload, frame in hub.rings["news"]] == ["2", "3", "x"]
+    assert hub.replay("news") == []
+    assert hub.replay("news", "3") == [b"id: x\ndata: four\n\n"]
+    assert len(hub.replay("news", "1")) == 3  # too old so all
+    assert hub.replay("sports", "1") == []
+
+    # alpha unsent bytes past high water so dropped while beta keeps up
+    beta.incomer.txbs.clear()
+    hub.publish("five", channel="news")
+    assert sa.ended
+    assert not alpha.persisted
+    assert hub.channels == {"news": {sb}}
+    with pytest.raises(StopIteration):
+        next(sa)
+
+    beta.incomer.txbs.clear()
+    beta.closed = True  # closed by server so unsubscribed on next publish
+    hub.publish("six", channel="news")
+    assert sb.ended
+    assert beta.persisted
+    assert hub.channels == {}
+
+    gamma = Responder()
+    sc = hub.subscribe({'hio.responder': gamma, 'HTTP_LAST_EVENT_ID': '3'},
+                       start_response, channel="news")
+    assert list(sc.backlog) == [b"retry: 500\n\n",
+                                b"id: x\ndata: four\n\n",
+                                b"id: 4\ndata: five\n\n",
+                                b"id: 5\ndata: six\n\n"]
+    hub.close()
+    assert sc.ended
+    assert hub.channels == {}
+
+
+def test_event_hub_server():
+    """
+    Test EventHub with WSGI Server streams events to clients
+    """
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+    hub = eventing.EventHub(tymth=tymist.tymen(), heartbeat=1.0)
+    assert hub.tymer.duration == 1.0
+
+    def app(environ, start_response):
+        return hub.subscribe(environ, start_response, channel="news")
+
+    with http.openServer(port=6101, bufsize=131072, app=app,
+                         tymth=tymist.tymen(), reeled=True) as alpha:
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+        with (http.openClient(bufsize=131072, path=path, tymth=tymist.tymen(),
+                              reconnectable=True) as beta,
+              http.openClient(bufsize=131072, path=path, tymth=tymist.tymen(),
+                              reconnectable=True) as gamma):
+
+            request = dict(method='GET', path='/news',
+                           headers=dict(Accept='text/event-stream'))
+            beta.requests.append(dict(request))
+            gamma.requests.append(dict(request))
+
+            while len(hub.channels.get("news", ())) < 2:
+                alpha.service()
+                beta.service()
+                gamma.service()
+                time.sleep(0.01)
+
+            for data in ("one", "two", "three"):
+                hub.publish(data, channel="news")
+
+            tymer = tyming.Tymer(tymth=tymist.tymen(), duration=2.0)
+            while ((len(beta.events) < 3 or len(gamma.events) < 3) and
+                   not tymer.expired):
+                alpha.service()
+                hub.service()
+                beta.service()
+                gamma.service()
+                time.sleep(0.01)
+                tymist.tick()
+
+            for client in (beta, gamma):
+                assert client.respondent.evented
+                assert [event['data'] for event in client.events] == ["one",
+                                                                      "two",
+                                                                      "three"]
+                assert client.respondent.leid == "3"
+            assert hub.tymer.elapsed < hub.heartbeat  # heartbeat restarted
+
+            # closed client unsubscribed by server closing body iterable
+            # without waiting for publish or heartbeat
+            beta.close()
+            tymer = tyming.Tymer(tymth=tymist.tymen(), duration=2.0)
+            while len(hub.channels["news"]) > 1 and not tymer.expired:
+                alpha.service()
+                gamma.service()
+                time.sleep(0.01)
+                tymist.tick()
+            assert len(hub.channels["news"]) == 1
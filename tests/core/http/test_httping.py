@@ -7,6 +7,7 @@ import pytest
 
 from hio import help
 from hio.core import http
+from hio.core.http import httping
 
 
 logger = help.ogler.getLogger()
@@ -54,6 +55,306 @@ def test_http_error():
                             b'\n  "detail": "Bad mojo",\n  "fault": 50\n}')
 
 
+def test_parse_heading():
+    """
+    Test parseHeading generator
+    """
+    msg = (b"GET /echo?name=fame HTTP/1.1\r\n"
+           b"Host: localhost:6101\r\n"
+           b"Accept:application/json\r\n"
+           b"Content-Length:  4 \r\n"
+           b"\r\n"
+           b"abcdGET /next HTTP/1.1\r\n")
+
+    raw = bytearray()
+    parser = httping.parseHeading(raw=raw)
+    size = msg.index(b"\r\n\r\n") + 4  # heading size
+    fed = 0
+    while (heading := next(parser)) is None:  # fragmented arrivals
+        assert fed < size
+        raw.extend(msg[fed:fed + 3])
+        fed += 3
+    assert fed >= size
+    parser.close()
+    line, headers = heading
+    assert line == b"GET /echo?name=fame HTTP/1.1"
+    assert isinstance(line, bytes)
+    assert list(headers.items()) == [('Host', 'localhost:6101'),
+                                     ('Accept', 'application/json'),
+                                     ('Content-Length', '4')]
+    assert headers['content-length'] == '4'
+    raw.extend(msg[fed:])
+    assert raw == b"abcdGET /next HTTP/1.1\r\n"  # only heading consumed
+
+    # LF only lines, leading empty lines skipped and no headers
+    raw = help.Ring(b"\r\n\nHTTP/1.1 200 OK\n\nbody")
+    parser = httping.parseHeading(raw=raw)
+    line, headers = next(parser)
+    assert line == b"HTTP/1.1 200 OK"
+    assert not headers
+    assert raw == b"body"
+
+    # LF ended heading with body starting with CRLF
+    raw = bytearray(b'POST / HTTP/1.1\nHost: a\nContent-Length: 4\n\n\r\nab')
+    parser = httping.parseHeading(raw=raw)
+    line, headers = next(parser)
+    assert line == b"POST / HTTP/1.1"
+    assert list(headers.items()) == [('Host', 'a'), ('Content-Length', '4')]
+    assert raw == b"\r\nab"
+
+    raw = bytearray(b"GET / HTTP/1.1\r\nBad header line\r\n\r\n")
+    with pytest.raises(httping.HTTPException):
+        next(httping.parseHeading(raw=raw))
+
+    raw = bytearray(b"GET / HTTP/1.1\r\n" +
+                    b"".join(b"X-%d: %d\r\n" % (i, i)
+                             for i in range(httping.MAX_HEADERS + 1)) + b"\r\n")
+    with pytest.raises(httping.HTTPException):
+        next(httping.parseHeading(raw=raw))
+
+    raw = bytearray(b"GET / HTTP/1.1\r\nX-Big: ")
+    parser = httping.parseHeading(raw=raw)
+    assert next(parser) is None
+    raw.extend(b"x" * httping.MAX_HEAD_SIZE)
+    with pytest.raises(httping.HeadTooLong):
+        next(parser)
+
+def test_parser_backends():
+    """
+    Test parser backends of Requestant and Respondent fill same attributes
+    """
+    from hio.core.http import serving, clienting
+
+    assert httping.selectBackend() is httping.DefaultBackend
+    assert httping.selectBackend("python").Name == "python"
+    backend = httping.Backend()
+    assert httping.selectBackend(backend) is backend
+    with pytest.raises(ValueError):
+        httping.selectBackend("bogus")
+
+    names = ["python"]
+    if httping.httptools is None:  # falls back to pure python
+        assert httping.selectBackend("httptools") is httping.DefaultBackend
+    else:
+        assert isinstance(httping.selectBackend("httptools"),
+                          httping.NativeBackend)
+        names.append("httptools")
+
+    requests = [
+        b"GET /echo?name=fame#top HTTP/1.1\r\nHost: localhost:6101\r\n"
+        b"Accept: */*\r\n\r\n",
+        b"\r\nPOST http://Example.com:8080/a%20b?x=1 HTTP/1.0\r\n"
+        b"Content-Length: 5\r\nConnection: keep-alive\r\n\r\n"
+        b"helloGET / HTTP/1.1\r\n\r\n",
+        b"PUT /c HTTP/1.1\nTransfer-Encoding: chunked\n"
+        b"Content-Type: application/json; charset=utf-8\n\n"
+        b"5\r\nhello\r\n0\r\n\r\n",
+        b"OPTIONS * HTTP/1.1\r\nHost: x\r\nX-Dup: 1\r\nx-dup: 2\r\n\r\n",
+        b"GET /x HTTP/1.1\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n\r\n",
+        b"BREW /pot HTTP/1.1\r\n\r\n",
+    ]
+    fields = ("method", "url", "scheme", "hostname", "port", "path", "query",
+              "fragment", "version", "body", "chunked", "length", "persisted",
+              "jsoned", "encoding", "errored", "ended", "msg")
+    for msg in requests:
+        results = []
+        for name in names:
+            requestant = serving.Requestant(msg=bytearray(msg), backend=name)
+            assert requestant.backend.Name == name
+            requestant.parse()
+            assert requestant.ended
+            results.append(([getattr(requestant, field) for field in fields],
+                            dict(requestant.headers or {})))
+        assert results.count(results[0]) == len(results)
+
+    requestant = serving.Requestant(msg=bytearray(requests[1]))
+    requestant.parse()
+    assert requestant.path == "/a b"
+    assert requestant.hostname == "example.com"
+    assert requestant.port == 8080
+    assert requestant.version == (1, 0)
+    assert requestant.persisted
+    assert requestant.body == b"hello"
+    assert requestant.msg == b"GET / HTTP/1.1\r\n\r\n"  # pipelined left
+
+    responses = [
+        b"HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 200 OK\r\n"
+        b"Content-Length: 2\r\nContent-Type: application/json\r\n\r\n{}",
+        b"HTTP/1.0 404 Not   Found\r\nKeep-Alive: 1\r\n"
+        b"Content-Length: 0\r\n\r\n",
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"2\r\nhi\r\n0\r\n\r\n",
+        b"HTTP/1.1 301 Moved\r\nLocation: /x\r\nContent-Length: 0\r\n\r\n",
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n\r\n"
+        b"id: 1\ndata: hi\n\n",
+    ]
+    fields = ("status", "reason", "version", "body", "chunked", "length",
+              "persisted", "jsoned", "evented", "redirectant", "errored",
+              "leid")
+    for msg in responses:
+        results = []
+        for name in names:
+            respondent = clienting.Respondent(msg=bytearray(msg), backend=name)
+            for i in range(3):
+                respondent.parse()
+            results.append(([getattr(respondent, field) for field in fields],
+                            dict(respondent.headers)))
+        assert results.count(results[0]) == len(results)
+
+    respondent = clienting.Respondent(msg=bytearray(responses[0]))
+    respondent.parse()
+    assert respondent.status == 200
+    assert respondent.body == b"{}"
+    assert respondent.jsoned
+
+
+def test_spool():
+    """
+    Test Spool spills large bodies to temporary file and Parsent limits
+    """
+    import os
+    from hio.core.http import serving, clienting
+
+    spool = httping.Spool(high=8)
+    spool.extend(b"abcd")
+    assert not spool.spilled and spool.buffer == b"abcd"
+    spool.extend(b"efgh\nij")
+    assert spool.spilled and not spool.buffer
+    path = spool.path
+    assert os.path.exists(path)
+    assert path.startswith(httping.spoolFiler().path)
+    spool.rewind()
+    assert len(spool) == 11
+    assert spool.readline() == b"abcdefgh\n"
+    assert spool.tell() == 9
+    assert spool.read() == b"ij"
+    spool.seek(2)
+    assert spool.read(3) == b"cde"
+    spool.close()
+    assert not os.path.exists(path)
+
+    # request body larger than spoolsize is spooled as it arrives
+    body = b"x" * 100
+    msg = (b"POST /up HTTP/1.1\r\nContent-Length: 100\r\n\r\n" + body[:60])
+    requestant = serving.Requestant(msg=bytearray(msg), spoolsize=32)
+    requestant.parse()
+    assert not requestant.ended
+    assert requestant.spool.spilled and requestant.spool.size == 60
+    requestant.msg.extend(body[60:] + b"GET / HTTP/1.1\r\n\r\n")
+    requestant.parse()
+    assert requestant.ended and not requestant.errored
+    assert requestant.length == 100 and not requestant.body
+    assert requestant.spool.read() == body
+    assert requestant.msg == b"GET / HTTP/1.1\r\n\r\n"
+    requestant.spool.close()
+
+    # small bodies stay in memory
+    requestant = serving.Requestant(msg=bytearray(
+        b"PUT /c HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"5\r\nhello\r\n0\r\n\r\n"), spoolsize=32)
+    requestant.parse()
+    assert requestant.ended and requestant.spool is None
+    assert requestant.body == b"hello" and requestant.length == 5
+
+    # bodies larger than maxbody error as oversized
+    requestant = serving.Requestant(msg=bytearray(
+        b"POST /up HTTP/1.1\r\nContent-Length: 100\r\n\r\n"), maxbody=64)
+    requestant.parse()
+    assert requestant.ended and requestant.errored and requestant.oversized
+    chunks = b"".join(httping.packChunk(b"y" * 40) for i in range(3))
+    requestant = serving.Requestant(msg=bytearray(
+        b"PUT /c HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n" + chunks),
+        spoolsize=16, maxbody=64)
+    requestant.parse()
+    assert requestant.errored and requestant.oversized
+    assert requestant.spool is None  # partial spool removed
+
+    # response body until close
+    respondent = clienting.Respondent(msg=bytearray(
+        b"HTTP/1.0 200 OK\r\n\r\n" + body), spoolsize=32)
+    respondent.parse()
+    respondent.close()
+    respondent.parse()
+    respondent.parse()
+    assert respondent.ended and respondent.length == 100
+    assert respondent.spool.read() == body
+    respondent.spool.close()
+    respondent = clienting.Respondent(msg=bytearray(
+        b"HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\n" + body), maxbody=64)
+    respondent.parse()
+    assert respondent.errored and respondent.oversized
+
+
+
+def test_event_source():
+    """
+    Test EventSource incremental parsing of server sent events
+    """
+    stream = (b'\xef\xbb\xbfretry: 1000\n\n'
+              b': comment\n'
+              b'id: 0\ndata: START\n\n'
+              b'id: 1\r\ndata: 1\r\ndata: 2\r\n\r\n'
+              b'event: count\rid: 2\rdata:3\r\r'
+              b'data: {"a": 1}\n\n'
+              b'id: 4\ndata: tail\n')
+
+    for size in (1, 2, 3, 7, len(stream)):  # every split of ends of events
+        raw = bytearray()
+        source = httping.EventSource(raw=raw)
+        for i in range(0, len(stream), size):
+            raw.extend(stream[i:i + size])
+            source.parse()
+        assert source.bom == '\ufeff'
+        assert source.retry == 1000
+        assert list(source.events) == [{'id': '0', 'name': '', 'data': 'START'},
+                                       {'id': '1', 'name': '', 'data': '1\n2'},
+                                       {'id': '2', 'name': 'count', 'data': '3'},
+                                       {'id': '2', 'name': '', 'data': '{"a": 1}'}]
+        assert raw == b'id: 4\ndata: tail\n'  # waiting for end of event
+        assert source.offset == len(raw) - 3
+
+        source.close()
+        source.parse()  # eof ends event
+        assert source.ended
+        assert source.parser is None
+        assert not raw
+        assert source.events[-1] == {'id': '4', 'name': '', 'data': 'tail'}
+        assert source.leid == '4'
+        assert source.count == 5
+
+    # dictable with bounded events drops oldest
+    raw = bytearray(b'data: {"a": 1}\n\ndata: [2]\n\ndata: x\n\n')
+    source = httping.EventSource(raw=raw, dictable=True, maxevents=2)
+    source.parse()
+    assert list(source.events) == [{'id': None, 'name': '', 'data': [2]},
+                                   {'id': None, 'name': '', 'data': 'x'}]
+    assert source.dropped == 1
+    assert source.count == 3
+
+    # callback instead of events
+    received = []
+    raw = bytearray(b'data: a\n\ndata: b\n\n')
+    source = httping.EventSource(raw=raw, callback=received.append)
+    source.parse()
+    assert [event['data'] for event in received] == ['a', 'b']
+    assert not source.events
+
+    # whole stream
+    raw = bytearray(b'\xef\xbb\xbfid: 7\ndata: a\n\n')
+    source = httping.EventSource(raw=raw)
+    parser = source.parseEventStream()
+    assert next(parser) is None
+    source.close()
+    assert next(parser) is True
+    assert source.ended
+    assert source.bom == '\ufeff'
+    assert list(source.events) == [{'id': '7', 'name': '', 'data': 'a'}]
+
+    raw = bytearray(b'data: ' + b'x' * httping.MAX_EVENT_SIZE)
+    source = httping.EventSource(raw=raw)
+    with pytest.raises(httping.EventTooLong):
+        source.parse()
+
 
 if __name__ == '__main__':
     test_http_error()
@@ -5,13 +5,15 @@ Tests for http serving module
 import sys
 import os
 import time
+import hashlib
 
 import pytest
 
 from hio import help
 from hio.help import helping
 from hio.base import tyming, doing
-from hio.core import http
+from hio.core import http, tcp
+from hio.core.http import httping
 
 
 logger = help.ogler.getLogger()
@@ -93,10 +95,213 @@ def test_bare_server_echo():
             assert responder.headers == response['headers']
 
 
+def test_bare_server_max_requests():
+    """
+    Test BareServer closes connection after max requests with keep-alive timeout
+    """
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+
+    with http.openServer(cls=http.BareServer, port = 6101, bufsize=131072, \
+                         tymth=tymist.tymen(), keeptimeout=1.0,
+                         maxrequests=2) as alpha:
+
+        assert alpha.keeptimeout == 1.0
+        assert alpha.headtimeout == http.BareServer.HeadTimeout
+        assert alpha.maxrequests == 2
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+        with http.openClient(bufsize=131072, path=path, tymth=tymist.tymen(), \
+                             reconnectable=False,) as  beta:
+
+            request = dict([('method', u'GET'),
+                             ('path', u'/echo?name=fame'),
+                             ('qargs', dict()),
+                             ('fragment', u''),
+                             ('headers', dict([('Accept', 'application/json'),
+                                                ('Content-Length', 0)])),
+                            ])
+
+            beta.requests.append(dict(request))
+            while (beta.requests or beta.connector.txbs or not beta.responses):
+                alpha.service()
+                time.sleep(0.01)
+                beta.service()
+                time.sleep(0.01)
+
+            response = beta.responses.popleft()
+            assert response['status'] == 200
+            assert 'connection' not in response['headers']
+            ca, ix = list(alpha.servant.ixes.items())[0]
+            assert alpha.stewards[ca].requestant.count == 1
+            assert ix.tymeout == alpha.keeptimeout
+
+            beta.requests.append(dict(request))
+            while (beta.requests or beta.connector.txbs or not beta.responses or
+                   ca in alpha.servant.ixes):
+                alpha.service()
+                time.sleep(0.01)
+                beta.service()
+                time.sleep(0.01)
+
+            response = beta.responses.popleft()
+            assert response['status'] == 200
+            assert response['data']['path'] == '/echo'
+            assert response['headers']['connection'] == 'close'
+            assert ca not in alpha.stewards
+
+
+def test_router():
+    """
+    Test Router static and parameterized route resolution
+    """
+    def ping(requestant, params):
+        return b"pong"
+
+    def user(requestant, params):
+        return params
+
+    def me(requestant, params):
+        return b"me"
+
+    def item(requestant, params):
+        return params
+
+    router = http.Router(routes=[("/ping", ping, ("GET", "HEAD"))])
+    router.add("/users/{uid}", user, methods=("GET", "PUT"))
+    router.add("/users/me", me)
+    assert router.route("/users/{uid}/items/{iid}")(item) is item
+
+    assert router.statics == {"/ping": {"GET": ping, "HEAD": ping},
+                              "/users/me": {"GET": me}}
+    assert router.trie.literals["users"].param[0] == "uid"
+
+    assert router.resolve("GET", "/ping") == (ping, {})
+    assert router.resolve("HEAD", "/ping/") == (ping, {})
+    assert router.resolve("GET", "/users/me") == (me, {})
+    assert router.resolve("PUT", "/users/sam") == (user, {"uid": "sam"})
+    assert router.resolve("GET", "/users/me/items/7") == (item,
+                                                {"uid": "me", "iid": "7"})
+
+    with pytest.raises(http.HTTPError) as ex:
+        router.resolve("GET", "/users")
+    assert ex.value.status == 404
+    with pytest.raises(http.HTTPError) as ex:
+        router.resolve("GET", "/users//items/7")
+    assert ex.value.status == 404
+    with pytest.raises(http.HTTPError) as ex:
+        router.resolve("POST", "/users/sam")
+    assert ex.value.status == 405
+    assert ex.value.headers == {"Allow": "GET, PUT"}
+
+    # static path without method falls back to parameterized route
+    router.add("/items/new", me)
+    router.add("/items/{id}", item, methods=("POST", ))
+    assert router.resolve("GET", "/items/new") == (me, {})
+    assert router.resolve("POST", "/items/new") == (item, {"id": "new"})
+    assert router.resolve("POST", "/items/7") == (item, {"id": "7"})
+    with pytest.raises(http.HTTPError) as ex:
+        router.resolve("DELETE", "/items/new")
+    assert ex.value.status == 405
+    assert ex.value.headers == {"Allow": "GET, POST"}
+    with pytest.raises(http.HTTPError) as ex:
+        router.resolve("GET", "/items/7")
+    assert ex.value.status == 405
+    assert ex.value.headers == {"Allow": "POST"}
+
+    with pytest.raises(ValueError):
+        router.add("/users/{name}", user)
+    with pytest.raises(ValueError):
+        router.add("users", user)
+
+
+def test_bare_server_routed():
+    """
+    Test BareServer dispatch of requests to handlers of router
+    """
+    tymist = tyming.Tymist(tyme=0.0)
+
+    router = http.Router()
+
+    @router.route("/ping")
+    def ping(requestant, params):
+        return b"pong"
+
+    @router.route("/users/{uid}", methods=("GET", "PUT"))
+    def user(requestant, params):
+        return dict(uid=params["uid"], method=requestant.method)
+
+    @router.route("/items/{iid}", methods=("POST", ))
+    def item(requestant, params):
+        return (201, {'Location': "/items/" + params["iid"]}, requestant.body)
+
+    @router.route("/stream")
+    def stream(requestant, params):
+        for part in (b"Hello ", b"", b"World!"):
+            yield part
+
+    @router.route("/fail")
+    def fail(requestant, params):
+        raise http.HTTPError(400, title="Bad")
+
+    with http.openServer(cls=http.BareServer, port = 6101, bufsize=131072, \
+                         tymth=tymist.tymen(), router=router) as alpha:
+
+        assert alpha.router is router
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+        with http.openClient(bufsize=131072, path=path, tymth=tymist.tymen(), \
+                             reconnectable=True,) as  beta:
+
+            def exchange(method, path, body=b''):
+                beta.requests.append(dict(method=method, path=path,
+                                          headers=dict(), body=body))
+                while (beta.requests or beta.connector.txbs or
+                       not beta.responses):
+                    alpha.service()
+                    time.sleep(0.01)
+                    beta.service()
+                    time.sleep(0.01)
+                return beta.responses.popleft()
+
+            response = exchange("GET", "/ping")
+            assert response['status'] == 200
+            assert response['body'] == b"pong"
+            assert response['headers']['content-length'] == '4'
+
+            response = exchange("PUT", "/users/sam")
+            assert response['status'] == 200
+            assert response['data'] == {'uid': 'sam', 'method': 'PUT'}
+
+            response = exchange("POST", "/items/7", body=b"seven")
+            assert response['status'] == 201
+            assert response['headers']['location'] == "/items/7"
+            assert response['body'] == b"seven"
+
+            response = exchange("GET", "/stream")
+            assert response['status'] == 200
+            assert response['headers']['transfer-encoding'] == 'chunked'
+            assert response['body'] == b"Hello World!"
+
+            response = exchange("GET", "/missing")
+            assert response['status'] == 404
+
+            response = exchange("DELETE", "/users/sam")
+            assert response['status'] == 405
+            assert response['headers']['allow'] == "GET, PUT"
+
+            response = exchange("GET", "/fail")
+            assert response['status'] == 400
+            assert b"Bad" in response['body']
+
+            assert len(alpha.stewards) == 1
+
+
 def test_wsgi_server():
     """
     Test WSGI Server service request response
     """
+    from hio.core.http import serving
+
     tymist = tyming.Tymist(tyme=0.0)
 
     def wsgiApp(environ, start_response):
@@ -161,6 +366,913 @@ def test_wsgi_server():
             assert responder.status.startswith(str(response['status']))
             assert responder.headers == response['headers']
 
+            environ = alpha.buildEnviron(requestant)
+            assert alpha.template is not None
+            assert environ['wsgi.url_scheme'] == 'http'
+            assert environ['SERVER_NAME'] == '127.0.0.1'
+            assert environ['SERVER_PORT'] == '6101'
+            assert environ['SERVER_PROTOCOL'] == 'HTTP/1.1'
+            assert environ['PATH_INFO'] == '/echo'
+            assert environ['QUERY_STRING'] == 'name=fame'
+            assert environ['CONTENT_LENGTH'] == '0'
+            assert environ['HTTP_ACCEPT_ENCODING'] == 'identity'
+            assert environ['wsgi.input'] is alpha.Empty  # bodiless
+            assert environ['wsgi.input'].read() == b""
+            assert 'REQUEST_METHOD' not in alpha.template  # copied not shared
+            key = serving.environKey('Accept-Encoding')
+            assert key == 'HTTP_ACCEPT_ENCODING'
+            assert key is serving.environKey('Accept-Encoding')
+
+
+def test_wsgi_server_native_backend():
+    """
+    Test WSGI Server and Client with native httptools parser backend
+    """
+    pytest.importorskip("httptools")
+
+    tymist = tyming.Tymist(tyme=0.0)
+
+    def wsgiApp(environ, start_response):
+        body = "{0} {1}".format(environ['PATH_INFO'],
+                                environ['QUERY_STRING']).encode()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(body)))])
+        return [body]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), backend="httptools") as alpha:
+
+        assert isinstance(alpha.backend, httping.NativeBackend)
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=True, \
+                             tymth=tymist.tymen(), backend="httptools") as beta:
+
+            assert isinstance(beta.respondent.backend, httping.NativeBackend)
+            bodies = []
+            for path in (u'/echo?name=fame', u'/echo/two'):
+                beta.requests.append(dict([('method', u'GET'),
+                                           ('path', path),
+                                           ('headers', dict([('Content-Length', 0)])),
+                                          ]))
+
+                while (beta.requests or beta.connector.txbs or
+                       not beta.responses or not alpha.idle()):
+                    alpha.service()
+                    time.sleep(0.05)
+                    beta.service()
+                    time.sleep(0.05)
+
+                response = beta.responses.popleft()
+                assert response['status'] == 200
+                bodies.append(bytes(response['body']))
+
+            assert bodies[0] == b'/echo name=fame'
+            assert bodies[1].startswith(b'/echo/two ')
+
+            requestant = list(alpha.reqs.values())[0]
+            assert requestant.backend is alpha.backend
+            assert requestant.path == '/echo/two'
+            assert requestant.headers['host'] == 'localhost:6101'
+
+
+def test_wsgi_server_keepalive():
+    """
+    Test WSGI Server keep-alive tymeout, head tymeout and max requests
+    """
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+
+    def wsgiApp(environ, start_response):
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', '12')])
+        return [b"Hello World!"]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), keeptymeout=1.0, headtymeout=0.5,
+                         maxrequests=2) as alpha:
+
+        assert alpha.tymeout == http.Server.Tymeout
+        assert alpha.keeptymeout == 1.0
+        assert alpha.headtymeout == 0.5
+        assert alpha.maxrequests == 2
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=False, \
+                             tymth=tymist.tymen()) as beta:
+
+            request = dict([('method', u'GET'),
+                             ('path', u'/echo?name=fame'),
+                             ('qargs', dict()),
+                             ('fragment', u''),
+                             ('headers', dict([('Accept', 'application/json'),
+                                                ('Content-Length', 0)])),
+                            ])
+
+            # first request keeps connection alive with keep-alive tymeout
+            beta.requests.append(dict(request))
+            while (beta.requests or beta.connector.txbs or not beta.responses or
+                   not alpha.idle()):
+                alpha.service()
+                time.sleep(0.01)
+                beta.service()
+                time.sleep(0.01)
+            alpha.service()  # reset for next request
+
+            response = beta.responses.popleft()
+            assert response['status'] == 200
+            assert 'connection' not in response['headers']
+            ca, ix = list(alpha.servant.ixes.items())[0]
+            requestant = alpha.reqs[ca]
+            assert requestant.count == 1
+            assert requestant.persisted
+            assert ix.tymeout == alpha.keeptymeout
+            assert ix.refreshable
+
+            # second request reaches max requests so connection closes
+            beta.requests.append(dict(request))
+            while (beta.requests or beta.connector.txbs or not beta.responses or
+                   ca in alpha.servant.ixes):
+                alpha.service()
+                time.sleep(0.01)
+                beta.service()
+                time.sleep(0.01)
+
+            response = beta.responses.popleft()
+            assert response['status'] == 200
+            assert response['body'] == b"Hello World!"
+            assert response['headers']['connection'] == 'close'
+            assert requestant.count == 2
+            assert not requestant.persisted
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=False, \
+                             tymth=tymist.tymen()) as beta:
+
+            # idle keep-alive connection dropped after keep-alive tymeout
+            beta.requests.append(dict(request))
+            while (beta.requests or beta.connector.txbs or not beta.responses or
+                   not alpha.idle()):
+                alpha.service()
+                time.sleep(0.01)
+                beta.service()
+                time.sleep(0.01)
+            alpha.service()  # reset for next request
+            beta.responses.popleft()
+            ca, ix = list(alpha.servant.ixes.items())[0]
+            assert ix.tymeout == alpha.keeptymeout
+
+            start = tymist.tyme
+            while ca in alpha.servant.ixes and tymist.tyme < 3.0:
+                tymist.tick()
+                alpha.service()
+            assert ca not in alpha.servant.ixes
+            assert tymist.tyme - start == alpha.keeptymeout
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=False, \
+                             tymth=tymist.tymen()) as beta:
+
+            while not alpha.servant.ixes:  # connect and accept
+                beta.service()
+                alpha.service()
+                time.sleep(0.01)
+            ca, ix = list(alpha.servant.ixes.items())[0]
+
+            # slow head trickle does not restart head tymeout
+            beta.connector.tx(b"GET / HTTP/1.1\r\n")
+            start = tymist.tyme
+            while ca in alpha.servant.ixes and tymist.tyme < 3.0:
+                beta.connector.tx(b"X-Slow: loris\r\n")
+                beta.service()
+                time.sleep(0.01)
+                alpha.service()
+                if ca in alpha.servant.ixes:
+                    assert ix.tymeout == alpha.headtymeout
+                    assert not ix.refreshable
+                tymist.tick()
+            assert ca not in alpha.servant.ixes
+            assert tymist.tyme - start <= alpha.headtymeout + 2 * tymist.tock
+
+
+def test_wsgi_server_pipelined():
+    """
+    Test WSGI Server parses pipelined requests ahead and responds in order
+    """
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+
+    def wsgiApp(environ, start_response):
+        path = environ['PATH_INFO'].encode()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(path)))])
+        if path == b"/slow":  # empty yields stream response over passes
+            yield b""
+            yield b""
+        yield path
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen()) as alpha, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as beta:
+
+        assert alpha.pipelines == http.Server.Pipelines
+
+        while not (beta.connected and beta.ca in alpha.servant.ixes):
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.01)
+
+        paths = [b"/slow", b"/one", b"/two", b"/three"]
+        msg = b"".join(b"GET " + path + b" HTTP/1.1\r\nHost: localhost\r\n"
+                       b"Content-Length: 0\r\n\r\n" for path in paths)
+        beta.tx(msg)  # all requests in one write
+        while beta.txbs:
+            beta.serviceSends()
+        time.sleep(0.05)
+
+        alpha.service()
+        requestant = alpha.reqs[beta.ca]
+        assert requestant.count == 4  # all parsed ahead in one pass
+        assert not requestant.msg
+        responder = alpha.reps[beta.ca]
+        assert not responder.ended  # slow response still in progress
+        assert len(alpha.pipes[beta.ca]) == 3
+
+        rx = bytearray()
+        while len(rx.split(b"\r\n\r\n")) <= len(paths) or not alpha.idle():
+            alpha.service()
+            time.sleep(0.01)
+            beta.serviceReceives()
+            rx.extend(beta.rxbs)
+            del beta.rxbs[:]
+        assert not alpha.pipes[beta.ca]
+
+        bodies = []  # responses in request order
+        for part in rx.split(b"HTTP/1.1 200 OK")[1:]:
+            head, sep, body = part.partition(b"\r\n\r\n")
+            bodies.append(bytes(body))
+        assert bodies == paths
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), pipelines=0) as alpha, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as beta:
+
+        while not (beta.connected and beta.ca in alpha.servant.ixes):
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.01)
+
+        beta.tx(msg)
+        while beta.txbs:
+            beta.serviceSends()
+        time.sleep(0.05)
+
+        alpha.service()
+        assert alpha.reqs[beta.ca].count == 1  # no parse ahead
+        assert not alpha.pipes[beta.ca]
+
+        rx = bytearray()
+        while len(rx.split(b"\r\n\r\n")) <= len(paths):
+            alpha.service()
+            time.sleep(0.01)
+            beta.serviceReceives()
+            rx.extend(beta.rxbs)
+            del beta.rxbs[:]
+        assert alpha.reqs[beta.ca].count == 4
+        assert [bytes(part.partition(b"\r\n\r\n")[2]) for part in
+                rx.split(b"HTTP/1.1 200 OK")[1:]] == paths
+
+
+def test_wsgi_server_streamed():
+    """
+    Test WSGI Server streams request bodies to app through wsgi.input
+    """
+    from hio.core.http import serving
+
+    stream = serving.InputStream(high=8)
+    assert stream.read() is None and stream.readline() is None
+    stream.extend(b"ab\ncd")
+    assert stream.readline() == b"ab\n"
+    assert stream.readline() is None  # partial line waits
+    assert stream.readline(1) == b"c"
+    stream.extend(b"efghijk")
+    assert stream.full
+    assert stream.readline() == b"defghijk"  # partial line when full
+    stream.extend(b"x\ny")
+    stream.ended = True
+    assert list(stream) == [b"x\n", b"y"]
+    assert stream.read() == b""
+    stream.errored = True
+    with pytest.raises(OSError):
+        stream.read()
+
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+    seen = dict(early=False, most=0)
+
+    def wsgiApp(environ, start_response):
+        stream = environ['wsgi.input']
+        seen['early'] = seen['early'] or not stream.ended
+        digest = hashlib.sha256()
+        lines = 0
+        if 'HTTP_X_LINES' in environ:
+            for line in stream:
+                if line is None:
+                    yield b""
+                    continue
+                lines += 1
+                digest.update(line)
+        else:
+            while (data := stream.read(16384)) != b"":
+                seen['most'] = max(seen['most'], len(stream.buffer))
+                if data is None:
+                    yield b""
+                    continue
+                digest.update(data)
+                yield b""  # slow app reads once per pass
+        body = "{0} {1} {2}".format(stream.size, lines,
+                                    digest.hexdigest()).encode()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(body)))])
+        yield body
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), streamable=True) as alpha, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as beta:
+
+        while not (beta.connected and beta.ca in alpha.servant.ixes):
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.01)
+
+        body = os.urandom(2 * 1024 * 1024)
+        beta.tx(b"POST /upload HTTP/1.1\r\nHost: localhost\r\n" +
+                b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        paused = False
+        rx = bytearray()
+        for i in range(20000):
+            beta.serviceSends()
+            alpha.service()
+            ix = alpha.servant.ixes[beta.ca]
+            paused = paused or ix.paused
+            beta.serviceReceives()
+            rx.extend(beta.rxbs)
+            del beta.rxbs[:]
+            if rx.endswith(hashlib.sha256(body).hexdigest().encode()):
+                break
+        assert rx.endswith("{0} 0 {1}".format(len(body),
+                            hashlib.sha256(body).hexdigest()).encode())
+        assert seen['early']  # app started before whole body received
+        assert seen['most'] <= serving.InputStream.High  # bounded buffer
+        assert paused  # stopped receiving while app was behind
+        assert not ix.paused
+        requestant = alpha.reqs[beta.ca]
+        assert requestant.length == len(body)
+        assert not requestant.body  # body never buffered whole
+
+        # chunked body read by lines on same connection
+        lines = [b"line %d\n" % i for i in range(1000)]
+        chunks = [b"".join(lines[i:i + 7]) for i in range(0, len(lines), 7)]
+        beta.tx(b"PUT /lines HTTP/1.1\r\nHost: localhost\r\nX-Lines: 1\r\n"
+                b"Transfer-Encoding: chunked\r\n\r\n" +
+                b"".join(httping.packChunk(chunk) for chunk in chunks) +
+                httping.packChunk(b""))
+        digest = hashlib.sha256(b"".join(lines)).hexdigest().encode()
+        rx = bytearray()
+        for i in range(2000):
+            beta.serviceSends()
+            alpha.service()
+            beta.serviceReceives()
+            rx.extend(beta.rxbs)
+            del beta.rxbs[:]
+            if rx.endswith(digest):
+                break
+        assert rx.endswith(b" 1000 " + digest)
+        assert requestant.count == 2
+
+
+def test_wsgi_server_spooled():
+    """
+    Test WSGI Server spools large request bodies to temporary files and
+    responds 413 to bodies larger than maxbody
+    """
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+    seen = dict()
+
+    def wsgiApp(environ, start_response):
+        stream = environ['wsgi.input']
+        seen['spilled'] = getattr(stream, "spilled", False)
+        seen['path'] = getattr(stream, "path", None)
+        digest = hashlib.sha256(stream.read()).hexdigest()
+        stream.seek(0)  # seekable
+        body = "{0} {1}".format(len(stream.read()), digest).encode()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(body)))])
+        return [body]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), spoolsize=65536,
+                         maxbody=1048576) as alpha, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as beta:
+
+        while not (beta.connected and beta.ca in alpha.servant.ixes):
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.01)
+
+        body = os.urandom(512 * 1024)
+        digest = hashlib.sha256(body).hexdigest().encode()
+        beta.tx(b"POST /upload HTTP/1.1\r\nHost: localhost\r\n" +
+                b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        rx = bytearray()
+        for i in range(20000):
+            beta.serviceSends()
+            alpha.service()
+            beta.serviceReceives()
+            rx.extend(beta.rxbs)
+            del beta.rxbs[:]
+            if rx.endswith(digest):
+                break
+        assert rx.endswith(b"%d " % len(body) + digest)
+        assert seen['spilled']
+        assert not os.path.exists(seen['path'])  # removed once responded
+        assert not alpha.reqs[beta.ca].body  # body never buffered whole
+
+        # small body stays in memory on same connection
+        beta.tx(b"POST /small HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Length: 5\r\n\r\nhello")
+        digest = hashlib.sha256(b"hello").hexdigest().encode()
+        rx = bytearray()
+        for i in range(1000):
+            beta.serviceSends()
+            alpha.service()
+            beta.serviceReceives()
+            rx.extend(beta.rxbs)
+            del beta.rxbs[:]
+            if rx.endswith(digest):
+                break
+        assert rx.endswith(b"5 " + digest)
+        assert not seen['spilled']
+
+        # body larger than maxbody gets 413 and connection closed
+        beta.tx(b"POST /huge HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Length: %d\r\n\r\n" % (2 * 1048576) + body)
+        rx = bytearray()
+        for i in range(1000):
+            beta.serviceSends()
+            alpha.service()
+            beta.serviceReceives()
+            rx.extend(beta.rxbs)
+            del beta.rxbs[:]
+            if beta.ca not in alpha.servant.ixes:
+                break
+            time.sleep(0.001)
+        assert rx.startswith(b"HTTP/1.1 413 Request Entity Too Large\r\n")
+        assert b"Connection: close" in rx
+        assert beta.ca not in alpha.servant.ixes
+
+
+def test_responder_build():
+    """
+    Test Responder.build with cached Date, pre-encoded statics and
+    pre-encoded app headers
+    """
+    from hio.core.http import serving
+
+    date = httping.httpDateNow()
+    assert httping.httpDateNow(packed=True) == b"Date: " + date.encode()
+    assert httping.httpDateNow() is date  # cached for the second
+
+    responder = serving.Responder(incomer=None, app=None, environ=dict())
+    responder.start('200 OK', [('content-type', 'text/plain'),
+                               (b'X-Raw-Header', b'as is'),
+                               (b'Content-Length', b'2')])
+    assert responder.length == 2
+    assert responder.raws == [b'X-Raw-Header: as is']
+    head = responder.build()
+    assert head.startswith(b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n"
+                           b"Content-Length: 2\r\nX-Raw-Header: as is\r\n"
+                           b"Server: Ioflo WSGI Server\r\nDate: ")
+    assert head.endswith(b" GMT\r\n\r\n")
+    assert list(responder.headers.keys()) == ['content-type', 'Content-Length',
+                                              'Server', 'date']
+
+    statics = httping.packStatics(dict(Server="Fast", Via="1.1 hio"))
+    assert statics[1] == ('Via', '1.1 hio', b"Via: 1.1 hio")
+    responder.reset(environ=dict(), persisted=False)
+    responder.statics = statics
+    responder.chunkable = True
+    responder.start('404 Not Found', [('Server', 'App')])
+    head = responder.build()
+    assert head.startswith(b"HTTP/1.1 404 Not Found\r\nServer: App\r\n"
+                           b"Via: 1.1 hio\r\nDate: ")
+    assert head.endswith(b"\r\nConnection: close\r\n"
+                         b"Transfer-Encoding: chunked\r\n\r\n")
+    assert responder.chunked
+    assert responder.headers['via'] == '1.1 hio'
+
+    # malformed headers raise not mistaken for pre-encoded
+    for headers, error in (([('Content-Type', )], ValueError),
+                           ([1], TypeError)):
+        responder.reset(environ=dict())
+        with pytest.raises(error):
+            responder.start('200 OK', headers)
+        assert not responder.started
+
+
+def test_responder_close_iterable():
+    """
+    Test Responder closes app body iterable once response ended or aborted
+    """
+    from hio.core.http import serving
+
+    class Incomer():
+        def __init__(self):
+            self.txes = []
+
+        def tx(self, data):
+            self.txes.append(bytes(data))
+
+    class Body():
+        def __init__(self, parts):
+            self.parts = iter(parts)
+            self.closed = False
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            return next(self.parts)
+
+        def close(self):
+            self.closed = True
+
+    bodies = []
+    def app(environ, start_response):
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        bodies.append(Body([b"ab", b"cd"]))
+        return bodies[-1]
+
+    incomer = Incomer()
+    responder = serving.Responder(incomer=incomer, app=app, environ=dict(),
+                                  chunkable=True)
+    while not responder.ended:
+        responder.service()
+    assert bodies[0].closed  # ended so closed
+    assert responder.iterator is None
+    assert b"".join(incomer.txes).endswith(b"2\r\ncd\r\n0\r\n\r\n")
+
+    responder.reset(environ=dict())
+    responder.service()
+    assert not responder.ended
+    assert not bodies[1].closed
+    responder.close()  # aborted such as by connection closed
+    assert bodies[1].closed
+
+
+def test_wsgi_server_pooled():
+    """
+    Test WSGI Server runs blocking app on worker pool with backlog limit
+    and deadline
+    """
+    import threading
+
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+    gate = threading.Event()
+    seen = dict()
+
+    def wsgiApp(environ, start_response):
+        seen['multithread'] = environ['wsgi.multithread']
+        if environ['PATH_INFO'] == '/slow':
+            gate.wait(5.0)  # blocks worker thread not server
+        body = environ['PATH_INFO'][1:].encode()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(body)))])
+        return [body]
+
+    def send(client, path):
+        client.tx("GET {0} HTTP/1.1\r\nHost: localhost\r\n\r\n".format(path).encode())
+
+    def service(clients, done, count=500):
+        for i in range(count):
+            for client in clients:
+                client.serviceSends()
+            alpha.service()
+            for client in clients:
+                client.serviceReceives()
+            if done():
+                return True
+            time.sleep(0.005)
+        return False
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), workers=2, backlog=0,
+                         deadline=1.0) as alpha:
+        assert alpha.pool.workers == 2 and alpha.pool.backlog == 0
+        clients = [tcp.Client(tymth=tymist.tymen(), ha=("127.0.0.1", 6101))
+                   for i in range(4)]
+        for client in clients:
+            client.reopen()
+        while not all(client.connected and client.ca in alpha.servant.ixes
+                      for client in clients):
+            for client in clients:
+                client.serviceConnect()
+            alpha.serviceConnects()
+            time.sleep(0.01)
+        slow, fast, other, extra = clients
+
+        # fast request is served while slow app blocks its worker
+        send(slow, "/slow")
+        assert service(clients, lambda: alpha.pool.load == 1)
+        send(fast, "/fast")
+        assert service(clients, lambda: fast.rxbs.endswith(b"fast"))
+        assert seen['multithread']
+        assert not slow.rxbs
+
+        # once saturated new requests are refused with 503
+        send(other, "/slow")
+        assert service(clients, lambda: alpha.pool.saturated)
+        send(extra, "/fast")
+        assert service(clients, lambda: extra.ca not in alpha.servant.ixes)
+        assert extra.rxbs.startswith(b"HTTP/1.1 503 Service Unavailable\r\n")
+        assert b"Retry-After: 1\r\n" in extra.rxbs
+
+        gate.set()
+        assert service(clients, lambda: (slow.rxbs.endswith(b"slow") and
+                                          other.rxbs.endswith(b"slow")))
+        assert service(clients, lambda: alpha.pool.load == 0)
+
+        # app past deadline is abandoned with 503 and connection closed
+        gate.clear()
+        del slow.rxbs[:]
+        send(slow, "/slow")
+        assert service(clients, lambda: alpha.pool.load == 1)
+        for i in range(9):
+            tymist.tick()
+            alpha.service()
+        assert service(clients, lambda: slow.ca not in alpha.servant.ixes)
+        assert slow.rxbs.startswith(b"HTTP/1.1 503 Service Unavailable\r\n")
+        assert b"Deadline expired" in slow.rxbs
+        assert alpha.pool.abandoned == 1  # still holds its worker
+        assert alpha.pool.load == 1
+        gate.set()
+        assert service(clients, lambda: alpha.pool.abandoned == 0)
+        assert alpha.pool.load == 0
+
+        for client in clients:
+            client.close()
+
+
+def test_wsgi_server_ringed():
+    """
+    Test WSGI Server service request response with Ring receive buffers
+    """
+    tymist = tyming.Tymist(tyme=0.0)
+
+    def wsgiApp(environ, start_response):
+        body = environ['wsgi.input'].read()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(body)))])
+        return [body]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), ringed=True) as alpha:
+
+        assert alpha.servant.ringed
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=True, \
+                             tymth=tymist.tymen(), rxbs=help.Ring()) as beta:
+
+            assert isinstance(beta.connector.rxbs, help.Ring)
+            body = b"Hello Ring!" * 2000  # spans many receives
+            request = dict([('method', u'PUT'),
+                             ('path', u'/echo'),
+                             ('qargs', dict()),
+                             ('fragment', u''),
+                             ('headers', dict([('Accept', 'text/plain')])),
+                             ('body', body),
+                            ])
+
+            beta.requests.append(request)
+
+            while (beta.requests or beta.connector.txbs or not beta.responses or
+                   not alpha.idle()):
+                alpha.service()
+                time.sleep(0.05)
+                beta.service()
+                time.sleep(0.05)
+
+            requestant = list(alpha.reqs.values())[0]
+            assert isinstance(requestant.msg, help.Ring)
+            assert requestant.method == "PUT"
+
+            assert len(beta.responses) == 1
+            response = beta.responses.popleft()
+            assert response['status'] == 200
+            assert response['body'] == body
+
+
+def test_wsgi_server_reeled():
+    """
+    Test WSGI Server service request response with Reel transmit queues
+    """
+    tymist = tyming.Tymist(tyme=0.0)
+
+    def wsgiApp(environ, start_response):
+        body = environ['wsgi.input'].read()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(body) * 2))])
+        return [body, body]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), reeled=True) as alpha:
+
+        assert alpha.servant.reeled
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=True, \
+                             tymth=tymist.tymen(), txbs=help.Reel()) as beta:
+
+            assert isinstance(beta.connector.txbs, help.Reel)
+            body = b"Hello Reel!" * 2000
+            request = dict([('method', u'PUT'),
+                             ('path', u'/echo'),
+                             ('qargs', dict()),
+                             ('fragment', u''),
+                             ('headers', dict([('Accept', 'text/plain')])),
+                             ('body', body),
+                            ])
+
+            beta.requests.append(request)
+
+            while (beta.requests or beta.connector.txbs or not beta.responses or
+                   not alpha.idle()):
+                alpha.service()
+                time.sleep(0.05)
+                beta.service()
+                time.sleep(0.05)
+
+            ix = list(alpha.servant.ixes.values())[0]
+            assert isinstance(ix.txbs, help.Reel)
+
+            assert len(beta.responses) == 1
+            response = beta.responses.popleft()
+            assert response['status'] == 200
+            assert response['body'] == body * 2
+
+
+def test_wsgi_server_idle_tymeout():
+    """
+    Test WSGI Server without wheel drops idle connection after server tymeout
+    passed to its remoter
+    """
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+
+    def wsgiApp(environ, start_response):
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', '5')])
+        return [b"Hello"]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), tymeout=1.0) as alpha:
+
+        assert alpha.servant.wheel is None
+        assert alpha.servant.tymeout == 1.0
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=False, \
+                             tymth=tymist.tymen()) as beta:
+
+            while not alpha.servant.ixes:  # connect and accept
+                beta.service()
+                alpha.service()
+                time.sleep(0.01)
+
+            ca, ix = list(alpha.servant.ixes.items())[0]
+            assert ix.tymeout == 1.0  # server tymeout not ignored
+
+            while ca in alpha.servant.ixes and tymist.tyme < 3.0:  # idle
+                alpha.service()
+                tymist.tick()
+            assert ca not in alpha.servant.ixes
+            assert 1.0 <= tymist.tyme <= 1.25
+
+
+def test_wsgi_server_wheeled():
+    """
+    Test WSGI Server drops idle connections via shared tymeout Wheel
+    """
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+
+    def wsgiApp(environ, start_response):
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', '5')])
+        return [b"Hello"]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), tymeout=1.0, headtymeout=1.0,
+                         wheeled=True) as alpha:
+
+        assert isinstance(alpha.servant.wheel, tyming.Wheel)
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        with http.openClient(bufsize=131072, path=path, reconnectable=False, \
+                             tymth=tymist.tymen()) as beta:
+
+            while not alpha.servant.ixes:  # connect and accept
+                beta.service()
+                alpha.service()
+                time.sleep(0.01)
+
+            ca, ix = list(alpha.servant.ixes.items())[0]
+            assert ix.tymeout == 1.0
+            assert ix.wheel is alpha.servant.wheel
+            assert ca in alpha.servant.wheel
+
+            tymist.tick()  # partial request head activity refreshes tymeout
+            beta.connector.tx(b"GET / HTTP/1.1\r\nHost: localhost\r\n")
+            for i in range(10):
+                beta.service()
+                alpha.service()
+                time.sleep(0.01)
+            assert not beta.connector.txbs
+            assert not alpha.reqs[ca].headed
+            assert alpha.servant.wheel.remaining(ca) > 0.875
+
+            while ca in alpha.servant.ixes and tymist.tyme < 3.0:  # idle
+                alpha.service()
+                tymist.tick()
+            assert ca not in alpha.servant.ixes
+            assert ca not in alpha.servant.wheel
+            assert 1.125 <= tymist.tyme <= 1.5
+
+
+def test_wsgi_server_readied():
+    """
+    Test polled WSGI Server only services connections that received or have
+    pending work so idle keep-alive connections are not visited
+    """
+    tymist = tyming.Tymist(tyme=0.0, tock=0.125)
+
+    def wsgiApp(environ, start_response):
+        body = environ['PATH_INFO'][1:].encode()
+        start_response('200 OK', [('Content-type','text/plain'),
+                                  ('Content-length', str(len(body)))])
+        return [body]
+
+    with http.openServer(port = 6101, bufsize=131072, app=wsgiApp, \
+                         tymth=tymist.tymen(), polled=True, wheeled=True,
+                         pipelines=2) as alpha:
+        clients = [tcp.Client(tymth=tymist.tymen(), ha=("127.0.0.1", 6101))
+                   for i in range(3)]
+        for client in clients:
+            client.reopen()
+        while not all(client.connected and client.ca in alpha.servant.ixes
+                      for client in clients):
+            for client in clients:
+                client.serviceConnect()
+            alpha.service()
+            time.sleep(0.01)
+        beta, gamma, delta = clients
+        assert len(alpha.reqs) == 3  # new connections made ready
+        alpha.service()
+        assert not alpha.readies and not alpha.actives
+
+        # pipelined requests on beta only
+        beta.tx(b"".join(b"GET /r%d HTTP/1.1\r\nHost: localhost\r\n\r\n" % i
+                         for i in range(5)))
+        beta.serviceSends()
+        time.sleep(0.01)
+        visited = set()
+        for i in range(100):
+            alpha.service()
+            visited |= alpha.readies | alpha.actives
+            beta.serviceReceives()
+            if beta.rxbs.endswith(b"r4"):
+                break
+            time.sleep(0.005)
+        assert beta.rxbs.count(b"HTTP/1.1 200 OK") == 5
+        assert beta.rxbs.endswith(b"r4")
+        assert visited == {beta.ca}
+        assert alpha.reqs[beta.ca].count == 5
+        alpha.service()
+        assert not alpha.actives and not alpha.servant._sendables
+
+        # cutoff closes connection
+        gamma.close()
+        for i in range(100):
+            alpha.service()
+            if gamma.ca not in alpha.servant.ixes:
+                break
+            time.sleep(0.005)
+        assert gamma.ca not in alpha.servant.ixes
+        assert gamma.ca not in alpha.reqs
+        assert delta.ca in alpha.reqs
+
+        for client in clients:
+            client.close()
+
 
 def test_wsgi_server_tls():
     """
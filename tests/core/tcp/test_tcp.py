@@ -12,6 +12,7 @@ import socket
 from collections import deque
 import ssl
 
+from hio import help
 from hio.base import tyming, doing
 from hio.core import tcp
 
@@ -576,6 +577,201 @@ def test_tcp_service():
 
     """Done Test"""
 
+def test_tcp_service_polled():
+    """
+    Test Server polled service of only ready remoters
+    """
+    tymist = tyming.Tymist()
+    with tcp.openServer(tymth=tymist.tymen(),  ha=("", 6101), polled=True) as server, \
+         tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101)) as beta, \
+         tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101)) as gamma:
+
+        assert server.polled == True
+        assert server.poller is not None
+
+        while not (beta.connected and beta.ca in server.ixes and
+                   gamma.connected and gamma.ca in server.ixes):
+            beta.serviceConnect()
+            gamma.serviceConnect()
+            server.serviceConnects()
+            time.sleep(0.05)
+
+        assert len(server.poller.get_map()) == 2
+        ixBeta = server.ixes[beta.ca]
+        ixGamma = server.ixes[gamma.ca]
+
+        # nothing ready
+        assert server.pollReadies() == (set(), set())
+
+        msgOut = b"Beta sends to Server"
+        beta.tx(msgOut)
+        while not ixBeta.rxbs:
+            beta.serviceSends()
+            time.sleep(0.05)
+            server.serviceReceivesAllIx()
+        assert bytes(ixBeta.rxbs) == msgOut
+        assert not ixGamma.rxbs
+        ixBeta.clearRxbs()
+
+        # send big from server to beta so blocks until writable
+        msgOutBig = bytes(range(256)) * (1 << 17)  # 32 MiB bigger than buffers
+
+        ixBeta.tx(msgOutBig)
+        ixGamma.tx(msgOut)
+        server.serviceSendsAllIx()
+        assert beta.ca in server._blocked
+        assert gamma.ca not in server._blocked
+        while len(beta.rxbs) < len(msgOutBig) or len(gamma.rxbs) < len(msgOut):
+            server.serviceSendsAllIx()
+            time.sleep(0.01)
+            beta.serviceReceives()
+            gamma.serviceReceives()
+        assert bytes(beta.rxbs) == msgOutBig
+        assert bytes(gamma.rxbs) == msgOut
+        server.serviceSendsAllIx()
+        assert not server._blocked
+
+        # cutoff of gamma then remove
+        gamma.close()
+        time.sleep(0.05)
+        server.serviceReceivesAllIx()
+        assert ixGamma.cutoff
+        server.removeIx(ixGamma.ca)
+        assert len(server.poller.get_map()) == 1
+
+    assert not server.poller.get_map()
+    assert server.poller.get_map() is None  # closed so fd released
+    assert not server._polls and not server._sendables and not server.readies
+
+    poller = server.poller
+    assert server.reopen()  # new poller once closed
+    assert server.poller is not poller
+    assert server.poller.get_map() == {}
+    with tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101)) as beta:
+        while not (beta.connected and beta.ca in server.ixes):
+            beta.serviceConnect()
+            server.serviceConnects()
+            time.sleep(0.05)
+        assert len(server.poller.get_map()) == 1
+    server.close()
+    assert server.poller.get_map() is None
+    """Done Test"""
+
+
+def test_tcp_accept_limits():
+    """
+    Test Acceptor accepts per pass, max live connections defer or refuse,
+    and accept queue metrics
+    """
+    tymist = tyming.Tymist()
+    with tcp.openServer(tymth=tymist.tymen(),  ha=("", 6101), accepts=1,
+                        maxlive=2) as server, \
+         tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101)) as beta, \
+         tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101)) as gamma, \
+         tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101)) as delta:
+
+        assert server.accepts == 1
+        assert server.maxlive == 2
+        assert not server.refusable
+        assert server.live == 0
+
+        clients = (beta, gamma, delta)
+        while not all(client.connected for client in clients):  # in backlog
+            for client in clients:
+                client.serviceConnect()
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+        server.serviceAccepts()  # only one per pass
+        assert server.admits == 1
+        assert server.depth == 1
+        server.serviceAccepts()
+        assert server.admits == 2
+        assert server.depth == server.peak == 2
+        assert server.live == 2
+        server.serviceAccepts()  # at max live so defer
+        assert server.admits == 2
+        assert server.deferrals == 1
+
+        server.serviceAxes()
+        assert len(server.ixes) == 2
+        assert not server.axes
+        assert server.deferrals == 2
+        assert server.peak == 2
+        assert server.live == 2
+
+        ca = list(server.ixes)[0]
+        server.removeIx(ca)  # below max live so deferred accepted
+        server.serviceAxes()
+        assert len(server.ixes) == 2
+        assert server.admits == 3
+        assert set(server.ixes) == set(client.ca for client in clients
+                                         if client.ca != ca)
+
+        server.refusable = True  # now refuse at max live
+        with tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as eta:
+            while not eta.connected:
+                eta.serviceConnect()
+                time.sleep(0.01)
+            time.sleep(0.05)
+            server.serviceAxes()
+            assert server.refusals == 1
+            assert eta.ca not in server.ixes
+            time.sleep(0.05)
+            eta.serviceReceives()
+            assert eta.cutoff
+
+    """Done Test"""
+
+
+def test_tcp_service_reeled():
+    """
+    Test Server and Client transmit of segments from Reel .txbs
+    """
+    tymist = tyming.Tymist()
+    with tcp.openServer(tymth=tymist.tymen(),  ha=("", 6101), reeled=True) as server, \
+         tcp.openClient(tymth=tymist.tymen(),  ha=("127.0.0.1", 6101),
+                        txbs=help.Reel()) as beta:
+
+        assert server.reeled == True
+        assert isinstance(beta.txbs, help.Reel)
+
+        while not (beta.connected and beta.ca in server.ixes):
+            beta.serviceConnect()
+            server.serviceConnects()
+            time.sleep(0.05)
+
+        ixBeta = server.ixes[beta.ca]
+        assert isinstance(ixBeta.txbs, help.Reel)
+
+        msgOut = b"Beta sends to Server"
+        beta.tx(msgOut[:5])
+        beta.tx(msgOut[5:])
+        assert beta.txbs.segments == 2
+        while len(ixBeta.rxbs) < len(msgOut):
+            beta.serviceSends()
+            time.sleep(0.05)
+            ixBeta.serviceReceives()
+        assert not beta.txbs
+        assert bytes(ixBeta.rxbs) == msgOut
+
+        # big segments so partial sends advance cursor
+        head = b"Head" * 16
+        msgOutBig = bytes(range(256)) * (1 << 15)  # 8 MiB
+        ixBeta.tx(head)
+        ixBeta.tx(msgOutBig)
+        ixBeta.serviceSends()
+        assert ixBeta.txbs  # partial
+        while len(beta.rxbs) < len(head) + len(msgOutBig):
+            ixBeta.serviceSends()
+            time.sleep(0.01)
+            beta.serviceReceives()
+        assert not ixBeta.txbs
+        assert bytes(beta.rxbs) == head + msgOutBig
+
+    """Done Test"""
+
+
 def test_client_auto_reconnect():
     """
     Test client auto reconnect when  .reconnectable
@@ -833,6 +1029,7 @@ def test_tcp_tls_verify_both():
         assert ixBeta.cs.getpeername() == beta.cs.getsockname()
         assert ixBeta.ca == beta.ca
         assert ixBeta.ha == beta.ha
+        assert ixBeta.context is server.context  # shared not rebuilt
 
         msgOut = b"Beta sends to Server\n"
         beta.tx(msgOut)
@@ -1277,6 +1474,211 @@ def test_tcp_tls_verify_both_tlsv12():
     assert server.opened == False
     """Done Test"""
 
+def test_tcp_tls_session_resumption():
+    """
+    Test TCP TLS client reconnects resume cached session
+    """
+    certDirPath = localTestCertDirPath()
+    serverKeyPath = os.path.join(certDirPath, 'server_key.pem')
+    serverCertPath = os.path.join(certDirPath, 'server_cert.pem')
+    clientCaPath = os.path.join(certDirPath, 'client.pem')
+    clientKeyPath = os.path.join(certDirPath, 'client_key.pem')
+    clientCertPath = os.path.join(certDirPath, 'client_cert.pem')
+    serverCaPath = os.path.join(certDirPath, 'server.pem')
+
+    tymist = tyming.Tymist()
+    with tcp.openServer(cls=tcp.ServerTls,
+                    tymth=tymist.tymen(),
+                    ha=("", 6101),
+                    keypath=serverKeyPath,
+                    certpath=serverCertPath,
+                    cafilepath=clientCaPath,
+                    certify=ssl.CERT_REQUIRED,
+                    resumable=True) as server, \
+         tcp.openClient(cls=tcp.ClientTls,
+                    tymth=tymist.tymen(),
+                    ha=("127.0.0.1", 6101),
+                    certedhost='localhost',
+                    keypath=clientKeyPath,
+                    certpath=clientCertPath,
+                    cafilepath=serverCaPath,
+                    certify=ssl.CERT_REQUIRED,
+                    hostify=True,
+                    resumable=True) as beta:
+
+        assert server.resumable
+        assert not server.context.options & ssl.OP_NO_TICKET
+        assert beta.resumable
+        assert beta.sessions == {}
+
+        for i in range(3):
+            while not (beta.connected and beta.ca in server.ixes):
+                beta.serviceConnect()
+                server.serviceConnects()
+                time.sleep(0.01)
+
+            assert beta.cs.session_reused == (i > 0)
+            ixBeta = server.ixes[beta.ca]
+            ixBeta.tx(b"Hello")  # tls 1.3 tickets arrive with data
+            while not beta.rxbs:
+                server.serviceSendsAllIx()
+                time.sleep(0.01)
+                beta.serviceReceives()
+            assert bytes(beta.rxbs) == b"Hello"
+            beta.clearRxbs()
+
+            beta.close()
+            server.removeIx(ixBeta.ca)
+            assert ('127.0.0.1', 6101) in beta.sessions
+            beta.reopen()
+
+        assert beta.handshakes == 3
+        assert beta.resumptions == 2
+        assert server.handshakes == 3
+        assert server.resumptions == 2
+
+        # new client sharing context and sessions resumes too
+        with tcp.openClient(cls=tcp.ClientTls,
+                    tymth=tymist.tymen(),
+                    ha=("127.0.0.1", 6101),
+                    certedhost='localhost',
+                    context=beta.context,
+                    resumable=True,
+                    sessions=beta.sessions) as gamma:
+            while not (gamma.connected and gamma.ca in server.ixes):
+                gamma.serviceConnect()
+                server.serviceConnects()
+                time.sleep(0.01)
+            assert gamma.resumptions == 1
+            assert server.resumptions == 3
+
+    # not resumable server disables tickets so cached session not resumed
+    with tcp.openServer(cls=tcp.ServerTls,
+                    tymth=tymist.tymen(),
+                    ha=("", 6101),
+                    keypath=serverKeyPath,
+                    certpath=serverCertPath,
+                    cafilepath=clientCaPath,
+                    certify=ssl.CERT_REQUIRED,
+                    resumable=False) as server, \
+         tcp.openClient(cls=tcp.ClientTls,
+                    tymth=tymist.tymen(),
+                    ha=("127.0.0.1", 6101),
+                    certedhost='localhost',
+                    keypath=clientKeyPath,
+                    certpath=clientCertPath,
+                    cafilepath=serverCaPath,
+                    certify=ssl.CERT_REQUIRED,
+                    hostify=True,
+                    resumable=True) as beta:
+
+        assert not server.resumable
+        assert server.context.options & ssl.OP_NO_TICKET
+
+        for i in range(2):
+            while not (beta.connected and beta.ca in server.ixes):
+                beta.serviceConnect()
+                server.serviceConnects()
+                time.sleep(0.01)
+
+            assert not beta.cs.session_reused
+            ixBeta = server.ixes[beta.ca]
+            ixBeta.tx(b"Hello")  # tls 1.3 tickets would arrive with data
+            while not beta.rxbs:
+                server.serviceSendsAllIx()
+                time.sleep(0.01)
+                beta.serviceReceives()
+            beta.clearRxbs()
+
+            beta.close()
+            server.removeIx(ixBeta.ca)
+            assert ('127.0.0.1', 6101) in beta.sessions  # cached by client
+            beta.reopen()
+
+        assert server.handshakes == 2
+        assert server.resumptions == 0
+        assert beta.resumptions == 0
+
+        # provided context is shared so its tickets are left as is
+        context = ssl.create_default_context(purpose=ssl.Purpose.CLIENT_AUTH)
+        context.options &= ~ssl.OP_NO_TICKET
+        delta = tcp.ServerTls(ha=("", 6102), context=context, resumable=False)
+        assert delta.context is context
+        assert not context.options & ssl.OP_NO_TICKET
+
+    """Done Test"""
+
+
+def test_tcp_tls_server_handshake_limits():
+    """
+    Test ServerTls handshake tymeout, handshakes per pass, and max pending
+    """
+    certDirPath = localTestCertDirPath()
+    serverKeyPath = os.path.join(certDirPath, 'server_key.pem')
+    serverCertPath = os.path.join(certDirPath, 'server_cert.pem')
+    clientCaPath = os.path.join(certDirPath, 'client.pem')
+
+    tymist = tyming.Tymist(tock=0.125)
+    with tcp.openServer(cls=tcp.ServerTls,
+                    tymth=tymist.tymen(),
+                    ha=("", 6101),
+                    keypath=serverKeyPath,
+                    certpath=serverCertPath,
+                    cafilepath=clientCaPath,
+                    certify=ssl.CERT_REQUIRED,
+                    shaketymeout=0.5,
+                    shakes=1,
+                    maxcxes=2) as server, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as beta, \
+         tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as gamma:
+
+        assert server.shaketymeout == 0.5
+        assert server.shakes == 1
+        assert server.maxcxes == 2
+
+        # plain tcp clients connect but never handshake
+        while not (beta.connected and gamma.connected and len(server.cxes) == 2):
+            beta.serviceConnect()
+            gamma.serviceConnect()
+            server.serviceConnects()
+            time.sleep(0.01)
+
+        # third is refused since .cxes is full
+        with tcp.openClient(tymth=tymist.tymen(), ha=("127.0.0.1", 6101)) as delta:
+            while not delta.connected:
+                delta.serviceConnect()
+                time.sleep(0.01)
+            time.sleep(0.05)
+            server.serviceConnects()
+            assert len(server.cxes) == 2
+            assert delta.ca not in server.cxes
+            time.sleep(0.05)
+            delta.serviceReceives()
+            assert delta.cutoff  # refused so closed
+
+        # one handshake attempt per pass rotates pending to back
+        first, second = list(server.cxes)
+        server.serviceCxes()
+        assert list(server.cxes) == [second, first]
+        server.serviceCxes()
+        assert list(server.cxes) == [first, second]
+
+        # tymed out handshakes are dropped
+        tymist.tick()
+        tymist.tick()
+        tymist.tick()
+        server.serviceCxes()
+        assert len(server.cxes) == 2
+        tymist.tick()  # now expired
+        server.serviceCxes()
+        assert len(server.cxes) == 1
+        server.serviceCxes()
+        assert not server.cxes
+        assert not server.ixes
+
+    """Done Test"""
+
+
 def test_tcp_tls_server_with_client_abort_handshake():
     """
     Test TCP TLS client server connection with verify certs for server not client
@@ -1503,6 +1905,42 @@ def test_echo_server_client_doers():
     assert bytes(ix.rxbs) == b""  # empty server rxbs becaue echoed
     """End Test """
 
+def test_echo_server_client_doers_selecting():
+    """
+    Test EchoServerDoer ClientDoer classes with Doist selector registration
+    """
+    tock = 0.03125
+    ticks = 16
+    limit = ticks *  tock
+    doist = doing.Doist(tock=tock, real=True, limit=limit, selecting=True)
+
+    port = 6120
+    server = tcp.Server(host="", port=port, selector=doist.selector)
+    client = tcp.Client(tymth=doist.tymen(), host="localhost", port=port,
+                        selector=doist.selector)
+
+    server.reopen()
+    assert doist.selector.get_key(server.ss).data is server
+    server.close()
+    assert not doist.selector.get_map()
+
+    serdoer = tcp.EchoServerDoer(tymth=doist.tymen(), server=server)
+    clidoer = tcp.ClientDoer(tymth=doist.tymen(), client=client)
+
+    msgTx = b"Hello me maties!"
+    clidoer.client.tx(msgTx)
+
+    doist.do(doers=[serdoer, clidoer])
+    assert doist.tyme == limit
+    assert server.opened == False
+    assert client.opened == False
+    assert not doist.selector.get_map()  # all unregistered on close
+
+    assert not client.txbs
+    msgEx = bytes(client.rxbs)  # echoed back message
+    assert msgEx == msgTx
+    """End Test """
+
 
 if __name__ == "__main__":
     test_tcp_tls_server_with_client_abort_handshake()
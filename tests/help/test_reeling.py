@@ -0,0 +1,105 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.help.test_reeling module
+
+"""
+import pytest
+
+import socket
+
+from hio.help import Reel
+
+
+def test_reel():
+    """
+    Test Reel class
+    """
+    reel = Reel()
+    assert len(reel) == 0
+    assert not reel
+    assert reel == b""
+    assert bytes(reel) == b""
+    assert reel.segments == 0
+    assert reel.buffers() == []
+    assert reel.peek() == b""
+
+    head = b"HTTP/1.1 200 OK\r\n\r\n"
+    body = b"Hello World!"
+    reel.extend(head)
+    reel.extend(body)
+    reel.extend(b"")  # empty ignored
+    assert reel.segments == 2
+    assert len(reel) == len(head) + len(body)
+    assert reel
+    assert reel == head + body
+    assert reel == bytearray(head + body)
+    bufs = reel.buffers()
+    assert bufs[1] is body  # not copied
+    assert reel[:4] == b"HTTP"
+    assert reel[:len(head) + 5] == head + b"Hello"
+    assert reel[-1] == ord("!")
+    assert reel[2:6] == b"TP/1"
+
+    # mutable data is copied
+    data = bytearray(b"abc")
+    reel.extend(data)
+    data[0] = ord("z")
+    assert reel.segments == 3
+    assert bytes(reel).endswith(b"abc")
+
+    # read only memoryview is kept
+    view = memoryview(b"xyz")
+    reel += view
+    assert reel.segments == 4
+    assert reel.buffers()[3] is not view
+    assert reel.buffers()[3] == b"xyz"
+
+    # partial consume within first segment only moves cursor
+    del reel[:5]
+    assert reel.segments == 4
+    assert reel.peek() == head[5:]
+    assert reel == head[5:] + body + b"abcxyz"
+
+    # consume across segments pops fully sent segments
+    reel.consume(len(head) - 5 + 6)
+    assert reel.segments == 3
+    assert reel.peek() == b"World!"
+    assert reel == b"World!abcxyz"
+    assert reel.buffers(limit=2) == [b"World!", b"abc"]
+    assert list(reel) == list(b"World!abcxyz")
+
+    del reel[1]  # not leading slice so rebuilds
+    assert reel == b"Wrld!abcxyz"
+
+    reel.consume(100)  # consume at most all
+    assert not reel
+    assert reel.segments == 0
+    assert reel.peek() == b""
+
+    reel = Reel(b"abc")
+    reel.extend(Reel(b"def"))
+    assert reel == b"abcdef"
+    reel.clear()
+    assert not reel
+    assert repr(Reel(b"ab")) == "Reel(b'ab')"
+
+    # gather send with sendmsg
+    if hasattr(socket.socket, "sendmsg"):
+        a, b = socket.socketpair()
+        try:
+            reel = Reel()
+            reel.extend(head)
+            reel.extend(body)
+            count = a.sendmsg(reel.buffers())
+            assert count == len(head) + len(body)
+            del reel[:count]
+            assert not reel
+            assert b.recv(1024) == head + body
+        finally:
+            a.close()
+            b.close()
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_reel()
@@ -0,0 +1,116 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.help.test_ringing module
+
+"""
+import pytest
+
+import io
+import socket
+
+from hio.help import Ring
+from hio.core.http import httping
+
+def test_ring():
+    """
+    Test Ring class
+    """
+    ring = Ring(size=16)
+    assert ring.capacity == 16
+    assert len(ring) == 0
+    assert not ring
+    assert ring == b""
+    assert bytes(ring) == b""
+
+    ring.extend(b"Hello\r\nWorld\r\n")
+    assert len(ring) == 14
+    assert ring
+    assert ring == b"Hello\r\nWorld\r\n"
+    assert ring.find(b"\r\n") == 5
+    assert ring.find(b"\r\n", 6) == 12
+    assert ring.find(b"Nope") == -1
+    assert b"World" in ring
+    assert ring.startswith(b"Hello")
+    assert ring[0] == ord("H")
+    assert ring[-1] == ord("\n")
+    assert ring[:5] == bytearray(b"Hello")
+    assert isinstance(ring[:5], bytearray)
+    assert ring[0:0] == b""
+
+    del ring[:7]  # advance head no memory move
+    assert ring == b"World\r\n"
+    assert ring._head == 7
+    assert ring.find(b"\r\n") == 5
+    assert ring[:5] == b"World"
+    assert ring.decode() == "World\r\n"
+    assert repr(ring) == "Ring(b'World\\r\\n')"
+
+    # fill needs more than free space so compacts or grows
+    reader = io.BytesIO(b"0123456789")
+    data = ring.fill(reader.readinto, 10)
+    assert data == b"0123456789"
+    assert ring == b"World\r\n0123456789"
+    assert ring.capacity == 32  # grew since would be more than half full
+    assert ring._head == 0
+
+    with ring.view() as view:
+        assert view == b"World\r\n0123456789"
+    ring.consume(7)
+    assert ring == b"0123456789"
+    ring.consume(100)  # consume all resets cursors
+    assert not ring
+    assert ring._head == ring._tail == 0
+
+    ring.extend(b"abcdefghij" * 3)
+    del ring[:24]
+    assert ring == b"efghij"
+    assert ring._head == 24
+    ring.extend(b"0123456789")  # compacts since at most half full after
+    assert ring.capacity == 32
+    assert ring._head == 0
+    assert ring == b"efghij0123456789"
+
+    del ring[1]  # general delete
+    assert ring == b"eghij0123456789"
+    assert ring[::2] == b"ehj13579"
+    ring += b"CD"
+    assert ring == b"eghij0123456789CD"
+    ring.clear()
+    assert not ring
+
+    ring = Ring(b"xyz")
+    assert ring.capacity == Ring.Size
+    assert list(ring) == [ord("x"), ord("y"), ord("z")]
+    assert ring == Ring(b"xyz")
+    with pytest.raises(IndexError):
+        ring[3]
+
+    # empty read
+    data = ring.fill(io.BytesIO(b"").readinto, 10)
+    assert not data
+    assert ring == b"xyz"
+
+    # socket recv_into
+    rs, ws = socket.socketpair()
+    ws.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    ring = Ring()
+    data = ring.fill(rs.recv_into, 4096)
+    assert bytes(data) == b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+    rs.close()
+    ws.close()
+
+    # http parsers work on ring like bytearray
+    lineParser = httping.parseLine(raw=ring, eols=(b"\r\n", b"\n"), kind="status line")
+    line = next(lineParser)
+    assert line == b"GET / HTTP/1.1"
+    lineParser.close()
+    leaderParser = httping.parseLeader(raw=ring, eols=(b"\r\n", b"\n"))
+    headers = next(leaderParser)
+    leaderParser.close()
+    assert headers["host"] == "localhost"
+    assert not ring
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_ring()